@@ -0,0 +1,121 @@
+"""
+Check that pet statuses agree with their adoption applications.
+
+Pets are scanned in primary-key batches. A pet with a completed application
+must be adopted, may have only one completed application and should have no
+pending applications left. With --repair the fixable mismatches are
+corrected through the service layer; pets with several completed
+applications always need a person to decide.
+"""
+
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, Q
+
+from apps.adoptions.models import AdoptionApplication
+from apps.adoptions.services import AdoptionApplicationService
+from apps.pets.models import Pet
+
+# Pet IDs printed in the summary error; use -v 2 for the full list
+MAX_LISTED = 20
+
+class Command(BaseCommand):
+    help = 'Report or repair pets whose status disagrees with their adoption applications'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Pets checked per batch')
+        parser.add_argument('--repair', action='store_true', help='Fix the mismatches that can be fixed automatically')
+
+    def handle(self, *args, **options):
+        totals = Counter()
+        repaired = Counter()
+        manual = []
+        last_pk = 0
+
+        while True:
+            pets = list(
+                Pet.objects.filter(pk__gt=last_pk)
+                .order_by('pk')
+                .values_list('pk', 'name', 'status')[:options['batch_size']]
+            )
+            if not pets:
+                break
+            last_pk = pets[-1][0]
+
+            issues = self._check_batch(pets)
+            totals.update({kind: len(ids) for kind, ids in issues.items()})
+            manual.extend(sorted(issues['multiple_completed']))
+
+            fixable = issues['not_adopted'] | issues['pending_after_adoption']
+            if options['repair'] and fixable:
+                repaired.update(AdoptionApplicationService.sync_adopted_pets(pet_ids=fixable))
+
+            if options['verbosity'] > 1:
+                names = {pk: name for pk, name, _ in pets}
+                for kind, ids in issues.items():
+                    for pk in sorted(ids):
+                        self.stdout.write(f'  {kind}: pet {pk} ({names[pk]})')
+
+        self.stdout.write(
+            f"Pets with a completed application but not adopted: {totals['not_adopted']}\n"
+            f"Adopted pets with pending applications: {totals['pending_after_adoption']}\n"
+            f"Pets with more than one completed application: {totals['multiple_completed']}\n"
+            f"Adopted pets without a completed application: {totals['adopted_without_application']}"
+        )
+
+        if options['repair']:
+            self.stdout.write(
+                f"Repaired: {repaired['pets_updated']} pet(s) marked adopted, "
+                f"{repaired['auto_rejected']} pending application(s) rejected"
+            )
+        elif totals['not_adopted'] or totals['pending_after_adoption']:
+            raise CommandError('Mismatches found; run again with --repair to fix them')
+
+        if manual:
+            listed = ', '.join(map(str, manual[:MAX_LISTED]))
+            if len(manual) > MAX_LISTED:
+                listed += f' and {len(manual) - MAX_LISTED} more'
+            raise CommandError(f'Pets with several completed applications need review: {listed}')
+
+        self.stdout.write(self.style.SUCCESS('Adoption data is consistent.'))
+
+    def _check_batch(self, pets) -> dict:
+        """
+        Find mismatches for one batch of pets with a single grouped query.
+
+        Args:
+            pets: List of (pk, name, status) tuples
+
+        Returns:
+            Dict mapping issue kind to a set of pet IDs
+        """
+        counts = {
+            row['pet_id']: row
+            for row in AdoptionApplication.objects
+            .filter(pet_id__in=[pk for pk, _, _ in pets], status__in=['completed', 'pending'])
+            .values('pet_id')
+            .annotate(
+                completed=Count('pk', filter=Q(status='completed')),
+                pending=Count('pk', filter=Q(status='pending')),
+            )
+            .order_by()
+        }
+
+        issues = {
+            'not_adopted': set(),
+            'pending_after_adoption': set(),
+            'multiple_completed': set(),
+            'adopted_without_application': set(),
+        }
+        for pk, _, status in pets:
+            row = counts.get(pk, {'completed': 0, 'pending': 0})
+            if row['completed'] > 1:
+                issues['multiple_completed'].add(pk)
+            if row['completed'] and status != 'adopted':
+                issues['not_adopted'].add(pk)
+            if row['completed'] and row['pending']:
+                issues['pending_after_adoption'].add(pk)
+            if not row['completed'] and status == 'adopted':
+                issues['adopted_without_application'].add(pk)
+        return issues
\ No newline at end of file
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('pets', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdoptionApplication',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('first_name', models.CharField(max_length=100)),
+                ('last_name', models.CharField(max_length=100)),
+                ('email', models.EmailField(max_length=254)),
+                ('phone', models.CharField(max_length=20)),
+                ('address', models.TextField()),
+                ('housing_type', models.CharField(max_length=50)),
+                ('own_or_rent', models.CharField(max_length=20)),
+                ('landlord_approval', models.BooleanField(default=False)),
+                ('household_adults', models.IntegerField()),
+                ('household_children', models.IntegerField(default=0)),
+                ('has_other_pets', models.BooleanField(default=False)),
+                ('other_pets_description', models.TextField(blank=True)),
+                ('previous_pet_experience', models.TextField()),
+                ('reason_for_adoption', models.TextField()),
+                ('status', models.CharField(choices=[('pending', 'Pending Review'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('completed', 'Adoption Completed')], default='pending', max_length=20)),
+                ('submitted_at', models.DateTimeField(auto_now_add=True)),
+                ('reviewed_at', models.DateTimeField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('pet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='pets.pet')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='applications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Adoption Application',
+                'verbose_name_plural': 'Adoption Applications',
+                'ordering': ['-submitted_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoptions', '0001_initial'),
+        ('pets', '0003_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='adoptionapplication',
+            index=models.Index(fields=['submitted_at', 'id'], name='adoptions_app_submitted'),
+        ),
+        migrations.AddIndex(
+            model_name='adoptionapplication',
+            index=models.Index(fields=['status', 'submitted_at', 'id'], name='adoptions_app_status_submitted'),
+        ),
+        migrations.AddIndex(
+            model_name='adoptionapplication',
+            index=models.Index(fields=['pet', 'status'], name='adoptions_app_pet_status'),
+        ),
+        migrations.AddIndex(
+            model_name='adoptionapplication',
+            index=models.Index(fields=['email'], name='adoptions_app_email'),
+        ),
+    ]
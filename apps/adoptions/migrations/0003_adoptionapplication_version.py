@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoptions', '0002_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adoptionapplication',
+            name='version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -17,6 +17,14 @@ class AdoptionApplication(TimeStampedModel):
         ('completed', 'Adoption Completed'),
     ]
     
+    # Status changes the service layer allows, keyed by current status
+    STATUS_TRANSITIONS = {
+        'pending': {'approved', 'rejected', 'completed'},
+        'approved': {'pending', 'rejected', 'completed'},
+        'rejected': {'pending', 'approved'},
+        'completed': {'approved', 'rejected'},
+    }
+    
     # User Link (optional - for logged-in users)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -61,10 +69,23 @@ class AdoptionApplication(TimeStampedModel):
     reviewed_at = models.DateTimeField(null=True, blank=True)
     notes = models.TextField(blank=True)
     
+    # Bumped on every status change so stale writes can be detected
+    version = models.PositiveIntegerField(default=0, editable=False)
+    
     class Meta:
         ordering = ['-submitted_at']
+        indexes = [
+            models.Index(fields=['submitted_at', 'id'], name='adoptions_app_submitted'),
+            models.Index(fields=['status', 'submitted_at', 'id'], name='adoptions_app_status_submitted'),
+            models.Index(fields=['pet', 'status'], name='adoptions_app_pet_status'),
+            models.Index(fields=['email'], name='adoptions_app_email'),
+        ]
         verbose_name = 'Adoption Application'
         verbose_name_plural = 'Adoption Applications'
     
     def __str__(self):
-        return f"{self.first_name} {self.last_name} - {self.pet.name}"
\ No newline at end of file
+        return f"{self.first_name} {self.last_name} - {self.pet.name}"
+    
+    def can_transition_to(self, status: str) -> bool:
+        """Check whether the application may move to the given status."""
+        return status in self.STATUS_TRANSITIONS.get(self.status, ())
\ No newline at end of file
@@ -4,9 +4,17 @@ Contains query logic for adoption applications (read operations only).
 """
 
 from django.db.models import Q, QuerySet
+from apps.core.stats import StatusBreakdown
 from .models import AdoptionApplication
 
 
+APPLICATION_STATUS_BREAKDOWN = StatusBreakdown(
+    scope='adoptions.status',
+    model=AdoptionApplication,
+    conditions={status: Q(status=status) for status, _ in AdoptionApplication.STATUS_CHOICES}
+)
+
+
 def get_user_applications(*, user) -> QuerySet:
     """
     Get all applications for a user (by user or email).
@@ -85,4 +93,14 @@ def filter_applications(*, filters=None) -> QuerySet:
                 Q(pet__breed__icontains=search)
             )
     
-    return queryset
\ No newline at end of file
+    return queryset
+
+
+def get_application_status_counts() -> dict:
+    """
+    Get the number of applications in each status.
+    
+    Returns:
+        Dict mapping status to count
+    """
+    return APPLICATION_STATUS_BREAKDOWN.get()
\ No newline at end of file
@@ -3,8 +3,22 @@ Adoptions app services.
 Contains business logic for adoption operations (write operations).
 """
 
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 from .models import AdoptionApplication
+from .selectors import APPLICATION_STATUS_BREAKDOWN
+from .tasks import notify_new_application
+
+
+class ApplicationTransitionError(Exception):
+    """Raised when an application cannot move to the requested status."""
+
+
+class StaleApplicationError(ApplicationTransitionError):
+    """Raised when an application was changed by someone else in the meantime."""
 
 
 class AdoptionApplicationService:
@@ -48,56 +62,256 @@ class AdoptionApplicationService:
         Returns:
             Created AdoptionApplication instance
         """
-        application = AdoptionApplication.objects.create(
-            user=user,
-            pet=pet,
-            first_name=first_name,
-            last_name=last_name,
-            email=email,
-            phone=phone,
-            address=address,
-            housing_type=housing_type,
-            own_or_rent=own_or_rent,
-            household_adults=household_adults,
-            previous_pet_experience=previous_pet_experience,
-            reason_for_adoption=reason_for_adoption,
-            **kwargs
-        )
+        with transaction.atomic():
+            application = AdoptionApplication.objects.create(
+                user=user,
+                pet=pet,
+                first_name=first_name,
+                last_name=last_name,
+                email=email,
+                phone=phone,
+                address=address,
+                housing_type=housing_type,
+                own_or_rent=own_or_rent,
+                household_adults=household_adults,
+                previous_pet_experience=previous_pet_experience,
+                reason_for_adoption=reason_for_adoption,
+                **kwargs
+            )
+            APPLICATION_STATUS_BREAKDOWN.shift(new=application.status)
+            notify_new_application.enqueue(application_id=application.pk)
         
         return application
     
     @staticmethod
+    @transaction.atomic
     def update_application_status(
         *,
         application: AdoptionApplication,
-        status: str
+        status: str,
+        version: int = None
     ) -> AdoptionApplication:
         """
-        Update application status.
+        Move an application to a new status.
+        
+        The pet row is locked with SELECT ... FOR UPDATE on backends that
+        support it, so transitions for the same pet run one at a time. The
+        application itself is written with a compare-and-set on its version,
+        which also catches changes made since the caller loaded it (and is
+        the only guard on SQLite, where row locks are not available).
+        
+        Completing an application marks the pet adopted and rejects its
+        other pending applications; undoing a completion makes the pet
+        available again.
         
         Args:
             application: AdoptionApplication instance
             status: New status
+            version: Version the caller last saw (defaults to application.version)
         
         Returns:
             Updated AdoptionApplication instance
+        
+        Raises:
+            ApplicationTransitionError: If the transition is not allowed or the
+                pet was already adopted through another application
+            StaleApplicationError: If the application changed in the meantime
         """
+        from apps.pets.models import Pet
+        from apps.pets.services import PetService
+        
+        if version is None:
+            version = application.version
         old_status = application.status
+        if status == old_status:
+            return application
+        if not application.can_transition_to(status):
+            raise ApplicationTransitionError(
+                f'A {application.get_status_display().lower()} application cannot be moved to {status}'
+            )
+        
+        pet = Pet.objects.select_for_update().get(pk=application.pet_id)
+        
+        now = timezone.now()
+        updated = AdoptionApplication.objects.filter(
+            pk=application.pk,
+            status=old_status,
+            version=version
+        ).update(status=status, reviewed_at=now, updated_at=now, version=F('version') + 1)
+        if not updated:
+            raise StaleApplicationError('The application was changed by someone else; reload and try again')
+        
         application.status = status
-        application.reviewed_at = timezone.now()
-        application.save()
+        application.reviewed_at = now
+        application.updated_at = now
+        application.version = version + 1
+        application.pet = pet
+        APPLICATION_STATUS_BREAKDOWN.shift(old=old_status, new=status)
         
-        # Update pet status if application is completed
         if status == 'completed':
-            from apps.pets.services import PetService
-            PetService.mark_pet_adopted(pet=application.pet)
-        elif old_status == 'completed' and status != 'completed':
+            already_adopted = AdoptionApplication.objects.filter(
+                pet_id=pet.pk,
+                status='completed'
+            ).exclude(pk=application.pk).exists()
+            if already_adopted:
+                raise ApplicationTransitionError(f'{pet.name} has already been adopted through another application')
+            
+            PetService.mark_pet_adopted(pet=pet)
+            AdoptionApplicationService._reject_other_pending(
+                pet_ids=[pet.pk],
+                exclude_ids=[application.pk],
+                reviewed_at=now
+            )
+        elif old_status == 'completed':
             # If changing from completed to something else, make pet available again
-            from apps.pets.services import PetService
-            PetService.mark_pet_available(pet=application.pet)
+            PetService.mark_pet_available(pet=pet)
         
         return application
     
+    @staticmethod
+    @transaction.atomic
+    def bulk_update_status(*, application_ids, status: str) -> dict:
+        """
+        Update the status of many applications in one transaction.
+        
+        Uses a fixed number of queries however many applications are
+        selected. Applications that cannot make the transition are skipped,
+        as are completions for pets that already have a completed
+        application; only one application per pet is completed. Pets of
+        completed applications are marked adopted and their other pending
+        applications rejected; pets whose completed application is moved
+        back are made available again.
+        
+        Args:
+            application_ids: Iterable of application IDs
+            status: New status
+        
+        Returns:
+            Dict with 'updated', 'skipped', 'auto_rejected' and 'pets_updated'
+            counts; selected applications rejected because another one for
+            their pet was completed count as auto_rejected, not skipped
+        """
+        from apps.pets.models import Pet
+        from apps.pets.services import PetService
+        
+        rows = list(
+            AdoptionApplication.objects
+            .filter(pk__in=application_ids)
+            .exclude(status=status)
+            .order_by('pk')
+            .values_list('pk', 'status', 'pet_id')
+        )
+        allowed = [row for row in rows if status in AdoptionApplication.STATUS_TRANSITIONS[row[1]]]
+        
+        # Lock pets in a fixed order before touching their applications
+        pet_ids = sorted({pet_id for _, _, pet_id in allowed})
+        list(Pet.objects.select_for_update().filter(pk__in=pet_ids).order_by('pk').values_list('pk'))
+        
+        if status == 'completed':
+            adopted = set(
+                AdoptionApplication.objects
+                .filter(pet_id__in=pet_ids, status='completed')
+                .values_list('pet_id', flat=True)
+            )
+            chosen = {}
+            for row in allowed:
+                if row[2] not in adopted:
+                    chosen.setdefault(row[2], row)
+            allowed = list(chosen.values())
+        
+        now = timezone.now()
+        counts = Counter()
+        by_status = {}
+        for pk, old_status, _ in allowed:
+            by_status.setdefault(old_status, []).append(pk)
+        for old_status, ids in by_status.items():
+            # Rows that changed status since they were read are left alone
+            changed = AdoptionApplication.objects.filter(pk__in=ids, status=old_status).update(
+                status=status,
+                reviewed_at=now,
+                updated_at=now,
+                version=F('version') + 1
+            )
+            counts[old_status] -= changed
+            counts[status] += changed
+        APPLICATION_STATUS_BREAKDOWN.add(counts)
+        
+        auto_rejected = 0
+        selected_rejected = 0
+        pets_updated = 0
+        if status == 'completed':
+            pet_ids = [pet_id for _, _, pet_id in allowed]
+            pets_updated = PetService.bulk_update_status(pet_ids=pet_ids, status='adopted')
+            auto_rejected = AdoptionApplicationService._reject_other_pending(
+                pet_ids=pet_ids,
+                exclude_ids=[pk for pk, _, _ in allowed],
+                reviewed_at=now
+            )
+            # Selected applications rejected above are reported as auto-rejected, not skipped
+            selected_rejected = AdoptionApplication.objects.filter(
+                pk__in=[pk for pk, _, _ in rows],
+                status='rejected',
+                reviewed_at=now
+            ).count()
+        elif undone := [pet_id for _, old_status, pet_id in allowed if old_status == 'completed']:
+            pets_updated = PetService.bulk_update_status(pet_ids=undone, status='available')
+        
+        return {
+            'updated': counts[status],
+            'skipped': len(rows) - counts[status] - selected_rejected,
+            'auto_rejected': auto_rejected,
+            'pets_updated': pets_updated,
+        }
+    
+    @staticmethod
+    @transaction.atomic
+    def sync_adopted_pets(*, pet_ids) -> dict:
+        """
+        Repair pets whose status disagrees with their completed application.
+        
+        Pets with a completed application are marked adopted and their
+        remaining pending applications rejected.
+        
+        Args:
+            pet_ids: Iterable of pet IDs to repair
+        
+        Returns:
+            Dict with 'pets_updated' and 'auto_rejected' counts
+        """
+        from apps.pets.services import PetService
+        
+        adopted = list(
+            AdoptionApplication.objects
+            .filter(pet_id__in=pet_ids, status='completed')
+            .values_list('pet_id', flat=True)
+            .distinct()
+        )
+        return {
+            'pets_updated': PetService.bulk_update_status(pet_ids=adopted, status='adopted'),
+            'auto_rejected': AdoptionApplicationService._reject_other_pending(
+                pet_ids=adopted,
+                exclude_ids=[],
+                reviewed_at=timezone.now()
+            ),
+        }
+    
+    @staticmethod
+    def _reject_other_pending(*, pet_ids, exclude_ids, reviewed_at) -> int:
+        """Reject the remaining pending applications for adopted pets with one UPDATE."""
+        rejected = (
+            AdoptionApplication.objects
+            .filter(pet_id__in=pet_ids, status='pending')
+            .exclude(pk__in=exclude_ids)
+            .update(
+                status='rejected',
+                reviewed_at=reviewed_at,
+                updated_at=reviewed_at,
+                version=F('version') + 1
+            )
+        )
+        APPLICATION_STATUS_BREAKDOWN.add({'pending': -rejected, 'rejected': rejected})
+        return rejected
+    
     @staticmethod
     def update_application_notes(
         *,
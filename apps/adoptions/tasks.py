@@ -0,0 +1,32 @@
+"""
+Adoptions app tasks.
+Background work run by the task worker.
+"""
+
+from django.core.mail import mail_managers
+
+from apps.tasks.registry import task
+from .models import AdoptionApplication
+
+
+@task('adoptions.notify_new_application')
+def notify_new_application(*, application_id: int) -> None:
+    """
+    Tell the shelter managers about a new adoption application.
+    
+    Args:
+        application_id: Application ID
+    """
+    application = AdoptionApplication.objects.select_related('pet').filter(pk=application_id).first()
+    if application is None:
+        return
+    
+    mail_managers(
+        subject=f'New adoption application for {application.pet.name}',
+        message=(
+            f'{application.first_name} {application.last_name} <{application.email}> '
+            f'applied to adopt {application.pet.name}.\n\n'
+            f'{application.reason_for_adoption}'
+        ),
+        fail_silently=False
+    )
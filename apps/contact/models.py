@@ -21,6 +21,15 @@ class ContactMessage(TimeStampedModel):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='contact_msg_created'),
+            # Booleans compile to a bare column test, so unread gets a partial index
+            models.Index(
+                fields=['created_at', 'id'],
+                name='contact_msg_unread_created',
+                condition=models.Q(is_read=False)
+            ),
+        ]
         verbose_name = 'Contact Message'
         verbose_name_plural = 'Contact Messages'
     
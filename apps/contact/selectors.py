@@ -4,9 +4,20 @@ Contains query logic for contact messages (read operations only).
 """
 
 from django.db.models import Q, QuerySet
+from apps.core.stats import StatusBreakdown
 from .models import ContactMessage
 
 
+CONTACT_READ_BREAKDOWN = StatusBreakdown(
+    scope='contact.read',
+    model=ContactMessage,
+    conditions={
+        'read': Q(is_read=True),
+        'unread': Q(is_read=False),
+    }
+)
+
+
 def get_contact_message_by_id(*, message_id: int) -> ContactMessage:
     """
     Get a contact message by ID.
@@ -71,4 +82,14 @@ def filter_contact_messages(*, filters=None) -> QuerySet:
                 Q(subject__icontains=search)
             )
     
-    return queryset
\ No newline at end of file
+    return queryset
+
+
+def get_contact_message_counts() -> dict:
+    """
+    Get the number of read and unread contact messages.
+    
+    Returns:
+        Dict with 'read' and 'unread' counts
+    """
+    return CONTACT_READ_BREAKDOWN.get()
\ No newline at end of file
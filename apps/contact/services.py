@@ -3,7 +3,14 @@ Contact app services.
 Contains business logic for contact operations (write operations).
 """
 
+from django.db import transaction
 from .models import ContactMessage
+from .selectors import CONTACT_READ_BREAKDOWN
+from .tasks import notify_new_message
+
+
+def _read_key(is_read: bool) -> str:
+    return 'read' if is_read else 'unread'
 
 
 class ContactMessageService:
@@ -31,13 +38,16 @@ class ContactMessageService:
         Returns:
             Created ContactMessage instance
         """
-        contact_message = ContactMessage.objects.create(
-            name=name,
-            email=email,
-            phone=phone,
-            subject=subject,
-            message=message
-        )
+        with transaction.atomic():
+            contact_message = ContactMessage.objects.create(
+                name=name,
+                email=email,
+                phone=phone,
+                subject=subject,
+                message=message
+            )
+            CONTACT_READ_BREAKDOWN.shift(new=_read_key(contact_message.is_read))
+            notify_new_message.enqueue(message_id=contact_message.pk)
         
         return contact_message
     
@@ -52,8 +62,12 @@ class ContactMessageService:
         Returns:
             Updated ContactMessage instance
         """
+        was_read = message.is_read
         message.is_read = True
-        message.save()
+        
+        with transaction.atomic():
+            message.save()
+            CONTACT_READ_BREAKDOWN.shift(old=_read_key(was_read), new=_read_key(True))
         return message
     
     @staticmethod
@@ -89,11 +103,17 @@ class ContactMessageService:
         Returns:
             Updated ContactMessage instance
         """
+        was_read = message.is_read
         if is_read is not None:
             message.is_read = is_read
         
         if is_responded is not None:
             message.is_responded = is_responded
         
-        message.save()
+        with transaction.atomic():
+            message.save()
+            CONTACT_READ_BREAKDOWN.shift(
+                old=_read_key(was_read),
+                new=_read_key(message.is_read)
+            )
         return message
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Contact app tasks.
+Background work run by the task worker.
+"""
+
+from django.core.mail import mail_managers
+
+from apps.tasks.registry import task
+from .models import ContactMessage
+
+
+@task('contact.notify_new_message')
+def notify_new_message(*, message_id: int) -> None:
+    """
+    Forward a new contact message to the shelter managers.
+    
+    Args:
+        message_id: Message ID
+    """
+    message = ContactMessage.objects.filter(pk=message_id).first()
+    if message is None:
+        return
+    
+    mail_managers(
+        subject=f'Contact form: {message.subject}',
+        message=f'From {message.name} <{message.email}> {message.phone}\n\n{message.message}',
+        fail_silently=False
+    )
@@ -0,0 +1,83 @@
+"""
+Core bench module.
+Shared helpers for the seed_bench and run_bench management commands.
+"""
+
+import math
+
+# Seeded rows are tagged so they can be found and removed again
+BENCH_PREFIX = 'bench'
+BENCH_EMAIL_DOMAIN = 'bench.example.com'
+BENCH_USERNAME = f'{BENCH_PREFIX}-admin'
+
+
+def percentile(values, pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of numbers.
+
+    Args:
+        values: Numbers to rank
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Value at the percentile, or 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(*, latencies: list, queries: list, errors: int, elapsed: float) -> dict:
+    """
+    Summarize the samples collected for one scenario.
+
+    Args:
+        latencies: Response times in milliseconds
+        queries: SQL queries per request (may be empty if unknown)
+        errors: Number of non-2xx/3xx responses
+        elapsed: Wall-clock seconds spent on the measured requests
+
+    Returns:
+        Dict of latency percentiles, query counts and throughput
+    """
+    count = len(latencies)
+    return {
+        'requests': count,
+        'errors': errors,
+        'mean_ms': round(sum(latencies) / count, 2) if count else 0.0,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'queries_mean': round(sum(queries) / len(queries), 2) if queries else None,
+        'queries_max': max(queries) if queries else None,
+        'throughput_rps': round(count / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def compare(baseline: dict, current: dict, *, metrics=('p50_ms', 'p95_ms', 'queries_mean', 'throughput_rps')) -> list:
+    """
+    Compare two benchmark reports scenario by scenario.
+
+    Args:
+        baseline: Report loaded from an earlier run
+        current: Report from this run
+        metrics: Summary keys to compare
+
+    Returns:
+        List of (scenario, metric, before, after, change_pct) tuples for
+        scenarios present in both reports
+    """
+    rows = []
+    for name, after in current['scenarios'].items():
+        before = baseline.get('scenarios', {}).get(name)
+        if before is None:
+            continue
+        for metric in metrics:
+            old, new = before.get(metric), after.get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old * 100 if old else 0.0
+            rows.append((name, metric, old, new, round(change, 1)))
+    return rows
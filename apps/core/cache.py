@@ -0,0 +1,105 @@
+"""
+Core cache module.
+Contains cache helpers shared across apps.
+"""
+
+import time
+
+from django.core.cache import caches
+
+
+def _generation_key(key) -> str:
+    return f'{key}:generation'
+
+
+def get_or_build(key, builder, *, timeout, alias='default', lock_timeout=10, poll_interval=0.05):
+    """
+    Get a cached value, rebuilding it at most once on a miss.
+
+    The first caller to miss takes a short-lived lock with cache.add() and
+    runs the builder. Concurrent callers serve the last known value while
+    the rebuild runs, or wait for it if there is none yet.
+
+    Values are stored with the key's generation from before the build
+    started, and only a value of the current generation counts as a hit.
+    A build that read the database before a write committed can finish
+    after invalidate() ran; its result is then discarded, not served
+    until the timeout.
+
+    Args:
+        key: Cache key
+        builder: Callable returning the value to cache
+        timeout: Cache timeout in seconds
+        alias: Cache alias from settings.CACHES
+        lock_timeout: Seconds before an abandoned rebuild lock expires
+        poll_interval: Seconds between checks while waiting for a rebuild
+
+    Returns:
+        The cached or freshly built value
+    """
+    cache = caches[alias]
+    generation_key = _generation_key(key)
+
+    def current():
+        cached = cache.get_many([key, generation_key])
+        generation = cached.get(generation_key, 0)
+        entry = cached.get(key)
+        if entry is not None and entry[0] == generation:
+            return generation, entry[1]
+        return generation, None
+
+    generation, value = current()
+    if value is not None:
+        return value
+
+    lock_key = f'{key}:lock'
+    stale_key = f'{key}:stale'
+
+    if cache.add(lock_key, 1, lock_timeout):
+        try:
+            value = builder()
+            if cache.get(generation_key, 0) == generation:
+                cache.set_many({key: (generation, value)}, timeout)
+                cache.set(stale_key, value, None)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+    # Another request is rebuilding: serve the previous value if we have one
+    value = cache.get(stale_key)
+    if value is not None:
+        return value
+
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        _, value = current()
+        if value is not None:
+            return value
+
+    # The rebuilding request died; build without caching
+    return builder()
+
+
+def invalidate(*keys, alias='default'):
+    """
+    Invalidate cached values so the next read rebuilds them.
+
+    Bumps each key's generation, so builds already running when this is
+    called are not cached. The last known values are kept to serve
+    concurrent readers while the rebuild runs.
+
+    Args:
+        *keys: Cache keys to invalidate
+        alias: Cache alias from settings.CACHES
+    """
+    cache = caches[alias]
+    for key in keys:
+        generation_key = _generation_key(key)
+        cache.add(generation_key, 0, None)
+        try:
+            cache.incr(generation_key)
+        except ValueError:
+            # Evicted between add() and incr(); any other value is a new generation
+            cache.set(generation_key, 1, None)
+    cache.delete_many(keys)
\ No newline at end of file
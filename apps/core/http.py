@@ -0,0 +1,104 @@
+"""
+Core HTTP module.
+Conditional GET support for pages that only change when their data does:
+ETag/Last-Modified validators, 304 responses without rendering, and
+Cache-Control headers for shared and per-user variants.
+"""
+
+import hashlib
+import os
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+
+from django.conf import settings
+from django.contrib import messages
+from django.template import engines
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+
+@lru_cache(maxsize=None)
+def templates_last_modified() -> datetime:
+    """
+    Modification time of the newest template file.
+
+    Read once per process, so a deploy that changes any template also
+    changes every validator built on it.
+
+    Returns:
+        Aware UTC datetime
+    """
+    newest = 0.0
+    for directory in engines['django'].template_dirs:
+        for root, _, files in os.walk(directory):
+            for name in files:
+                newest = max(newest, os.path.getmtime(os.path.join(root, name)))
+    return datetime.fromtimestamp(int(newest), tz=timezone.utc)
+
+
+def _is_shared(request) -> bool:
+    # Without a session cookie the page cannot differ between visitors
+    return settings.SESSION_COOKIE_NAME not in request.COOKIES
+
+
+def conditional_page(validators, *, max_age: int):
+    """
+    Decorate a view with conditional GET handling and cache headers.
+
+    Requests without a session cookie get one shared variant that browsers
+    and proxies may cache for max_age seconds; requests with a session get
+    a private, per-user variant with Vary: Cookie that is revalidated on
+    every use. Matching If-None-Match/If-Modified-Since requests are
+    answered with 304 before the view runs. Pages with pending flash
+    messages are always rendered and not cached.
+
+    Args:
+        validators: Callable taking the view arguments (request first) and
+            returning (etag_parts, last_modified); etag_parts is any
+            repr()-able value and last_modified an aware datetime
+        max_age: Seconds shared variants may be cached
+
+    Returns:
+        View decorator
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in SAFE_METHODS or len(messages.get_messages(request)):
+                return view(request, *args, **kwargs)
+
+            shared = _is_shared(request)
+            parts, last_modified = validators(request, *args, **kwargs)
+            last_modified = max(last_modified, templates_last_modified())
+            variant = 'shared' if shared else f'user:{request.user.pk}'
+            etag = quote_etag(hashlib.md5(repr((parts, last_modified, variant)).encode()).hexdigest())
+            timestamp = int(last_modified.timestamp())
+
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                if hasattr(response, 'render'):
+                    response.render()
+                if request.META.get('CSRF_COOKIE_NEEDS_UPDATE') or request.session.modified:
+                    # The response sets a cookie, so it must not be shared
+                    shared = False
+
+            response.headers.setdefault('ETag', etag)
+            response.headers.setdefault('Last-Modified', http_date(timestamp))
+            if shared:
+                patch_cache_control(response, public=True, max_age=max_age)
+                # Nothing cookie-dependent was rendered; keep SessionMiddleware
+                # from adding Vary: Cookie for the user lookup
+                request.session.accessed = False
+            else:
+                patch_cache_control(response, private=True, no_cache=True)
+                patch_vary_headers(response, ('Cookie',))
+            return response
+
+        return wrapper
+
+    return decorator
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""
+Core images module.
+Generates resized WebP/JPEG derivatives of uploaded images.
+
+Derivatives are stored content-addressed under IMAGE_DERIVATIVE_DIR, named
+after a hash of the source bytes, so re-uploading the same photo reuses the
+existing files and a changed photo never serves stale ones.
+"""
+
+import hashlib
+import logging
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = {
+    'thumb': 160,
+    'card': 480,
+    'detail': 1200,
+}
+
+FORMATS = {
+    'webp': {'format': 'WEBP', 'ext': 'webp', 'options': {'quality': 80, 'method': 4}},
+    'jpeg': {'format': 'JPEG', 'ext': 'jpg', 'options': {'quality': 82, 'optimize': True, 'progressive': True}},
+}
+
+
+def get_sizes() -> dict:
+    """
+    Get the configured derivative sizes.
+
+    Returns:
+        Dict mapping size name to maximum width in pixels
+    """
+    return getattr(settings, 'IMAGE_DERIVATIVE_SIZES', DEFAULT_SIZES)
+
+
+def _cache_key(name: str) -> str:
+    return f'images:derivatives:{hashlib.md5(name.encode()).hexdigest()}'
+
+
+def _fit(dimensions: tuple, width: int) -> tuple:
+    source_width, source_height = dimensions
+    if source_width <= width:
+        return dimensions
+    return width, max(1, round(source_height * width / source_width))
+
+
+def _render(source: Image.Image, dimensions: tuple, fmt: str) -> bytes:
+    image = source if dimensions == source.size else source.resize(dimensions, Image.Resampling.LANCZOS)
+    if fmt == 'jpeg' and image.mode != 'RGB':
+        image = image.convert('RGB')
+    elif fmt == 'webp' and image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA')
+
+    spec = FORMATS[fmt]
+    buffer = BytesIO()
+    image.save(buffer, spec['format'], **spec['options'])
+    return buffer.getvalue()
+
+
+def build_derivatives(field_file) -> dict:
+    """
+    Generate any missing derivatives for an image and describe them.
+
+    Args:
+        field_file: FieldFile of an ImageField
+
+    Returns:
+        Dict mapping (size, format) to {'name', 'width', 'height'}
+    """
+    storage = field_file.storage
+    with field_file.open('rb') as source_file:
+        content = source_file.read()
+
+    digest = hashlib.sha256(content).hexdigest()
+    directory = getattr(settings, 'IMAGE_DERIVATIVE_DIR', 'derivatives')
+
+    with Image.open(BytesIO(content)) as opened:
+        source = ImageOps.exif_transpose(opened)
+        source.load()
+
+    derivatives = {}
+    for size, width in get_sizes().items():
+        for fmt, spec in FORMATS.items():
+            dimensions = _fit(source.size, width)
+            name = f"{directory}/{digest[:2]}/{digest}-{dimensions[0]}.{spec['ext']}"
+            if not storage.exists(name):
+                storage.save(name, ContentFile(_render(source, dimensions, fmt)))
+            derivatives[(size, fmt)] = {
+                'name': name,
+                'width': dimensions[0],
+                'height': dimensions[1],
+            }
+
+    return derivatives
+
+
+def get_derivatives(field_file) -> dict:
+    """
+    Get the derivatives of an image, generating them on first use.
+
+    Args:
+        field_file: FieldFile of an ImageField
+
+    Returns:
+        Dict mapping (size, format) to {'url', 'width', 'height'}, or an
+        empty dict if the image is missing or cannot be decoded
+    """
+    if not field_file:
+        return {}
+
+    key = _cache_key(field_file.name)
+    derivatives = cache.get(key)
+    if derivatives is None:
+        try:
+            derivatives = build_derivatives(field_file)
+        except (OSError, UnidentifiedImageError):
+            logger.warning('Could not build derivatives for %s', field_file.name, exc_info=True)
+            return {}
+        cache.set(key, derivatives, None)
+
+    storage = field_file.storage
+    return {
+        variant: {**info, 'url': storage.url(info['name'])}
+        for variant, info in derivatives.items()
+    }
+
+
+def get_derivative_url(field_file, size='card', fmt='jpeg') -> str:
+    """
+    Get the URL of one derivative, falling back to the original upload.
+
+    Args:
+        field_file: FieldFile of an ImageField
+        size: Size name from IMAGE_DERIVATIVE_SIZES
+        fmt: 'webp' or 'jpeg'
+
+    Returns:
+        URL string, or an empty string if there is no image
+    """
+    if not field_file:
+        return ''
+
+    derivative = get_derivatives(field_file).get((size, fmt))
+    return derivative['url'] if derivative else field_file.url
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""
+Core instrumentation module.
+Collects per-request SQL and template render metrics and keeps a rolling
+in-process report of them.
+"""
+
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.template import base as template_base
+
+_current_metrics = ContextVar('request_metrics', default=None)
+
+_IN_LIST_RE = re.compile(r'\((?:%s, )+%s\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Normalize an SQL template so repeated queries share one fingerprint.
+
+    Args:
+        sql: SQL with parameter placeholders
+
+    Returns:
+        Normalized SQL string
+    """
+    sql = _IN_LIST_RE.sub('(%s, ...)', sql)
+    return _WHITESPACE_RE.sub(' ', sql).strip()
+
+
+class RequestMetrics:
+    """Metrics collected while handling one request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.db_time = 0.0
+        self.render_time = 0.0
+        self.render_depth = 0
+        self.fingerprints = Counter()
+        self.total_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        """Database execute wrapper (see connection.execute_wrapper)."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.query_count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    def finish(self):
+        self.total_time = time.perf_counter() - self.started
+
+    @property
+    def duplicates(self) -> dict:
+        """Fingerprints executed more than once in this request."""
+        return {sql: count for sql, count in self.fingerprints.items() if count > 1}
+
+    def server_timing(self) -> str:
+        """
+        Format the metrics as a Server-Timing header value.
+
+        Returns:
+            Header value
+        """
+        return ', '.join([
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.query_count} queries"',
+            f'dup;desc="{sum(self.duplicates.values())} duplicate queries"',
+            f'render;dur={self.render_time * 1000:.1f}',
+            f'app;dur={self.total_time * 1000:.1f}',
+        ])
+
+
+def start_request() -> RequestMetrics:
+    metrics = RequestMetrics()
+    _current_metrics.set(metrics)
+    return metrics
+
+
+def end_request() -> None:
+    _current_metrics.set(None)
+
+
+_original_render = template_base.Template.render
+_render_lock = threading.Lock()
+
+
+def _timed_render(self, context):
+    metrics = _current_metrics.get()
+    if metrics is None or metrics.render_depth:
+        return _original_render(self, context)
+
+    started = time.perf_counter()
+    metrics.render_depth += 1
+    try:
+        return _original_render(self, context)
+    finally:
+        metrics.render_depth -= 1
+        metrics.render_time += time.perf_counter() - started
+
+
+def install_render_timer() -> None:
+    """Time top-level template renders for the current request."""
+    with _render_lock:
+        template_base.Template.render = _timed_render
+
+
+class QueryReport:
+    """
+    Rolling report of the most recent requests in this process.
+
+    Args:
+        size: Number of requests to keep
+    """
+
+    def __init__(self, size: int):
+        self.records = deque(maxlen=size)
+
+    def add(self, *, view: str, metrics: RequestMetrics) -> None:
+        self.records.append({
+            'view': view,
+            'queries': metrics.query_count,
+            'db_ms': metrics.db_time * 1000,
+            'render_ms': metrics.render_time * 1000,
+            'total_ms': metrics.total_time * 1000,
+            'duplicates': metrics.duplicates,
+        })
+
+    def clear(self) -> None:
+        self.records.clear()
+
+    def summary(self) -> list:
+        """
+        Aggregate the recorded requests per view.
+
+        Returns:
+            List of per-view dicts, slowest total time first
+        """
+        by_view = {}
+        for record in list(self.records):
+            by_view.setdefault(record['view'], []).append(record)
+
+        rows = []
+        for view, records in by_view.items():
+            count = len(records)
+            totals = sorted(record['total_ms'] for record in records)
+            duplicates = Counter()
+            for record in records:
+                duplicates.update(record['duplicates'])
+            rows.append({
+                'view': view,
+                'requests': count,
+                'avg_queries': sum(record['queries'] for record in records) / count,
+                'max_queries': max(record['queries'] for record in records),
+                'avg_db_ms': sum(record['db_ms'] for record in records) / count,
+                'avg_render_ms': sum(record['render_ms'] for record in records) / count,
+                'avg_total_ms': sum(totals) / count,
+                'p95_total_ms': totals[min(count - 1, int(count * 0.95))],
+                'top_duplicates': duplicates.most_common(3),
+            })
+
+        return sorted(rows, key=lambda row: row['avg_total_ms'], reverse=True)
+
+
+report = QueryReport(getattr(settings, 'QUERY_REPORT_SIZE', 500))
+
+
+def get_budget(view: str) -> dict:
+    """
+    Get the query budget for a view.
+
+    Args:
+        view: Namespaced view name, e.g. 'pets:list'
+
+    Returns:
+        Dict with optional 'queries' and 'db_ms' limits
+    """
+    budgets = getattr(settings, 'QUERY_BUDGETS', {})
+    return budgets.get(view, budgets.get('default', {}))
\ No newline at end of file
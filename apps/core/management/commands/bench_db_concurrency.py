@@ -0,0 +1,167 @@
+"""
+Measure how the database configuration copes with concurrent requests.
+
+Several threads, each with its own connection like a gunicorn worker, mix
+list reads with read-then-write transactions (the shape of a form
+submission) for a fixed time. Every operation ends like a request does, so
+CONN_MAX_AGE decides whether the connection is reused. The same workload
+runs against the configured 'default' database and, with --compare-defaults,
+against the same database with Django's default options (rollback journal,
+deferred transactions, no persistent connections) to show the difference.
+Rows written are tagged with the bench e-mail domain and removed afterwards.
+"""
+
+import json
+import random
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, close_old_connections, connections, transaction
+
+from apps.contact.models import ContactMessage
+from apps.core.bench import BENCH_EMAIL_DOMAIN, compare, summarize
+
+
+BASELINE_ALIAS = 'bench_defaults'
+
+
+def baseline_settings(default: dict) -> dict:
+    """
+    Copy the default database settings with Django's out-of-the-box options.
+
+    Args:
+        default: Settings dict of the 'default' database
+
+    Returns:
+        Settings dict for the baseline alias
+    """
+    settings = {
+        **default,
+        'CONN_MAX_AGE': 0,
+        'CONN_HEALTH_CHECKS': False,
+        'OPTIONS': {},
+    }
+    if default['ENGINE'].endswith('sqlite3'):
+        # journal_mode is stored in the database file, so switch it back
+        settings['OPTIONS'] = {'init_command': 'PRAGMA journal_mode=DELETE'}
+    return settings
+
+
+class Command(BaseCommand):
+    help = 'Benchmark concurrent reads and writes against the configured database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help='Concurrent connections')
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run each profile')
+        parser.add_argument('--write-ratio', type=float, default=0.3, help='Share of operations that write')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed')
+        parser.add_argument('--compare-defaults', action='store_true',
+                            help="Also run with Django's default database options and compare")
+        parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+
+    def handle(self, *args, **options):
+        profiles = {}
+        if options['compare_defaults']:
+            connections.settings[BASELINE_ALIAS] = baseline_settings(connections.settings['default'])
+            profiles['defaults'] = BASELINE_ALIAS
+        profiles['configured'] = 'default'
+
+        results = {}
+        try:
+            for name, alias in profiles.items():
+                summary = self._run(alias, options)
+                results[name] = summary
+                self.stderr.write(
+                    f"{name}: {summary['throughput_rps']} ops/s, p95 {summary['p95_ms']} ms, "
+                    f"{summary['errors']} locked/failed"
+                )
+        finally:
+            ContactMessage.objects.filter(email__endswith=f'@{BENCH_EMAIL_DOMAIN}', subject='db-bench').delete()
+            if BASELINE_ALIAS in profiles.values():
+                connections[BASELINE_ALIAS].close()
+
+        report = {
+            'meta': {
+                'database': connections['default'].vendor,
+                'workers': options['workers'],
+                'duration_s': options['duration'],
+                'write_ratio': options['write_ratio'],
+            },
+            'scenarios': results,
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                handle.write(output)
+        else:
+            self.stdout.write(output)
+
+        if 'defaults' in results:
+            baseline = {'scenarios': {'mixed': results['defaults']}}
+            current = {'scenarios': {'mixed': results['configured']}}
+            for _, metric, before, after, change in compare(baseline, current, metrics=('throughput_rps', 'p95_ms')):
+                self.stderr.write(f'{metric:<15} {before:>10} -> {after:<10} ({change:+.1f}%)')
+
+    def _run(self, alias, options) -> dict:
+        # Make sure the journal mode of this profile is in place before timing
+        connections[alias].ensure_connection()
+        connections[alias].close()
+
+        deadline = time.perf_counter() + options['duration']
+        barrier = threading.Barrier(options['workers'])
+        samples = []
+        lock = threading.Lock()
+
+        def worker(index):
+            rng = random.Random(options['seed'] + index)
+            local = []
+            barrier.wait()
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    if rng.random() < options['write_ratio']:
+                        self._write(alias, rng)
+                    else:
+                        self._read(alias)
+                    ok = True
+                except OperationalError:
+                    ok = False
+                local.append(((time.perf_counter() - started) * 1000, ok))
+                # End of "request": closes the connection unless CONN_MAX_AGE allows reuse
+                close_old_connections()
+            connections[alias].close()
+            with lock:
+                samples.extend(local)
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(options['workers'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        return summarize(
+            latencies=[latency for latency, ok in samples if ok],
+            queries=[],
+            errors=sum(1 for _, ok in samples if not ok),
+            elapsed=elapsed,
+        )
+
+    def _read(self, alias):
+        list(
+            ContactMessage.objects.using(alias)
+            .order_by('-created_at', '-id')
+            .values_list('id', 'name', 'subject', 'is_read')[:20]
+        )
+
+    def _write(self, alias, rng):
+        with transaction.atomic(using=alias):
+            unread = ContactMessage.objects.using(alias).filter(is_read=False).count()
+            ContactMessage.objects.using(alias).create(
+                name='Bench',
+                email=f'db{rng.randrange(10 ** 9)}@{BENCH_EMAIL_DOMAIN}',
+                subject='db-bench',
+                message=f'{unread} unread',
+            )
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Query-plan regression check for the hot selectors.
+
+Runs EXPLAIN over the queries behind the catalog, homepage and dashboard
+and fails if any of them reads a whole table instead of using an index.
+Walking a full index in order is only accepted for LIMITed queries or when
+the index is partial.
+"""
+
+import re
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.adoptions.models import AdoptionApplication
+from apps.adoptions.selectors import (
+    filter_applications,
+    get_pending_applications,
+    get_recent_applications,
+    get_user_applications,
+)
+from apps.contact.selectors import (
+    filter_contact_messages,
+    get_recent_messages,
+    get_unread_messages,
+)
+from apps.pets.models import Pet
+from apps.pets.selectors import (
+    filter_pets,
+    get_available_pets,
+    get_featured_pets,
+    get_related_pets,
+)
+
+
+# Plan lines that read a table, or one of its indexes, from start to end
+FULL_SCAN_PATTERNS = {
+    'sqlite': re.compile(r'\bSCAN (?:TABLE )?(\w+)(?: USING (?:COVERING )?INDEX (\w+))?$'),
+    'postgresql': re.compile(r'\bSeq Scan on (\w+)()'),
+}
+
+
+def get_partial_indexes() -> set:
+    """
+    Get the names of all partial indexes declared on installed models.
+
+    Returns:
+        Set of index names
+    """
+    return {
+        index.name
+        for model in apps.get_models()
+        for index in model._meta.indexes
+        if index.condition is not None
+    }
+
+
+def hot_queries() -> dict:
+    """
+    Build the querysets to check, keyed by a readable label.
+
+    Returns:
+        Dict mapping label to QuerySet
+    """
+    user = get_user_model()(pk=0, email='plan@example.com')
+    pet = Pet(pk=0, type='dog')
+
+    return {
+        'pets: catalog': get_available_pets().order_by('-arrival_date', '-id'),
+        'pets: catalog by type': get_available_pets(filters={'type': 'dog'}).order_by('-arrival_date', '-id'),
+        'pets: catalog by age': get_available_pets(filters={'ages': ['young']}).order_by('age_months', 'id'),
+        'pets: catalog by trait': get_available_pets(filters={'traits': ['calm', 'playful']}).order_by('-arrival_date', '-id'),
+        'pets: featured': get_featured_pets(),
+        'pets: related': get_related_pets(pet=pet),
+        'pets: admin by status': filter_pets(filters={'status': 'pending'}),
+        'adoptions: by status': filter_applications(filters={'status': 'pending'}).order_by('-submitted_at', '-id'),
+        'adoptions: pending': get_pending_applications(),
+        'adoptions: recent': get_recent_applications(),
+        'adoptions: by user': get_user_applications(user=user),
+        'adoptions: pending for pet': AdoptionApplication.objects.filter(pet_id=0, status='pending'),
+        'contact: by read status': filter_contact_messages(filters={'read': 'unread'}).order_by('-created_at', '-id'),
+        'contact: unread': get_unread_messages(),
+        'contact: recent': get_recent_messages(),
+    }
+
+
+class Command(BaseCommand):
+    help = 'Fail if a hot selector query falls back to a full table scan'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verbose-plans',
+            action='store_true',
+            help='Print the full plan of every query'
+        )
+
+    def handle(self, *args, **options):
+        pattern = FULL_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f'Query plans are not supported on {connection.vendor}')
+
+        partial_indexes = get_partial_indexes()
+        failures = []
+        for label, queryset in hot_queries().items():
+            plan = queryset.explain()
+            bounded = queryset.query.high_mark is not None
+            scanned = []
+            for line in plan.splitlines():
+                match = pattern.search(line.strip())
+                if not match:
+                    continue
+                table, index = match.groups()
+                if index and (bounded or index in partial_indexes):
+                    continue
+                scanned.append(f'{table} (via {index})' if index else table)
+
+            if scanned:
+                failures.append(f'{label}: full scan of {", ".join(scanned)}')
+                self.stdout.write(self.style.ERROR(f'{label}: full scan'))
+            else:
+                self.stdout.write(f'{label}: ok')
+
+            if options['verbose_plans'] or scanned:
+                self.stdout.write(f'    {str(queryset.query)}')
+                for line in plan.splitlines():
+                    self.stdout.write(f'    {line}')
+
+        if failures:
+            raise CommandError('\n'.join(failures))
+
+        self.stdout.write(self.style.SUCCESS('All hot queries use an index.'))
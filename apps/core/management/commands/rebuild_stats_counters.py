@@ -0,0 +1,28 @@
+"""
+Recompute the materialized status counters from the source tables.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.pets.selectors import PET_STATUS_BREAKDOWN
+from apps.adoptions.selectors import APPLICATION_STATUS_BREAKDOWN
+from apps.contact.selectors import CONTACT_READ_BREAKDOWN
+
+
+BREAKDOWNS = [
+    PET_STATUS_BREAKDOWN,
+    APPLICATION_STATUS_BREAKDOWN,
+    CONTACT_READ_BREAKDOWN,
+]
+
+
+class Command(BaseCommand):
+    help = 'Recompute the StatusCounter rows used for homepage and dashboard stats'
+
+    def handle(self, *args, **options):
+        for breakdown in BREAKDOWNS:
+            counts = breakdown.rebuild()
+            summary = ', '.join(f'{key}={value}' for key, value in counts.items())
+            self.stdout.write(f'{breakdown.scope}: {summary}')
+
+        self.stdout.write(self.style.SUCCESS('Status counters rebuilt.'))
@@ -0,0 +1,236 @@
+"""
+Run the page benchmarks and report latency, queries and throughput as JSON.
+
+By default requests go through the Django test client in-process, which
+also counts SQL queries per request. With --base-url the same scenarios are
+sent over HTTP to a running server (e.g. gunicorn); query counts are then
+read from the Server-Timing header when QUERY_INSTRUMENTATION_ENABLED is on.
+Run seed_bench first for realistic volumes.
+"""
+
+import json
+import random
+import re
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+from apps.core.bench import BENCH_EMAIL_DOMAIN, BENCH_USERNAME, compare, summarize
+from apps.pets.models import Pet
+
+
+SERVER_TIMING_QUERIES = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+
+def build_scenarios(pets: list) -> list:
+    """
+    Describe the requests to benchmark.
+
+    Args:
+        pets: Available Pet instances to pick detail pages and applications from
+
+    Returns:
+        List of dicts with 'name', 'method', 'auth' ('staff', 'user' or None)
+        and 'request', a callable taking a Random and returning (url, data)
+    """
+    def detail(rng):
+        return rng.choice(pets).get_absolute_url(), None
+
+    def apply(rng):
+        pet = rng.choice(pets)
+        return reverse('adoptions:application_pet', args=[pet.pk]), {
+            'first_name': 'Bench',
+            'last_name': 'Applicant',
+            'email': f'submit{rng.randrange(10 ** 9)}@{BENCH_EMAIL_DOMAIN}',
+            'phone': '5551234567',
+            'address': '1 Benchmark Street',
+            'housing_type': 'house',
+            'own_or_rent': 'own',
+            'household_adults': '2',
+            'household_children': '0',
+            'previous_pet_experience': 'Grew up with dogs and cats in the family home.',
+            'reason_for_adoption': 'Looking for a companion to share a quiet home with.',
+        }
+
+    def page(name, query=None):
+        url = reverse(name)
+        return lambda rng: (url, query)
+
+    return [
+        {'name': 'home', 'method': 'get', 'auth': None, 'request': page('pets:home')},
+        {'name': 'pet_list', 'method': 'get', 'auth': None, 'request': page('pets:list')},
+        {'name': 'pet_list_type_size', 'method': 'get', 'auth': None,
+         'request': page('pets:list', {'type': 'dog', 'size': 'Large'})},
+        {'name': 'pet_list_search', 'method': 'get', 'auth': None,
+         'request': page('pets:list', {'search': 'labrador'})},
+        {'name': 'pet_list_sort_name', 'method': 'get', 'auth': None,
+         'request': page('pets:list', {'sort': 'name'})},
+        {'name': 'pet_detail', 'method': 'get', 'auth': None, 'request': detail},
+        {'name': 'dashboard_home', 'method': 'get', 'auth': 'staff', 'request': page('dashboard:home')},
+        {'name': 'dashboard_pets', 'method': 'get', 'auth': 'staff',
+         'request': page('dashboard:pets', {'status': 'available'})},
+        {'name': 'dashboard_applications', 'method': 'get', 'auth': 'staff',
+         'request': page('dashboard:applications', {'status': 'pending'})},
+        {'name': 'dashboard_contacts', 'method': 'get', 'auth': 'staff',
+         'request': page('dashboard:contacts', {'read': 'unread'})},
+        {'name': 'application_submit', 'method': 'post', 'auth': 'user', 'request': apply},
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark public and dashboard pages and write the results as JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Measured requests per scenario')
+        parser.add_argument('--warmup', type=int, default=10, help='Unmeasured requests per scenario')
+        parser.add_argument('--scenario', action='append', help='Only run the named scenario (repeatable)')
+        parser.add_argument('--base-url', help='Benchmark a running server instead of the test client')
+        parser.add_argument('--concurrency', type=int, default=1, help='Parallel clients when using --base-url')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for picking pets')
+        parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+        parser.add_argument('--compare', help='Print changes against an earlier JSON report')
+
+    def handle(self, *args, **options):
+        pets = list(Pet.objects.filter(status='available').order_by('?')[:200])
+        if not pets:
+            raise CommandError('No available pets; run seed_bench first')
+
+        scenarios = build_scenarios(pets)
+        if options['scenario']:
+            scenarios = [s for s in scenarios if s['name'] in options['scenario']]
+            if not scenarios:
+                raise CommandError('No matching scenarios')
+
+        staff = get_user_model().objects.filter(username=BENCH_USERNAME).first()
+        if staff is None:
+            raise CommandError(f'User {BENCH_USERNAME!r} not found; run seed_bench first')
+
+        if options['base_url']:
+            run = self._http_runner(options, staff)
+            scenarios = [s for s in scenarios if s['method'] == 'get']
+        else:
+            setup_test_environment()
+            run = self._client_runner(staff)
+
+        rng = random.Random(options['seed'])
+        results = {}
+        try:
+            for scenario in scenarios:
+                for _ in range(options['warmup']):
+                    run(scenario, rng)
+                summary = self._measure(run, scenario, rng, options)
+                results[scenario['name']] = summary
+                self.stderr.write(
+                    f"{scenario['name']}: p50 {summary['p50_ms']} ms, p95 {summary['p95_ms']} ms, "
+                    f"{summary['errors']} error(s)"
+                )
+        finally:
+            if not options['base_url']:
+                teardown_test_environment()
+
+        report = {
+            'meta': {
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'mode': 'http' if options['base_url'] else 'test-client',
+                'database': connection.vendor,
+                'debug': settings.DEBUG,
+                'requests_per_scenario': options['requests'],
+                'concurrency': options['concurrency'] if options['base_url'] else 1,
+            },
+            'scenarios': results,
+        }
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                handle.write(output)
+        else:
+            self.stdout.write(output)
+
+        if options['compare']:
+            with open(options['compare']) as handle:
+                baseline = json.load(handle)
+            for name, metric, before, after, change in compare(baseline, report):
+                self.stderr.write(f'{name:<24} {metric:<15} {before:>10} -> {after:<10} ({change:+.1f}%)')
+
+    def _measure(self, run, scenario, rng, options) -> dict:
+        count = options['requests']
+        concurrency = options['concurrency'] if options['base_url'] else 1
+
+        started = time.perf_counter()
+        if concurrency > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                samples = list(pool.map(lambda _: run(scenario, rng), range(count)))
+        else:
+            samples = [run(scenario, rng) for _ in range(count)]
+        elapsed = time.perf_counter() - started
+
+        return summarize(
+            latencies=[latency for latency, _, _ in samples],
+            queries=[queries for _, queries, _ in samples if queries is not None],
+            errors=sum(1 for _, _, ok in samples if not ok),
+            elapsed=elapsed,
+        )
+
+    def _client_runner(self, staff):
+        user, _ = get_user_model().objects.get_or_create(
+            username=f'{BENCH_USERNAME}-visitor',
+            defaults={'email': f'visitor@{BENCH_EMAIL_DOMAIN}'}
+        )
+        # Server errors are counted in the report rather than aborting the run
+        clients = {auth: Client(raise_request_exception=False) for auth in (None, 'staff', 'user')}
+        clients['staff'].force_login(staff)
+        clients['user'].force_login(user)
+
+        def run(scenario, rng):
+            url, data = scenario['request'](rng)
+            client = clients[scenario['auth']]
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                response = getattr(client, scenario['method'])(url, data)
+                latency = (time.perf_counter() - started) * 1000
+            return latency, len(context), response.status_code < 400
+
+        return run
+
+    def _http_runner(self, options, staff):
+        base_url = options['base_url'].rstrip('/')
+
+        # Log the staff user in through the shared database and reuse its cookie
+        login = Client()
+        login.force_login(staff)
+        staff_cookie = f'{settings.SESSION_COOKIE_NAME}={login.cookies[settings.SESSION_COOKIE_NAME].value}'
+
+        def run(scenario, rng):
+            url, data = scenario['request'](rng)
+            if data:
+                url = f'{url}?{urllib.parse.urlencode(data)}'
+            request = urllib.request.Request(f'{base_url}{url}')
+            if scenario['auth'] == 'staff':
+                request.add_header('Cookie', staff_cookie)
+
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request) as response:
+                    response.read()
+                    status = response.status
+                    timing = response.headers.get('Server-Timing', '')
+            except urllib.error.HTTPError as error:
+                status, timing = error.code, ''
+            latency = (time.perf_counter() - started) * 1000
+
+            match = SERVER_TIMING_QUERIES.search(timing)
+            return latency, int(match.group(1)) if match else None, status < 400
+
+        return run
@@ -0,0 +1,225 @@
+"""
+Seed the database with benchmark volumes of pets, applications and messages.
+
+Rows are inserted with bulk_create in batches and tagged with the bench
+prefix, so --clear removes exactly what a previous run added.
+"""
+
+import random
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.adoptions.models import AdoptionApplication
+from apps.contact.models import ContactMessage
+from apps.core.bench import BENCH_EMAIL_DOMAIN, BENCH_PREFIX, BENCH_USERNAME
+from apps.pets.caching import invalidate_home_cache
+from apps.pets.models import Pet, parse_age_months
+from apps.pets.services import PetService
+
+
+NAMES = [
+    'Bella', 'Max', 'Luna', 'Charlie', 'Lucy', 'Cooper', 'Daisy', 'Milo',
+    'Bailey', 'Rocky', 'Sadie', 'Buddy', 'Molly', 'Toby', 'Stella', 'Oliver',
+    'Coco', 'Leo', 'Ruby', 'Jack', 'Nala', 'Oscar', 'Willow', 'Finn',
+]
+
+BREEDS = {
+    'dog': ['Labrador Retriever', 'German Shepherd', 'Beagle', 'Boxer', 'Poodle', 'Mixed'],
+    'cat': ['Domestic Shorthair', 'Maine Coon', 'Siamese', 'Persian', 'Bengal'],
+    'rabbit': ['Holland Lop', 'Netherland Dwarf', 'Rex', 'Lionhead'],
+    'bird': ['Budgerigar', 'Cockatiel', 'Lovebird', 'Canary'],
+}
+
+COLORS = ['Black', 'White', 'Brown', 'Golden', 'Grey', 'Tabby', 'Cream', 'Spotted']
+
+DESCRIPTIONS = [
+    'Friendly and playful, loves long walks and belly rubs.',
+    'A calm companion who enjoys quiet afternoons and gentle company.',
+    'Energetic and curious, great with older children and other pets.',
+    'Shy at first but very affectionate once settled in a new home.',
+]
+
+PET_STATUS_WEIGHTS = {'available': 60, 'pending': 10, 'adopted': 30}
+APPLICATION_STATUS_WEIGHTS = {'pending': 30, 'approved': 15, 'rejected': 40, 'completed': 15}
+
+
+@contextmanager
+def explicit_timestamps(model, *field_names):
+    """Let bulk_create keep the given auto_now_add values instead of now()."""
+    fields = [model._meta.get_field(name) for name in field_names]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+class Command(BaseCommand):
+    help = 'Generate benchmark volumes of pets, adoption applications and contact messages'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pets', type=int, default=50_000, help='Number of pets to create')
+        parser.add_argument('--applications', type=int, default=500_000, help='Number of applications to create')
+        parser.add_argument('--messages', type=int, default=100_000, help='Number of contact messages to create')
+        parser.add_argument('--batch-size', type=int, default=5_000, help='Rows per INSERT batch')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for reproducible data')
+        parser.add_argument('--clear', action='store_true', help='Only remove previously seeded rows')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+
+        self._clear()
+        if options['clear']:
+            self._finish()
+            return
+
+        self._ensure_admin()
+        pet_ids = self._seed_pets(options['pets'])
+        self._seed_applications(options['applications'], pet_ids)
+        self._seed_messages(options['messages'])
+        self._finish()
+
+    def _clear(self):
+        applications, _ = AdoptionApplication.objects.filter(email__endswith=f'@{BENCH_EMAIL_DOMAIN}').delete()
+        pets, _ = Pet.objects.filter(slug__startswith=f'{BENCH_PREFIX}-').delete()
+        messages, _ = ContactMessage.objects.filter(email__endswith=f'@{BENCH_EMAIL_DOMAIN}').delete()
+        if applications or pets or messages:
+            self.stdout.write(f'Removed {pets} pets, {applications} applications and {messages} messages')
+
+    def _ensure_admin(self):
+        user, created = get_user_model().objects.get_or_create(
+            username=BENCH_USERNAME,
+            defaults={'email': f'admin@{BENCH_EMAIL_DOMAIN}', 'is_staff': True}
+        )
+        if created:
+            user.set_unusable_password()
+            user.save(update_fields=['password'])
+
+    def _insert(self, model, rows, total, label, *, after_batch=None):
+        batch = []
+        created = 0
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                created += self._flush(model, batch, after_batch)
+                batch = []
+                self.stdout.write(f'  {label}: {created}/{total}', ending='\r')
+        if batch:
+            created += self._flush(model, batch, after_batch)
+        self.stdout.write(f'  {label}: {created}/{total}')
+
+    def _flush(self, model, batch, after_batch=None) -> int:
+        with transaction.atomic():
+            model.objects.bulk_create(batch)
+            if after_batch is not None:
+                after_batch(batch)
+        return len(batch)
+
+    def _seed_pets(self, count) -> list:
+        rng = self.rng
+        today = date.today()
+        statuses = list(PET_STATUS_WEIGHTS)
+        weights = list(PET_STATUS_WEIGHTS.values())
+
+        def rows():
+            for i in range(count):
+                pet_type = rng.choice(list(BREEDS))
+                name = rng.choice(NAMES)
+                age = f'{rng.randint(1, 14)} years'
+                yield Pet(
+                    name=name,
+                    slug=f'{BENCH_PREFIX}-{name.lower()}-{i}',
+                    type=pet_type,
+                    breed=rng.choice(BREEDS[pet_type]),
+                    age=age,
+                    # bulk_create skips Pet.save(), which sets this
+                    age_months=parse_age_months(age),
+                    gender=rng.choice(Pet.GENDERS)[0],
+                    size=rng.choice(Pet.SIZES)[0],
+                    color=rng.choice(COLORS),
+                    description=rng.choice(DESCRIPTIONS),
+                    personality=rng.sample(['Friendly', 'Playful', 'Calm', 'Loyal', 'Curious'], 2),
+                    vaccinated=rng.random() < 0.8,
+                    spayed_neutered=rng.random() < 0.7,
+                    microchipped=rng.random() < 0.6,
+                    special_needs=rng.random() < 0.05,
+                    status=rng.choices(statuses, weights)[0],
+                    arrival_date=today - timedelta(days=rng.randint(0, 3 * 365)),
+                    adoption_fee=Decimal(rng.choice([50, 75, 100, 150, 200])),
+                    featured=rng.random() < 0.01,
+                )
+
+        # bulk_create skips the services, so link the personality traits per batch
+        self._insert(Pet, rows(), count, 'pets', after_batch=lambda pets: PetService.sync_traits(pets=pets))
+        return list(
+            Pet.objects.filter(slug__startswith=f'{BENCH_PREFIX}-').values_list('id', flat=True)
+        )
+
+    def _seed_applications(self, count, pet_ids):
+        if not pet_ids:
+            return
+
+        rng = self.rng
+        now = timezone.now()
+        statuses = list(APPLICATION_STATUS_WEIGHTS)
+        weights = list(APPLICATION_STATUS_WEIGHTS.values())
+
+        def rows():
+            for i in range(count):
+                first_name = rng.choice(NAMES)
+                yield AdoptionApplication(
+                    pet_id=rng.choice(pet_ids),
+                    first_name=first_name,
+                    last_name=f'Applicant{i}',
+                    email=f'applicant{i}@{BENCH_EMAIL_DOMAIN}',
+                    phone='5551234567',
+                    address=f'{i} Benchmark Street',
+                    housing_type=rng.choice(['house', 'apartment', 'condo']),
+                    own_or_rent=rng.choice(['own', 'rent']),
+                    landlord_approval=True,
+                    household_adults=rng.randint(1, 3),
+                    household_children=rng.randint(0, 3),
+                    previous_pet_experience='Grew up with dogs and cats in the family home.',
+                    reason_for_adoption='Looking for a companion to share a quiet home with.',
+                    status=rng.choices(statuses, weights)[0],
+                    submitted_at=now - timedelta(minutes=rng.randint(0, 2 * 365 * 24 * 60)),
+                    created_at=now,
+                )
+
+        with explicit_timestamps(AdoptionApplication, 'submitted_at', 'created_at'):
+            self._insert(AdoptionApplication, rows(), count, 'applications')
+
+    def _seed_messages(self, count):
+        rng = self.rng
+        now = timezone.now()
+
+        def rows():
+            for i in range(count):
+                yield ContactMessage(
+                    name=rng.choice(NAMES),
+                    email=f'visitor{i}@{BENCH_EMAIL_DOMAIN}',
+                    subject=rng.choice(['Adoption question', 'Volunteering', 'Donations', 'Visiting hours']),
+                    message='Hello, I would like to know more about your shelter.',
+                    is_read=rng.random() < 0.7,
+                    created_at=now - timedelta(minutes=rng.randint(0, 365 * 24 * 60)),
+                )
+
+        with explicit_timestamps(ContactMessage, 'created_at'):
+            self._insert(ContactMessage, rows(), count, 'messages')
+
+    def _finish(self):
+        call_command('refresh_pet_badges', stdout=self.stdout)
+        call_command('rebuild_stats_counters', stdout=self.stdout)
+        call_command('rebuild_related_pets', stdout=self.stdout)
+        invalidate_home_cache()
+        self.stdout.write(self.style.SUCCESS('Benchmark data ready.'))
@@ -0,0 +1,46 @@
+"""
+Copy the primary SQLite database onto the replica files.
+
+Stands in for replication when trying read replicas locally: each replica
+in REPLICA_DATABASES is overwritten with an online backup of the primary.
+With --interval the copy repeats, so the replicas trail the primary by up
+to that many seconds, like a lagging standby.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from apps.core.routers import get_replica_aliases
+
+
+class Command(BaseCommand):
+    help = 'Copy the primary SQLite database to the configured replica files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, help='Keep copying every N seconds')
+
+    def handle(self, *args, **options):
+        replicas = get_replica_aliases()
+        if not replicas:
+            raise CommandError('No replicas configured; set DB_REPLICAS')
+        if any(connections[alias].vendor != 'sqlite' for alias in [DEFAULT_DB_ALIAS, *replicas]):
+            raise CommandError('Replica syncing is only for SQLite; use real replication on other backends')
+
+        while True:
+            started = time.perf_counter()
+            self._sync(replicas)
+            self.stdout.write(f'Synced {len(replicas)} replica(s) in {(time.perf_counter() - started) * 1000:.0f} ms')
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def _sync(self, replicas):
+        primary = connections[DEFAULT_DB_ALIAS]
+        primary.ensure_connection()
+        for alias in replicas:
+            replica = connections[alias]
+            replica.ensure_connection()
+            primary.connection.backup(replica.connection)
+            replica.close()
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+Core middleware module.
+"""
+
+import logging
+import random
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from . import instrumentation
+from .routers import get_replica_aliases, has_written, read_from
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware:
+    """
+    Record SQL and render metrics for every request.
+
+    Enabled by QUERY_INSTRUMENTATION_ENABLED. Adds a Server-Timing header,
+    feeds the rolling report shown on the dashboard performance page and
+    logs a warning when a view exceeds its QUERY_BUDGETS entry.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'QUERY_INSTRUMENTATION_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        instrumentation.install_render_timer()
+
+    def __call__(self, request):
+        metrics = instrumentation.start_request()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics))
+                response = self.get_response(request)
+        finally:
+            instrumentation.end_request()
+
+        metrics.finish()
+        view = self._view_name(request)
+        instrumentation.report.add(view=view, metrics=metrics)
+        self._check_budget(view, metrics)
+
+        response['Server-Timing'] = metrics.server_timing()
+        return response
+
+    @staticmethod
+    def _view_name(request) -> str:
+        match = getattr(request, 'resolver_match', None)
+        return match.view_name if match else 'unresolved'
+
+    @staticmethod
+    def _check_budget(view, metrics):
+        budget = instrumentation.get_budget(view)
+
+        max_queries = budget.get('queries')
+        if max_queries is not None and metrics.query_count > max_queries:
+            logger.warning(
+                'Query budget exceeded for %s: %d queries (budget %d), %d duplicated',
+                view, metrics.query_count, max_queries, sum(metrics.duplicates.values())
+            )
+
+        max_db_ms = budget.get('db_ms')
+        if max_db_ms is not None and metrics.db_time * 1000 > max_db_ms:
+            logger.warning(
+                'DB time budget exceeded for %s: %.1f ms (budget %d ms)',
+                view, metrics.db_time * 1000, max_db_ms
+            )
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve read-only requests from a read replica.
+
+    Enabled when REPLICA_DATABASES is not empty. GET/HEAD/OPTIONS requests
+    read from a randomly chosen replica. Any other method reads from the
+    primary. So does any browser that wrote within the last
+    REPLICA_PIN_SECONDS (tracked with a cookie), so the page after a form
+    submission shows the new data even if the replicas lag behind.
+    """
+
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, get_response):
+        self.replicas = get_replica_aliases()
+        if not self.replicas:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        pinned = (
+            request.method not in self.SAFE_METHODS
+            or settings.REPLICA_PIN_COOKIE in request.COOKIES
+        )
+        with read_from(None if pinned else random.choice(self.replicas)):
+            response = self.get_response(request)
+            wrote = has_written()
+
+        if wrote:
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE,
+                '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
\ No newline at end of file
@@ -25,4 +25,24 @@ class PublishableModel(TimeStampedModel):
     published_at = models.DateTimeField(null=True, blank=True)
     
     class Meta:
-        abstract = True
\ No newline at end of file
+        abstract = True
+
+
+class StatusCounter(models.Model):
+    """
+    Materialized count of rows per status, maintained by the service layer.
+    """
+    scope = models.CharField(max_length=50)
+    key = models.CharField(max_length=50)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['scope', 'key'], name='core_statuscounter_scope_key'),
+        ]
+        verbose_name = 'Status Counter'
+        verbose_name_plural = 'Status Counters'
+    
+    def __str__(self):
+        return f"{self.scope}.{self.key} = {self.value}"
@@ -0,0 +1,151 @@
+"""
+Core pagination module.
+Keyset (cursor) pagination for large, stably ordered querysets.
+
+Instead of OFFSET/LIMIT, each page continues from the sort key of the last
+row of the previous one, so page N costs the same as page 1 when the
+ordering is backed by an index. Ordering fields must be non-null and end
+with a unique field (usually 'id').
+"""
+
+import datetime
+import decimal
+from functools import reduce
+from operator import or_
+
+from django.core import signing
+from django.db.models import Q, QuerySet
+
+
+def _encode(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+class CursorPage:
+    """One page of results from a CursorPaginator."""
+
+    def __init__(self, object_list, *, has_next, has_previous, next_cursor, previous_cursor,
+                 total=None, total_is_estimate=False):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.total = total
+        self.total_is_estimate = total_is_estimate
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+    def has_other_pages(self) -> bool:
+        return self.has_next or self.has_previous
+
+
+class CursorPaginator:
+    """
+    Paginate a queryset by its sort key.
+
+    Args:
+        queryset: QuerySet to paginate
+        per_page: Number of rows per page
+        ordering: Ordering fields, e.g. ('-arrival_date', '-id')
+        count_limit: If set, count matching rows up to this many and expose
+            the result as the page total (a lower bound when reached)
+    """
+
+    def __init__(self, queryset: QuerySet, per_page: int, *, ordering, count_limit=None):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+        self.keys = [(field.lstrip('-'), field.startswith('-')) for field in self.ordering]
+        self.count_limit = count_limit
+        self.salt = f'cursor:{",".join(self.ordering)}'
+
+    def get_page(self, cursor=None) -> CursorPage:
+        """
+        Get the page a cursor points to.
+
+        Invalid or tampered cursors return the first page.
+
+        Args:
+            cursor: Opaque token from a previous page, or None for the first page
+
+        Returns:
+            CursorPage instance
+        """
+        position = self._decode(cursor) if cursor else None
+        backwards = bool(position and position['b'])
+
+        rows = self._fetch(position['k'] if position else None, backwards)
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+
+        has_next = has_more if not backwards else True
+        has_previous = bool(position) if not backwards else has_more
+
+        total, total_is_estimate = self._count()
+        return CursorPage(
+            rows,
+            has_next=has_next and bool(rows),
+            has_previous=has_previous and bool(rows),
+            next_cursor=self._encode_cursor(rows[-1], backwards=False) if rows else None,
+            previous_cursor=self._encode_cursor(rows[0], backwards=True) if rows else None,
+            total=total,
+            total_is_estimate=total_is_estimate,
+        )
+
+    def _fetch(self, values, backwards) -> list:
+        """Up to per_page + 1 rows beyond the given sort key, in fetch order."""
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(self._beyond(values, backwards))
+
+        ordering = self._reversed_ordering() if backwards else self.ordering
+        return list(queryset.order_by(*ordering)[:self.per_page + 1])
+
+    def _count(self) -> tuple:
+        if self.count_limit is None:
+            return None, False
+        count = self.queryset.order_by()[:self.count_limit].count()
+        return count, count >= self.count_limit
+
+    def _reversed_ordering(self) -> tuple:
+        return tuple(field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering)
+
+    def _beyond(self, values, backwards) -> Q:
+        """Rows strictly after (or before, going backwards) the given key."""
+        terms = []
+        for index, (field, descending) in enumerate(self.keys):
+            equal = {name: values[i] for i, (name, _) in enumerate(self.keys[:index])}
+            lookup = 'lt' if descending != backwards else 'gt'
+            terms.append(Q(**equal, **{f'{field}__{lookup}': values[index]}))
+
+        # Inclusive range on the leading key lets the database seek the index
+        field, descending = self.keys[0]
+        leading = 'lte' if descending != backwards else 'gte'
+        return Q(**{f'{field}__{leading}': values[0]}) & reduce(or_, terms)
+
+    def _encode_cursor(self, row, *, backwards) -> str:
+        values = [_encode(getattr(row, field)) for field, _ in self.keys]
+        return signing.dumps({'k': values, 'b': backwards}, salt=self.salt, compress=True)
+
+    def _decode(self, cursor):
+        try:
+            position = signing.loads(cursor, salt=self.salt)
+        except signing.BadSignature:
+            return None
+        if not isinstance(position, dict) or len(position.get('k', ())) != len(self.keys):
+            return None
+        return position
\ No newline at end of file
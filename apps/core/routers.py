@@ -0,0 +1,76 @@
+"""
+Core routers module.
+Sends the reads made while serving a request to a read replica and every
+write, transaction and out-of-request query to the primary database.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Replica alias for reads in the current request (None reads the primary)
+_read_alias = ContextVar('read_alias', default=None)
+# Set once the current request writes; its later reads go to the primary
+_wrote = ContextVar('wrote', default=False)
+
+
+def get_replica_aliases() -> list:
+    """Aliases of the configured read replicas."""
+    return list(getattr(settings, 'REPLICA_DATABASES', []))
+
+
+@contextmanager
+def read_from(alias):
+    """
+    Route reads inside the block to the given database.
+
+    Args:
+        alias: Replica alias, or None to read from the primary
+    """
+    alias_token = _read_alias.set(alias)
+    wrote_token = _wrote.set(False)
+    try:
+        yield
+    finally:
+        _wrote.reset(wrote_token)
+        _read_alias.reset(alias_token)
+
+
+def has_written() -> bool:
+    """Whether anything was written to the primary inside the current block."""
+    return _wrote.get()
+
+
+class ReplicaRouter:
+    """
+    Database router for a primary with read replicas.
+
+    Reads use the replica chosen by ReplicaRoutingMiddleware for the current
+    request. They fall back to the primary outside requests (commands, the
+    task worker), inside transactions and after the request has written, so
+    services always see their own writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+        if alias is None or _wrote.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        _wrote.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *get_replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive schema changes through replication
+        if db in get_replica_aliases():
+            return False
+        return None
\ No newline at end of file
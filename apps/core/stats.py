@@ -0,0 +1,125 @@
+"""
+Core stats module.
+Computes status breakdowns with a single conditional-aggregation query,
+optionally served from the materialized StatusCounter table.
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F
+
+from .models import StatusCounter
+
+
+def counters_enabled() -> bool:
+    """
+    Check whether reads should be served from the materialized counters.
+
+    Returns:
+        Boolean from the STATS_COUNTERS_ENABLED setting
+    """
+    return getattr(settings, 'STATS_COUNTERS_ENABLED', False)
+
+
+class StatusBreakdown:
+    """
+    A named set of conditions counted together over one model.
+
+    Args:
+        scope: Counter scope name, e.g. 'pets.status'
+        model: Model class to count
+        conditions: Dict mapping counter key to a Q object
+    """
+
+    def __init__(self, *, scope: str, model, conditions: dict):
+        self.scope = scope
+        self.model = model
+        self.conditions = conditions
+
+    def compute(self) -> dict:
+        """
+        Count every condition in one aggregate query.
+
+        Returns:
+            Dict mapping counter key to count
+        """
+        return self.model.objects.aggregate(**{
+            key: Count('pk', filter=condition)
+            for key, condition in self.conditions.items()
+        })
+
+    def get(self) -> dict:
+        """
+        Get the breakdown, reading precomputed counters when enabled.
+
+        Counters are seeded from compute() the first time they are read.
+
+        Returns:
+            Dict mapping counter key to count
+        """
+        if not counters_enabled():
+            return self.compute()
+
+        counts = dict(
+            StatusCounter.objects.filter(scope=self.scope).values_list('key', 'value')
+        )
+        if not counts:
+            return self.rebuild()
+
+        return {key: counts.get(key, 0) for key in self.conditions}
+
+    @transaction.atomic
+    def rebuild(self) -> dict:
+        """
+        Recompute the breakdown and overwrite the stored counters.
+
+        Returns:
+            Dict mapping counter key to count
+        """
+        counts = self.compute()
+        for key, value in counts.items():
+            StatusCounter.objects.update_or_create(
+                scope=self.scope,
+                key=key,
+                defaults={'value': value}
+            )
+        return counts
+
+    def shift(self, *, old: str = None, new: str = None) -> None:
+        """
+        Move one row from the old counter key to the new one.
+
+        Must be called inside the transaction that performs the write.
+        Does nothing while counters are disabled or not yet seeded.
+
+        Args:
+            old: Previous key (None for a newly created row)
+            new: New key (None for a deleted row)
+        """
+        if not counters_enabled() or old == new:
+            return
+
+        counters = StatusCounter.objects.filter(scope=self.scope)
+        if old is not None:
+            counters.filter(key=old).update(value=F('value') - 1)
+        if new is not None:
+            counters.filter(key=new).update(value=F('value') + 1)
+
+    def add(self, counts: dict) -> None:
+        """
+        Apply a batch of changes to the counters.
+
+        Must be called inside the transaction that performs the write.
+        Does nothing while counters are disabled or not yet seeded.
+
+        Args:
+            counts: Dict mapping counter key to the number of rows added
+                (negative for rows that left the key)
+        """
+        if not counters_enabled():
+            return
+
+        counters = StatusCounter.objects.filter(scope=self.scope)
+        for key, amount in counts.items():
+            if amount:
+                counters.filter(key=key).update(value=F('value') + amount)
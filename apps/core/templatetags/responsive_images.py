@@ -0,0 +1,53 @@
+"""
+Template tags for responsive images.
+
+Usage:
+    {% load responsive_images %}
+    {% responsive_image pet.main_image alt=pet.name size='card' sizes='(max-width: 768px) 100vw, 33vw' %}
+"""
+
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from apps.core.images import get_derivatives, get_sizes
+
+register = template.Library()
+
+
+def _srcset(derivatives, fmt):
+    seen = set()
+    entries = []
+    for size in get_sizes():
+        derivative = derivatives.get((size, fmt))
+        if derivative and derivative['width'] not in seen:
+            seen.add(derivative['width'])
+            entries.append((derivative['url'], derivative['width']))
+    return format_html_join(', ', '{} {}w', entries)
+
+
+@register.simple_tag
+def responsive_image(image, alt='', size='card', sizes='100vw', css_class='', loading='lazy'):
+    """
+    Render a <picture> with WebP and JPEG srcsets for an ImageField.
+
+    Falls back to a plain <img> of the original upload when no derivatives
+    can be generated.
+    """
+    derivatives = get_derivatives(image)
+    fallback = derivatives.get((size, 'jpeg'))
+
+    if not fallback:
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="{}">',
+            image.url, alt, css_class, loading
+        )
+
+    return format_html(
+        '<picture>'
+        '<source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}" width="{}" height="{}" alt="{}" class="{}" loading="{}" decoding="async">'
+        '</picture>',
+        _srcset(derivatives, 'webp'), sizes,
+        fallback['url'], _srcset(derivatives, 'jpeg'), sizes,
+        fallback['width'], fallback['height'], alt, css_class, loading
+    )
@@ -3,13 +3,28 @@ Core utilities module.
 Contains utility functions used across the application.
 """
 
+from functools import reduce
+from operator import or_
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.utils.text import slugify as django_slugify
 
+# Bases looked up per query; keeps the OR chain under SQLite's expression depth limit
+SLUG_LOOKUP_BATCH = 300
+
+# Inserts retried with a fresh slug when a concurrent insert takes it first
+SLUG_ATTEMPTS = 5
+
 
 def generate_unique_slug(model_class, title, slug_field='slug'):
     """
     Generate a unique slug for a model instance.
     
+    Uses a single indexed query however many numbered variants exist.
+    The slug can still be taken by a concurrent insert before it is saved;
+    use save_with_unique_slug to retry in that case.
+    
     Args:
         model_class: The model class
         title: The title to slugify
@@ -18,15 +33,84 @@ def generate_unique_slug(model_class, title, slug_field='slug'):
     Returns:
         A unique slug string
     """
-    slug = django_slugify(title)
-    unique_slug = slug
-    num = 1
+    return allocate_unique_slugs(model_class, [title], slug_field=slug_field)[0]
+
+
+def save_with_unique_slug(instance, title, save, slug_field='slug'):
+    """
+    Assign a unique slug to a new instance and save it, retrying on collision.
+    
+    Each attempt runs in a savepoint, so a lost race does not break the
+    caller's transaction. Integrity errors not caused by the slug are
+    raised immediately.
+    
+    Args:
+        instance: Unsaved model instance
+        title: The title to slugify
+        save: Callable that performs the actual save
+        slug_field: The name of the slug field (default: 'slug')
+    """
+    model_class = type(instance)
+    for attempt in range(SLUG_ATTEMPTS):
+        slug = generate_unique_slug(model_class, title, slug_field=slug_field)
+        setattr(instance, slug_field, slug)
+        try:
+            with transaction.atomic():
+                save()
+            return
+        except IntegrityError:
+            collided = model_class.objects.filter(**{slug_field: slug}).exists()
+            if not collided or attempt == SLUG_ATTEMPTS - 1:
+                raise
+
+
+def allocate_unique_slugs(model_class, titles, slug_field='slug'):
+    """
+    Generate unique slugs for many new instances at once.
+    
+    Follows the same 'title', 'title-1', 'title-2' scheme as
+    generate_unique_slug, but looks up the taken slugs of every base in
+    one indexed query per SLUG_LOOKUP_BATCH distinct titles instead of
+    one query per collision.
+    
+    Args:
+        model_class: The model class
+        titles: Iterable of titles to slugify, one per new instance
+        slug_field: The name of the slug field (default: 'slug')
+    
+    Returns:
+        List of unique slug strings, in the same order as titles
+    """
+    bases = [django_slugify(title) for title in titles]
+    distinct = sorted(set(bases))
+    
+    taken = set()
+    for start in range(0, len(distinct), SLUG_LOOKUP_BATCH):
+        batch = distinct[start:start + SLUG_LOOKUP_BATCH]
+        # Numbered variants sort between 'base-0' and 'base-:'
+        condition = Q(**{f'{slug_field}__in': batch}) | reduce(or_, [
+            Q(**{f'{slug_field}__gte': f'{base}-0', f'{slug_field}__lt': f'{base}-:'})
+            for base in batch
+        ])
+        taken.update(
+            model_class.objects.filter(condition).order_by().values_list(slug_field, flat=True)
+        )
     
-    while model_class.objects.filter(**{slug_field: unique_slug}).exists():
-        unique_slug = f'{slug}-{num}'
-        num += 1
+    next_number = {}
+    slugs = []
+    for base in bases:
+        if base not in taken:
+            unique_slug = base
+        else:
+            num = next_number.get(base, 1)
+            while f'{base}-{num}' in taken:
+                num += 1
+            unique_slug = f'{base}-{num}'
+            next_number[base] = num + 1
+        taken.add(unique_slug)
+        slugs.append(unique_slug)
     
-    return unique_slug
+    return slugs
 
 
 def is_admin_user(user):
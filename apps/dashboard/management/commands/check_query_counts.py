@@ -0,0 +1,135 @@
+"""
+Query-count regression check for the dashboard list pages.
+
+Renders each page with a single matching row and again with a full page of
+rows, and fails if the number of SQL queries changes with the page size.
+All fixture data is created inside a transaction that is rolled back.
+"""
+
+import uuid
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+from apps.adoptions.models import AdoptionApplication
+from apps.contact.models import ContactMessage
+from apps.pets.models import Pet
+
+
+PAGES = [
+    'dashboard:pets',
+    'dashboard:applications',
+    'dashboard:contacts',
+]
+
+FULL_PAGE_ROWS = 15
+
+
+class Command(BaseCommand):
+    help = 'Fail if dashboard list pages run more queries as their page fills up'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-queries',
+            type=int,
+            default=None,
+            help='Also fail if any page runs more than this many queries'
+        )
+
+    def handle(self, *args, **options):
+        self.marker = f'zzqc{uuid.uuid4().hex[:8]}'
+        setup_test_environment()
+        try:
+            with transaction.atomic():
+                results = self._measure()
+                transaction.set_rollback(True)
+        finally:
+            teardown_test_environment()
+
+        failures = []
+        for page, (small, full) in results.items():
+            self.stdout.write(f'{page}: {small} queries with 1 row, {full} with a full page')
+            if small != full:
+                failures.append(f'{page} runs {full - small:+d} queries on a full page')
+            if options['max_queries'] is not None and full > options['max_queries']:
+                failures.append(f'{page} runs {full} queries (budget {options["max_queries"]})')
+
+        if failures:
+            raise CommandError('\n'.join(failures))
+
+        self.stdout.write(self.style.SUCCESS('Query counts are independent of page size.'))
+
+    def _measure(self) -> dict:
+        user = get_user_model().objects.create_user(
+            username=self.marker,
+            password=uuid.uuid4().hex,
+            is_staff=True
+        )
+        client = Client()
+        client.force_login(user)
+
+        self._seed(1)
+        small = {page: self._count_queries(client, page) for page in PAGES}
+
+        self._seed(FULL_PAGE_ROWS)
+        full = {page: self._count_queries(client, page) for page in PAGES}
+
+        return {page: (small[page], full[page]) for page in PAGES}
+
+    def _count_queries(self, client, page) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(reverse(page), {'search': self.marker})
+        if response.status_code != 200:
+            raise CommandError(f'{page} returned HTTP {response.status_code}')
+        return len(context)
+
+    def _seed(self, count):
+        start = Pet.objects.filter(name__startswith=self.marker).count()
+        pets = Pet.objects.bulk_create([
+            Pet(
+                name=f'{self.marker} {start + i}',
+                slug=f'{self.marker}-{start + i}',
+                type='dog',
+                breed='Mixed',
+                age='2 years',
+                gender='Male',
+                size='Medium',
+                color='Brown',
+                description='Query count fixture',
+                arrival_date=date.today(),
+                adoption_fee=0,
+            )
+            for i in range(count)
+        ])
+        AdoptionApplication.objects.bulk_create([
+            AdoptionApplication(
+                pet=pet,
+                first_name=self.marker,
+                last_name=status,
+                email=f'{self.marker}@example.com',
+                phone='5551234567',
+                address='1 Fixture Way',
+                housing_type='house',
+                own_or_rent='own',
+                household_adults=1,
+                previous_pet_experience='Query count fixture',
+                reason_for_adoption='Query count fixture',
+                status=status,
+            )
+            for pet in pets
+            for status in ('pending', 'rejected')
+        ])
+        ContactMessage.objects.bulk_create([
+            ContactMessage(
+                name=self.marker,
+                email=f'{self.marker}@example.com',
+                subject='Query count fixture',
+                message='Query count fixture',
+            )
+            for _ in range(count)
+        ])
@@ -3,9 +3,9 @@ Dashboard app services.
 Contains business logic for dashboard operations.
 """
 
-from apps.pets.models import Pet
-from apps.adoptions.models import AdoptionApplication
-from apps.contact.models import ContactMessage
+from apps.pets.selectors import get_pet_status_counts
+from apps.adoptions.selectors import get_application_status_counts
+from apps.contact.selectors import get_contact_message_counts
 
 
 class DashboardStatsService:
@@ -16,12 +16,19 @@ class DashboardStatsService:
         """
         Get dashboard statistics.
         
+        Each model's breakdown is a single aggregate query, or a counters
+        lookup when STATS_COUNTERS_ENABLED is set.
+        
         Returns:
             Dict with dashboard stats
         """
+        pet_counts = get_pet_status_counts()
+        application_counts = get_application_status_counts()
+        message_counts = get_contact_message_counts()
+        
         return {
-            'pending_applications': AdoptionApplication.objects.filter(status='pending').count(),
-            'available_pets': Pet.objects.filter(status='available').count(),
-            'total_adopted': Pet.objects.filter(status='adopted').count(),
-            'unread_messages': ContactMessage.objects.filter(is_read=False).count(),
+            'pending_applications': application_counts['pending'],
+            'available_pets': pet_counts['available'],
+            'total_adopted': pet_counts['adopted'],
+            'unread_messages': message_counts['unread'],
         }
\ No newline at end of file
@@ -9,10 +9,15 @@ from .views import (
     application_detail,
     update_application_status,
     update_application_notes,
+    export_applications,
+    bulk_update_applications,
     pets_list,
     contacts_list,
     contact_detail,
     update_contact_status,
+    export_contacts,
+    performance_report,
+    reset_performance_report,
 )
 
 app_name = 'dashboard'
@@ -23,6 +28,8 @@ urlpatterns = [
     
     # Applications management
     path('applications/', applications_list, name='applications'),
+    path('applications/export/', export_applications, name='export_applications'),
+    path('applications/bulk-update/', bulk_update_applications, name='bulk_update_applications'),
     path('applications/<int:application_id>/', application_detail, name='application_detail'),
     path('applications/<int:application_id>/update-status/', update_application_status, name='update_application_status'),
     path('applications/<int:application_id>/update-notes/', update_application_notes, name='update_application_notes'),
@@ -32,6 +39,11 @@ urlpatterns = [
     
     # Contacts management
     path('contacts/', contacts_list, name='contacts'),
+    path('contacts/export/', export_contacts, name='export_contacts'),
     path('contacts/<int:contact_id>/', contact_detail, name='contact_detail'),
     path('contacts/<int:contact_id>/update-status/', update_contact_status, name='update_contact_status'),
+    
+    # Request performance report
+    path('performance/', performance_report, name='performance'),
+    path('performance/reset/', reset_performance_report, name='reset_performance'),
 ]
\ No newline at end of file
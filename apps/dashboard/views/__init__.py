@@ -1,7 +1,8 @@
 from .dashboard import dashboard_home
-from .applications import applications_list, application_detail, update_application_status, update_application_notes
-from .contacts import contacts_list, contact_detail, update_contact_status
+from .applications import applications_list, application_detail, update_application_status, update_application_notes, export_applications, bulk_update_applications
+from .contacts import contacts_list, contact_detail, update_contact_status, export_contacts
 from .pets import pets_list
+from .performance import performance_report, reset_performance_report
 
 __all__ = [
     'dashboard_home',
@@ -9,8 +10,13 @@ __all__ = [
     'application_detail', 
     'update_application_status',
     'update_application_notes',
+    'export_applications',
+    'bulk_update_applications',
     'contacts_list',
     'contact_detail',
     'update_contact_status',
+    'export_contacts',
     'pets_list',
+    'performance_report',
+    'reset_performance_report',
 ]
\ No newline at end of file
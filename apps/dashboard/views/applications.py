@@ -4,19 +4,40 @@ Dashboard app - application management views.
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
-from django.core.paginator import Paginator
 from django.utils import timezone
+from django.utils.http import url_has_allowed_host_and_scheme
 
 from apps.adoptions.models import AdoptionApplication
 from apps.adoptions.selectors import filter_applications, get_application_by_id
-from apps.adoptions.services import AdoptionApplicationService
+from apps.adoptions.services import AdoptionApplicationService, ApplicationTransitionError
+from apps.core.pagination import CursorPaginator
+from apps.core.streaming import streaming_csv_response
 from ..decorators import admin_required
 
+APPLICATION_STATUSES = ['pending', 'approved', 'rejected', 'completed']
 
-@admin_required
-def applications_list(request):
-    """Admin view for managing all applications"""
-    # Build filters
+EXPORT_FIELDS = (
+    'id',
+    'submitted_at',
+    'status',
+    'pet_id',
+    'pet__name',
+    'first_name',
+    'last_name',
+    'email',
+    'phone',
+    'address',
+    'housing_type',
+    'own_or_rent',
+    'landlord_approval',
+    'household_adults',
+    'household_children',
+    'has_other_pets',
+    'reviewed_at',
+)
+
+
+def _build_filters(request):
     filters = {}
     
     if status_filter := request.GET.get('status'):
@@ -25,22 +46,41 @@ def applications_list(request):
     if search_query := request.GET.get('search'):
         filters['search'] = search_query
     
-    applications = filter_applications(filters=filters if filters else None)
+    return filters if filters else None
+
+
+@admin_required
+def applications_list(request):
+    """Admin view for managing all applications"""
+    applications = filter_applications(filters=_build_filters(request))
     
-    # Pagination
-    paginator = Paginator(applications, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Keyset pagination with a capped count
+    paginator = CursorPaginator(applications, 10, ordering=('-submitted_at', '-id'), count_limit=1000)
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     
     context = {
         'applications': page_obj,
-        'total_applications': applications.count(),
+        'total_applications': page_obj.total,
+        'total_is_estimate': page_obj.total_is_estimate,
         'is_paginated': page_obj.has_other_pages(),
         'page_obj': page_obj,
     }
     return render(request, 'dashboard/admin_applications.html', context)
 
 
+@admin_required
+def export_applications(request):
+    """Stream all applications matching the list filters as CSV"""
+    rows = (
+        filter_applications(filters=_build_filters(request))
+        .order_by('-submitted_at', '-id')
+        .values_list(*EXPORT_FIELDS)
+        .iterator(chunk_size=2000)
+    )
+    filename = f'applications-{timezone.localdate():%Y-%m-%d}.csv'
+    return streaming_csv_response(filename, EXPORT_FIELDS, rows)
+
+
 @admin_required
 def application_detail(request, application_id):
     """Detailed view of a single application"""
@@ -59,15 +99,22 @@ def update_application_status(request, application_id):
         application = get_application_by_id(application_id=application_id)
         new_status = request.POST.get('status')
         
-        if new_status in ['pending', 'approved', 'rejected', 'completed']:
-            AdoptionApplicationService.update_application_status(
-                application=application,
-                status=new_status
-            )
-            messages.success(
-                request,
-                f'Application status updated to {application.get_status_display()}'
-            )
+        version = request.POST.get('version', '')
+        
+        if new_status in APPLICATION_STATUSES:
+            try:
+                AdoptionApplicationService.update_application_status(
+                    application=application,
+                    status=new_status,
+                    version=int(version) if version.isdigit() else None
+                )
+            except ApplicationTransitionError as error:
+                messages.error(request, str(error))
+            else:
+                messages.success(
+                    request,
+                    f'Application status updated to {application.get_status_display()}'
+                )
         else:
             messages.error(request, 'Invalid status')
     
@@ -79,6 +126,41 @@ def update_application_status(request, application_id):
         return redirect('dashboard:applications')
 
 
+@admin_required
+def bulk_update_applications(request):
+    """Change the status of all selected applications at once"""
+    if request.method == 'POST':
+        application_ids = [pk for pk in request.POST.getlist('application_ids') if pk.isdigit()]
+        new_status = request.POST.get('status')
+        
+        if new_status not in APPLICATION_STATUSES:
+            messages.error(request, 'Invalid status')
+        elif not application_ids:
+            messages.error(request, 'No applications selected')
+        else:
+            result = AdoptionApplicationService.bulk_update_status(
+                application_ids=application_ids,
+                status=new_status
+            )
+            summary = f"{result['updated']} application(s) updated to {new_status.title()}"
+            if result['auto_rejected']:
+                summary += f", {result['auto_rejected']} other pending application(s) rejected"
+            messages.success(request, summary)
+            if result['skipped']:
+                messages.warning(
+                    request,
+                    f"{result['skipped']} application(s) skipped: the change is not allowed "
+                    f"from their status or their pet is already adopted"
+                )
+    
+    next_url = request.POST.get('next')
+    if next_url and url_has_allowed_host_and_scheme(
+        next_url, allowed_hosts={request.get_host()}, require_https=request.is_secure()
+    ):
+        return redirect(next_url)
+    return redirect('dashboard:applications')
+
+
 @admin_required
 def update_application_notes(request, application_id):
     """Update admin notes for an application"""
@@ -4,18 +4,29 @@ Dashboard app - contact message management views.
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
-from django.core.paginator import Paginator
+from django.utils import timezone
 
 from apps.contact.models import ContactMessage
 from apps.contact.selectors import filter_contact_messages, get_contact_message_by_id
 from apps.contact.services import ContactMessageService
+from apps.core.pagination import CursorPaginator
+from apps.core.streaming import streaming_csv_response
 from ..decorators import admin_required
 
+EXPORT_FIELDS = (
+    'id',
+    'created_at',
+    'name',
+    'email',
+    'phone',
+    'subject',
+    'message',
+    'is_read',
+    'is_responded',
+)
 
-@admin_required
-def contacts_list(request):
-    """Admin view for managing contact messages"""
-    # Build filters
+
+def _build_filters(request):
     filters = {}
     
     if read_filter := request.GET.get('read'):
@@ -24,22 +35,41 @@ def contacts_list(request):
     if search_query := request.GET.get('search'):
         filters['search'] = search_query
     
-    contacts = filter_contact_messages(filters=filters if filters else None)
+    return filters if filters else None
+
+
+@admin_required
+def contacts_list(request):
+    """Admin view for managing contact messages"""
+    contacts = filter_contact_messages(filters=_build_filters(request))
     
-    # Pagination
-    paginator = Paginator(contacts, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Keyset pagination with a capped count
+    paginator = CursorPaginator(contacts, 10, ordering=('-created_at', '-id'), count_limit=1000)
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     
     context = {
         'contacts': page_obj,
-        'total_contacts': contacts.count(),
+        'total_contacts': page_obj.total,
+        'total_is_estimate': page_obj.total_is_estimate,
         'is_paginated': page_obj.has_other_pages(),
         'page_obj': page_obj,
     }
     return render(request, 'dashboard/admin_contacts.html', context)
 
 
+@admin_required
+def export_contacts(request):
+    """Stream all contact messages matching the list filters as CSV"""
+    rows = (
+        filter_contact_messages(filters=_build_filters(request))
+        .order_by('-created_at', '-id')
+        .values_list(*EXPORT_FIELDS)
+        .iterator(chunk_size=2000)
+    )
+    filename = f'contact-messages-{timezone.localdate():%Y-%m-%d}.csv'
+    return streaming_csv_response(filename, EXPORT_FIELDS, rows)
+
+
 @admin_required
 def contact_detail(request, contact_id):
     """Detailed view of a contact message"""
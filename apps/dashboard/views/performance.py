@@ -0,0 +1,32 @@
+"""
+Dashboard app - request performance report views.
+"""
+
+from django.conf import settings
+from django.contrib import messages
+from django.shortcuts import render, redirect
+
+from apps.core.instrumentation import report
+from ..decorators import admin_required
+
+
+@admin_required
+def performance_report(request):
+    """Rolling per-view query and timing report for this process"""
+    context = {
+        'enabled': getattr(settings, 'QUERY_INSTRUMENTATION_ENABLED', False),
+        'rows': report.summary(),
+        'sample_size': len(report.records),
+        'budgets': getattr(settings, 'QUERY_BUDGETS', {}),
+    }
+    return render(request, 'dashboard/admin_performance.html', context)
+
+
+@admin_required
+def reset_performance_report(request):
+    """Clear the rolling performance report"""
+    if request.method == 'POST':
+        report.clear()
+        messages.success(request, 'Performance report cleared')
+    
+    return redirect('dashboard:performance')
@@ -4,6 +4,7 @@ Pets app admin.
 
 from django.contrib import admin
 from .models import Pet, SuccessStory
+from .services import PetService
 
 
 @admin.register(Pet)
@@ -33,6 +34,11 @@ class PetAdmin(admin.ModelAdmin):
             'fields': ('status', 'arrival_date', 'adoption_fee', 'featured')
         }),
     )
+    
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Keep the trait filter links in step with the edited personality list
+        PetService.sync_traits(pets=[obj])
 
 
 @admin.register(SuccessStory)
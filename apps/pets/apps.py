@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 class PetsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.pets'
-    label = 'pets'
\ No newline at end of file
+    label = 'pets'
+    
+    def ready(self):
+        from . import signals
+        
+        post_migrate.connect(signals.reinstall_search_triggers, sender=self)
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Pets app caching.
+Caches the homepage featured-pets block and stats, and tracks when the
+catalog last changed for conditional GETs.
+"""
+
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import F, Max
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from apps.core.cache import get_or_build, invalidate
+from apps.core.models import StatusCounter
+from .index import bump_catalog_version, get_catalog_version
+from .models import Pet, SuccessStory
+from .selectors import get_featured_pets, get_pet_stats
+
+HOME_FEATURED_KEY = 'pets:home:featured'
+HOME_STATS_KEY = 'pets:home:stats'
+CATALOG_CHANGED_KEY = 'pets:catalog:changed'
+
+# StatusCounter row counting catalog writes; its updated_at is the last change
+CATALOG_CHANGES = {'scope': 'pets.catalog', 'key': 'changes'}
+
+
+def _cache_options() -> dict:
+    return {
+        'alias': getattr(settings, 'HOME_CACHE_ALIAS', 'default'),
+        'timeout': getattr(settings, 'HOME_CACHE_TIMEOUT', 60 * 15),
+    }
+
+
+def get_home_featured_html() -> str:
+    """
+    Get the rendered featured-pets block for the homepage.
+
+    Returns:
+        Rendered HTML
+    """
+    def build():
+        return render_to_string(
+            'pets/partials/featured_pets.html',
+            {'featured_pets': get_featured_pets(limit=3)}
+        )
+
+    return get_or_build(HOME_FEATURED_KEY, build, **_cache_options())
+
+
+def get_home_stats() -> dict:
+    """
+    Get the homepage stats.
+
+    Returns:
+        Dict with pet statistics
+    """
+    return get_or_build(HOME_STATS_KEY, get_pet_stats, **_cache_options())
+
+
+def get_catalog_last_modified() -> datetime:
+    """
+    Get when pets or success stories last changed.
+
+    Read from a change stamp in the database, which invalidate_home_cache
+    bumps on every catalog write (deletes included), so every process sees
+    writes made by any other. The stamp is cached per catalog version for
+    CATALOG_CHANGED_MAX_AGE seconds: writes in this process are seen at
+    once, writes elsewhere within that bound.
+
+    Returns:
+        Aware datetime
+    """
+    return caches[_cache_options()['alias']].get_or_set(
+        f'{CATALOG_CHANGED_KEY}:{get_catalog_version()}',
+        _read_catalog_change,
+        getattr(settings, 'CATALOG_CHANGED_MAX_AGE', 5)
+    )
+
+
+def _read_catalog_change() -> datetime:
+    """Read the change stamp, seeding it from the newest updated_at."""
+    # The primary: a lagging replica would validate pages that are already stale
+    stamps = StatusCounter.objects.using(DEFAULT_DB_ALIAS).filter(**CATALOG_CHANGES)
+    changed = stamps.values_list('updated_at', flat=True).first()
+    if changed is not None:
+        return changed
+
+    latest = [
+        Pet.objects.aggregate(latest=Max('updated_at'))['latest'],
+        SuccessStory.objects.aggregate(latest=Max('updated_at'))['latest'],
+    ]
+    changed = max(filter(None, latest), default=datetime(2000, 1, 1, tzinfo=dt_timezone.utc))
+    _, created = StatusCounter.objects.get_or_create(**CATALOG_CHANGES)
+    if created:
+        stamps.update(updated_at=changed)
+    return changed
+
+
+def _record_catalog_change() -> None:
+    """Bump the catalog change stamp."""
+    stamps = StatusCounter.objects.filter(**CATALOG_CHANGES)
+    if not stamps.update(value=F('value') + 1, updated_at=timezone.now()):
+        StatusCounter.objects.get_or_create(**CATALOG_CHANGES, defaults={'value': 1})
+
+
+def invalidate_home_stats() -> None:
+    """Drop the cached homepage stats, for writes that only change the counts."""
+    invalidate(HOME_STATS_KEY, alias=_cache_options()['alias'])
+
+
+def invalidate_home_cache() -> None:
+    """Drop the cached homepage blocks and record that the catalog changed."""
+    invalidate(HOME_FEATURED_KEY, HOME_STATS_KEY, alias=_cache_options()['alias'])
+    _record_catalog_change()
+    bump_catalog_version()
\ No newline at end of file
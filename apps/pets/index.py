@@ -0,0 +1,345 @@
+"""
+Pets app index.
+Per-process in-memory index of the available pets: one bitset per filter
+value and trait, and the pet order for each catalog sorting, so the pet browser can
+filter, count and pick a page of ids without querying the database.
+"""
+
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import reduce
+from operator import and_, or_
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.core.pagination import CursorPaginator
+from .models import AGE_SORT_KEYS, Pet, PetTrait, Trait
+
+CATALOG_VERSION_KEY = 'pets:catalog:version'
+
+# Columns read for every pet besides the sort fields
+VALUE_FIELDS = ('type', 'size', 'gender', 'special_needs', 'age_months')
+# Fields with one bitset per value ('age_group' is derived from age_months)
+BITSET_FIELDS = ('type', 'size', 'gender', 'special_needs', 'age_group')
+# Fields and annotations the catalog orderings sort on
+SORT_FIELDS = ('id', 'name', 'arrival_date', *AGE_SORT_KEYS)
+
+_index = None
+_lock = threading.Lock()
+
+
+def index_enabled() -> bool:
+    """
+    Check whether the catalog should be served from the in-memory index.
+
+    Returns:
+        Boolean from the PET_INDEX_ENABLED setting
+    """
+    return getattr(settings, 'PET_INDEX_ENABLED', False)
+
+
+def get_catalog_version() -> int:
+    """
+    Get the catalog version, bumped on every pet write.
+
+    Returns:
+        Version number
+    """
+    return cache.get_or_set(CATALOG_VERSION_KEY, 0, None)
+
+
+def bump_catalog_version() -> None:
+    """Mark every process's index as out of date."""
+    cache.add(CATALOG_VERSION_KEY, 0, None)
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(CATALOG_VERSION_KEY, 1, None)
+
+
+def _bitset(positions, size: int) -> int:
+    """Build an int with the given bit positions set."""
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+class AvailablePetIndex:
+    """
+    Snapshot of the available pets for filtering, counting and paging.
+
+    Pets are numbered by (arrival_date, id), so bit n of every bitset is the
+    n-th earliest arrival and recent arrivals form one contiguous range.
+    Text sorts by code point, as SQLite compares it.
+
+    Args:
+        rows: Value dicts with the SORT_FIELDS and VALUE_FIELDS, in
+            (arrival_date, id) order
+        trait_links: Iterable of (pet_id, trait_slug) pairs
+        trait_names: Dict mapping trait slug to name
+        version: Catalog version the rows were read at
+    """
+
+    def __init__(self, rows, *, trait_links=(), trait_names=None, version: int):
+        rows = list(rows)
+        for row in rows:
+            row['age_group'] = Pet.get_age_group(row['age_months'])
+        self.version = version
+        self.built_at = time.monotonic()
+        self.size = len(rows)
+        self.all = (1 << self.size) - 1
+        self.values = {field: [row[field] for row in rows] for field in SORT_FIELDS}
+        self.ids = array('q', self.values['id'])
+
+        self.bitsets = {}
+        for field in BITSET_FIELDS:
+            positions = {}
+            for position, row in enumerate(rows):
+                positions.setdefault(row[field], []).append(position)
+            self.bitsets[field] = {
+                value: _bitset(members, self.size) for value, members in positions.items()
+            }
+
+        position_of = {pet_id: position for position, pet_id in enumerate(self.ids)}
+        trait_positions = {}
+        for pet_id, slug in trait_links:
+            if pet_id in position_of:
+                trait_positions.setdefault(slug, []).append(position_of[pet_id])
+        self.bitsets['trait'] = {
+            slug: _bitset(members, self.size) for slug, members in trait_positions.items()
+        }
+        self.trait_names = {**{slug: slug for slug in trait_positions}, **(trait_names or {})}
+        self._orders = {}
+
+    @property
+    def age(self) -> float:
+        """Seconds since the index was built."""
+        return time.monotonic() - self.built_at
+
+    def bits(self, field: str, value) -> int:
+        """
+        Get the pets with the given field value.
+
+        Args:
+            field: One of BITSET_FIELDS, or 'trait' (by slug)
+            value: Field value
+
+        Returns:
+            Bitset of matching positions
+        """
+        return self.bitsets[field].get(value, 0)
+
+    def arrived_since(self, day) -> int:
+        """
+        Get the pets that arrived on or after a date.
+
+        Args:
+            day: Earliest arrival date
+
+        Returns:
+            Bitset of matching positions
+        """
+        first = bisect_left(self.values['arrival_date'], day)
+        return self.all ^ ((1 << first) - 1)
+
+    def conditions(self, filters: dict) -> dict:
+        """
+        Build one bitset per catalog filter, like the selectors' SQL conditions.
+
+        Args:
+            filters: Dict of filter parameters (without 'search')
+
+        Returns:
+            Dict mapping facet name to a bitset, for the filters that are set
+        """
+        conditions = {}
+        if filters.get('type') and filters['type'] != 'all':
+            conditions['type'] = self.bits('type', filters['type'])
+        if filters.get('sizes'):
+            conditions['size'] = reduce(or_, (self.bits('size', size) for size in filters['sizes']), 0)
+        if filters.get('gender'):
+            conditions['gender'] = self.bits('gender', filters['gender'])
+        if filters.get('ages'):
+            conditions['age'] = reduce(or_, (self.bits('age_group', key) for key in filters['ages']), 0)
+        if filters.get('traits'):
+            traits = [self.bits('trait', slug) for slug in filters['traits']]
+            if filters.get('trait_match') == 'any':
+                conditions['traits'] = reduce(or_, traits, 0)
+            else:
+                conditions['traits'] = reduce(and_, traits, self.all)
+        if filters.get('special_needs'):
+            conditions['special_needs'] = self.bits('special_needs', True)
+        if filters.get('new_arrivals'):
+            conditions['new_arrivals'] = self.arrived_since(Pet.new_arrival_cutoff())
+        return conditions
+
+    def match(self, conditions: dict, *, exclude: str = None) -> int:
+        """
+        Combine filter bitsets.
+
+        Args:
+            conditions: Dict from conditions()
+            exclude: Facet name to leave out
+
+        Returns:
+            Bitset of pets matching every other condition
+        """
+        mask = self.all
+        for name, bits in conditions.items():
+            if name != exclude:
+                mask &= bits
+        return mask
+
+    def count(self, mask: int) -> int:
+        """Number of pets in a bitset."""
+        return mask.bit_count()
+
+    def page(self, mask: int, *, ordering, after=None, backwards=False, limit: int) -> list:
+        """
+        Get the ids of matching pets following a sort key.
+
+        Args:
+            mask: Bitset of pets to consider
+            ordering: Ordering fields, e.g. ('-arrival_date', '-id')
+            after: Sort key values to continue from (None starts at the top)
+            backwards: Walk towards the top of the ordering instead
+            limit: Maximum number of ids
+
+        Returns:
+            List of pet ids, in walking order
+        """
+        keys, positions = self._order(tuple(ordering))
+        if after is None:
+            start = len(keys) - 1 if backwards else 0
+        else:
+            key = self._key(ordering, [
+                value if field.lstrip('-') in AGE_SORT_KEYS
+                else Pet._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(ordering, after)
+            ])
+            start = bisect_left(keys, key) - 1 if backwards else bisect_right(keys, key)
+
+        members = mask.to_bytes((self.size + 7) // 8, 'little')
+        step = -1 if backwards else 1
+        ids = []
+        while 0 <= start < len(positions) and len(ids) < limit:
+            position = positions[start]
+            if members[position >> 3] >> (position & 7) & 1:
+                ids.append(self.ids[position])
+            start += step
+        return ids
+
+    def _order(self, ordering: tuple) -> tuple:
+        """Sorted keys and positions for an ordering, computed on first use."""
+        if ordering not in self._orders:
+            keyed = sorted(
+                (self._key(ordering, [self.values[field.lstrip('-')][position] for field in ordering]), position)
+                for position in range(self.size)
+            )
+            self._orders[ordering] = ([key for key, _ in keyed], array('l', (p for _, p in keyed)))
+        return self._orders[ordering]
+
+    @staticmethod
+    def _key(ordering, values) -> tuple:
+        """Sort key that orders ascending; descending fields must be dates or numbers."""
+        key = []
+        for field, value in zip(ordering, values):
+            if field.startswith('-'):
+                value = -(value.toordinal() if hasattr(value, 'toordinal') else value)
+            key.append(value)
+        return tuple(key)
+
+
+def build_index(*, version: int) -> AvailablePetIndex:
+    """
+    Read the available pets into a new index.
+
+    Args:
+        version: Catalog version read before the rows
+
+    Returns:
+        AvailablePetIndex instance
+    """
+    # Always the primary: a lagging replica would pin stale rows to this version
+    rows = (
+        Pet.objects.using(DEFAULT_DB_ALIAS)
+        .filter(status='available')
+        .order_by('arrival_date', 'id')
+        .annotate(**AGE_SORT_KEYS)
+        .values(*SORT_FIELDS, *VALUE_FIELDS)
+    )
+    links = (
+        PetTrait.objects.using(DEFAULT_DB_ALIAS)
+        .filter(pet__status='available')
+        .values_list('pet_id', 'trait__slug')
+    )
+    names = dict(Trait.objects.using(DEFAULT_DB_ALIAS).values_list('slug', 'name'))
+    return AvailablePetIndex(rows, trait_links=links, trait_names=names, version=version)
+
+
+def get_available_pet_index():
+    """
+    Get this process's index of available pets.
+
+    Rebuilt when the catalog version changes or the index is older than
+    PET_INDEX_MAX_AGE seconds, which bounds staleness when the cache is not
+    shared between processes.
+
+    Returns:
+        AvailablePetIndex instance, or None when the index is disabled
+    """
+    global _index
+    if not index_enabled():
+        return None
+
+    max_age = getattr(settings, 'PET_INDEX_MAX_AGE', 60)
+    version = get_catalog_version()
+    index = _index
+    if index is None or index.version != version or index.age > max_age:
+        with _lock:
+            index = _index
+            if index is None or index.version != version or index.age > max_age:
+                index = _index = build_index(version=version)
+    return index
+
+
+class IndexedCursorPaginator(CursorPaginator):
+    """
+    CursorPaginator that walks an AvailablePetIndex instead of the table.
+
+    Cursors are interchangeable with CursorPaginator's for the same
+    ordering; only the rows on the page are read, by primary key.
+
+    Args:
+        index: AvailablePetIndex instance
+        mask: Bitset of the pets to paginate
+        queryset: Available pets queryset the page rows are read from
+        per_page: Number of rows per page
+        ordering: Ordering fields, e.g. ('-arrival_date', '-id')
+    """
+
+    def __init__(self, index: AvailablePetIndex, mask: int, queryset, per_page: int, *, ordering):
+        super().__init__(queryset, per_page, ordering=ordering)
+        self.index = index
+        self.mask = mask
+
+    def _fetch(self, values, backwards) -> list:
+        ids = self.index.page(
+            self.mask,
+            ordering=self.ordering,
+            after=values,
+            backwards=backwards,
+            limit=self.per_page + 1
+        )
+        pets = self.queryset.in_bulk(ids)
+        # Pets changed since the index was built are skipped
+        return [pets[pk] for pk in ids if pk in pets]
+
+    def _count(self) -> tuple:
+        return self.index.count(self.mask), False
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Export pets to a CSV or JSON Lines file without loading the table into memory.
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand
+
+from apps.pets.bulk import FORMATS, detect_format, iter_export_lines
+from apps.pets.models import Pet
+
+
+class Command(BaseCommand):
+    help = 'Stream pets to a CSV or JSONL file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-', help="Output file, or '-' for stdout")
+        parser.add_argument('--format', choices=FORMATS, help='File format (default: from the extension, else csv)')
+        parser.add_argument('--status', help='Only export pets with this status')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows fetched from the database at a time')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or detect_format(path)
+
+        queryset = Pet.objects.all()
+        if options['status']:
+            queryset = queryset.filter(status=options['status'])
+
+        lines = iter_export_lines(queryset, fmt, chunk_size=options['chunk_size'])
+        if path == '-':
+            sys.stdout.writelines(lines)
+            return
+
+        with open(path, 'w', newline='', encoding='utf-8') as output:
+            output.writelines(lines)
+        self.stderr.write(self.style.SUCCESS(f'Exported pets to {path}.'))
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+Generate responsive image derivatives for existing pet and story photos.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.core.images import get_derivatives
+from apps.pets.models import Pet, SuccessStory
+
+
+class Command(BaseCommand):
+    help = 'Generate thumbnail, card and detail derivatives for uploaded photos'
+
+    def handle(self, *args, **options):
+        generated = failed = 0
+
+        for model in (Pet, SuccessStory):
+            fields = model.IMAGE_FIELDS
+            for obj in model.objects.only('pk', *fields).iterator(chunk_size=200):
+                for field in fields:
+                    image = getattr(obj, field)
+                    if not image:
+                        continue
+                    if get_derivatives(image):
+                        generated += 1
+                    else:
+                        failed += 1
+                        self.stderr.write(f'Could not process {image.name}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Derivatives ready for {generated} image(s), {failed} failed.'
+        ))
@@ -0,0 +1,49 @@
+"""
+Import pets in bulk from a CSV or JSON Lines file.
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.pets.bulk import FORMATS, detect_format, read_rows
+from apps.pets.services import PetImportService
+
+
+class Command(BaseCommand):
+    help = 'Stream pets from a CSV or JSONL file into the database in validated chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="File to import, or '-' for stdin")
+        parser.add_argument('--format', choices=FORMATS, help='File format (default: from the extension)')
+        parser.add_argument('--chunk-size', type=int, default=250, help='Rows inserted per transaction')
+        parser.add_argument('--dry-run', action='store_true', help='Validate rows without inserting them')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or detect_format(path)
+
+        try:
+            stream = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8-sig')
+        except OSError as error:
+            raise CommandError(f'Cannot open {path}: {error}')
+
+        try:
+            result = PetImportService.import_rows(
+                rows=read_rows(stream, fmt),
+                chunk_size=options['chunk_size'],
+                dry_run=options['dry_run']
+            )
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        for line_number, message in result['errors']:
+            self.stderr.write(f'Line {line_number}: {message}')
+
+        verb = 'Validated' if options['dry_run'] else 'Imported'
+        summary = f"{verb} {result['created']} pet(s), {len(result['errors'])} row(s) rejected."
+        if result['errors']:
+            self.stdout.write(self.style.WARNING(summary))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
\ No newline at end of file
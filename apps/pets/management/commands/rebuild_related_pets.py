@@ -0,0 +1,18 @@
+"""
+Recompute the related-pets recommendations of every pet.
+
+Run once after installing, and after edits made outside the services and
+signals (raw SQL, QuerySet.update() on pet fields).
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.pets.services import RelatedPetService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the precomputed related pets for every pet'
+
+    def handle(self, *args, **options):
+        stored = RelatedPetService.rebuild_all()
+        self.stdout.write(self.style.SUCCESS(f'Stored {stored} related-pet recommendation(s).'))
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Rebuild the pets full-text search index.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.pets.search import is_search_index_available, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the FTS5 search index from the pets table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='Database alias to rebuild')
+
+    def handle(self, *args, **options):
+        using = options['database']
+        if not is_search_index_available(using=using):
+            raise CommandError(f'No full-text search index on database "{using}".')
+
+        rebuild_search_index(using=using)
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt.'))
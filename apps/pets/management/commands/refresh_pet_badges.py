@@ -0,0 +1,18 @@
+"""
+Refresh the precomputed pet badges; run daily so new arrivals age out.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.pets.caching import invalidate_home_cache
+from apps.pets.services import PetService
+
+
+class Command(BaseCommand):
+    help = 'Recompute stored pet badges that are out of date'
+
+    def handle(self, *args, **options):
+        updated = PetService.refresh_badges()
+        if updated:
+            invalidate_home_cache()
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {updated} pet badge(s).'))
\ No newline at end of file
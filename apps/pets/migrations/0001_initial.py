@@ -0,0 +1,70 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Pet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.SlugField(blank=True, max_length=100, unique=True)),
+                ('type', models.CharField(choices=[('dog', 'Dog'), ('cat', 'Cat'), ('rabbit', 'Rabbit'), ('bird', 'Bird')], max_length=20)),
+                ('breed', models.CharField(max_length=100)),
+                ('age', models.CharField(max_length=50)),
+                ('gender', models.CharField(choices=[('Male', 'Male'), ('Female', 'Female')], max_length=10)),
+                ('size', models.CharField(choices=[('Small', 'Small'), ('Medium', 'Medium'), ('Large', 'Large')], max_length=20)),
+                ('color', models.CharField(max_length=100)),
+                ('description', models.TextField()),
+                ('personality', models.JSONField(default=list)),
+                ('vaccinated', models.BooleanField(default=False)),
+                ('spayed_neutered', models.BooleanField(default=False)),
+                ('microchipped', models.BooleanField(default=False)),
+                ('special_needs', models.BooleanField(default=False)),
+                ('special_needs_description', models.TextField(blank=True, null=True)),
+                ('main_image', models.ImageField(blank=True, null=True, upload_to='pets/')),
+                ('image_2', models.ImageField(blank=True, null=True, upload_to='pets/')),
+                ('image_3', models.ImageField(blank=True, null=True, upload_to='pets/')),
+                ('status', models.CharField(choices=[('available', 'Available'), ('pending', 'Pending'), ('adopted', 'Adopted')], default='available', max_length=20)),
+                ('arrival_date', models.DateField()),
+                ('adoption_fee', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('featured', models.BooleanField(default=False)),
+            ],
+            options={
+                'verbose_name': 'Pet',
+                'verbose_name_plural': 'Pets',
+                'ordering': ['-arrival_date', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SuccessStory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('adopter_name', models.CharField(max_length=100)),
+                ('adoption_date', models.DateField()),
+                ('title', models.CharField(max_length=200)),
+                ('story', models.TextField()),
+                ('image', models.ImageField(blank=True, null=True, upload_to='success_stories/')),
+                ('featured', models.BooleanField(default=False)),
+                ('pet', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='pets.pet')),
+            ],
+            options={
+                'verbose_name': 'Success Story',
+                'verbose_name_plural': 'Success Stories',
+                'ordering': ['-adoption_date'],
+            },
+        ),
+    ]
@@ -0,0 +1,75 @@
+"""
+Full-text search index for pets.
+
+Creates an external-content SQLite FTS5 table over ``pets_pet`` and the
+triggers that keep it in sync on insert, update and delete. Other database
+backends skip this migration and fall back to ``icontains`` filtering.
+"""
+
+from django.db import migrations
+
+
+CREATE_INDEX_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS pets_pet_fts USING fts5(
+        name, breed, description,
+        content='pets_pet',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pets_pet_fts_ai AFTER INSERT ON pets_pet BEGIN
+        INSERT INTO pets_pet_fts(rowid, name, breed, description)
+        VALUES (new.id, new.name, new.breed, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pets_pet_fts_ad AFTER DELETE ON pets_pet BEGIN
+        INSERT INTO pets_pet_fts(pets_pet_fts, rowid, name, breed, description)
+        VALUES ('delete', old.id, old.name, old.breed, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pets_pet_fts_au AFTER UPDATE OF name, breed, description ON pets_pet BEGIN
+        INSERT INTO pets_pet_fts(pets_pet_fts, rowid, name, breed, description)
+        VALUES ('delete', old.id, old.name, old.breed, old.description);
+        INSERT INTO pets_pet_fts(rowid, name, breed, description)
+        VALUES (new.id, new.name, new.breed, new.description);
+    END
+    """,
+    "INSERT INTO pets_pet_fts(pets_pet_fts) VALUES ('rebuild')",
+]
+
+DROP_INDEX_SQL = [
+    "DROP TRIGGER IF EXISTS pets_pet_fts_au",
+    "DROP TRIGGER IF EXISTS pets_pet_fts_ad",
+    "DROP TRIGGER IF EXISTS pets_pet_fts_ai",
+    "DROP TABLE IF EXISTS pets_pet_fts",
+]
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in CREATE_INDEX_SQL:
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in DROP_INDEX_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0002_pet_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['status', 'arrival_date', 'id'], name='pets_pet_status_arrival'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(condition=models.Q(('status', 'available')), fields=['type', 'arrival_date', 'id'], name='pets_pet_available_type'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:48
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+from django.utils import timezone
+
+from apps.pets.search import install_search_triggers
+
+NEW_ARRIVAL_DAYS = 30
+
+
+def backfill_badges(apps, schema_editor):
+    Pet = apps.get_model('pets', 'Pet')
+    cutoff = timezone.localdate() - timedelta(days=NEW_ARRIVAL_DAYS)
+    Pet.objects.using(schema_editor.connection.alias).update(badge=Case(
+        When(special_needs=True, then=Value('special_needs')),
+        When(arrival_date__gte=cutoff, then=Value('new_arrival')),
+        default=Value(''),
+    ))
+
+
+def reinstall_search_triggers(apps, schema_editor):
+    # AddField rebuilds pets_pet on SQLite, dropping the search index triggers
+    install_search_triggers(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0003_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pet',
+            name='badge',
+            field=models.CharField(blank=True, choices=[('special_needs', 'Special Needs'), ('new_arrival', 'New Arrival')], default='', editable=False, max_length=20),
+        ),
+        migrations.RunPython(backfill_badges, migrations.RunPython.noop),
+        migrations.RunPython(reinstall_search_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0004_pet_badge'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedPet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('score', models.FloatField()),
+                ('pet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_entries', to='pets.pet')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_from', to='pets.pet')),
+            ],
+            options={
+                'verbose_name': 'Related Pet',
+                'verbose_name_plural': 'Related Pets',
+                'ordering': ['pet', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('pet', 'rank'), name='pets_relatedpet_pet_rank')],
+            },
+        ),
+    ]
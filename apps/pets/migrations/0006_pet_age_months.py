@@ -0,0 +1,54 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:13
+
+import re
+
+from django.db import migrations, models
+
+from apps.pets.search import install_search_triggers
+
+# Frozen copy of apps.pets.models.parse_age_months
+AGE_PART = re.compile(r'(\d+(?:\.\d+)?)\s*(y|mo|m|w)', re.I)
+AGE_UNIT_MONTHS = {'y': 12, 'mo': 1, 'm': 1, 'w': 12 / 52}
+
+
+def parse_age_months(text):
+    parts = AGE_PART.findall(text or '')
+    if not parts:
+        return None
+    return round(sum(float(amount) * AGE_UNIT_MONTHS[unit.lower()] for amount, unit in parts))
+
+
+def backfill_age_months(apps, schema_editor):
+    Pet = apps.get_model('pets', 'Pet')
+    pets = Pet.objects.using(schema_editor.connection.alias)
+    # One UPDATE per distinct age text
+    for age in list(pets.order_by().values_list('age', flat=True).distinct()):
+        months = parse_age_months(age)
+        if months is not None:
+            pets.filter(age=age).update(age_months=months)
+
+
+def reinstall_search_triggers(apps, schema_editor):
+    # AddField rebuilds pets_pet on SQLite, dropping the search index triggers
+    install_search_triggers(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0005_relatedpet'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pet',
+            name='age_months',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_age_months, migrations.RunPython.noop),
+        migrations.RunPython(reinstall_search_triggers, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(condition=models.Q(('status', 'available')), fields=['age_months', 'id'], name='pets_pet_available_age'),
+        ),
+    ]
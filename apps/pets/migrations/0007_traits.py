@@ -0,0 +1,79 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def backfill_traits(apps, schema_editor):
+    Pet = apps.get_model('pets', 'Pet')
+    Trait = apps.get_model('pets', 'Trait')
+    PetTrait = apps.get_model('pets', 'PetTrait')
+    alias = schema_editor.connection.alias
+    
+    names = {}
+    pairs = set()
+    for pet_id, personality in Pet.objects.using(alias).values_list('id', 'personality').iterator():
+        if not isinstance(personality, list):
+            continue
+        for name in personality:
+            slug = slugify(name)[:100] if isinstance(name, str) else ''
+            if slug:
+                names.setdefault(slug, name.strip()[:100])
+                pairs.add((pet_id, slug))
+    
+    Trait.objects.using(alias).bulk_create([Trait(slug=slug, name=name) for slug, name in names.items()])
+    trait_ids = dict(Trait.objects.using(alias).values_list('slug', 'id'))
+    PetTrait.objects.using(alias).bulk_create(
+        [PetTrait(pet_id=pet_id, trait_id=trait_ids[slug]) for pet_id, slug in pairs],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0006_pet_age_months'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Trait',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.SlugField(max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Trait',
+                'verbose_name_plural': 'Traits',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PetTrait',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trait_links', to='pets.pet')),
+                ('trait', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pet_links', to='pets.trait')),
+            ],
+            options={
+                'verbose_name': 'Pet Trait',
+                'verbose_name_plural': 'Pet Traits',
+            },
+        ),
+        migrations.AddField(
+            model_name='pet',
+            name='traits',
+            field=models.ManyToManyField(blank=True, related_name='pets', through='pets.PetTrait', to='pets.trait'),
+        ),
+        migrations.AddIndex(
+            model_name='pettrait',
+            index=models.Index(fields=['trait', 'pet'], name='pets_pettrait_trait_pet'),
+        ),
+        migrations.AddConstraint(
+            model_name='pettrait',
+            constraint=models.UniqueConstraint(fields=('pet', 'trait'), name='pets_pettrait_pet_trait'),
+        ),
+        migrations.RunPython(backfill_traits, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,110 @@
+"""
+Fill the related-pets recommendations for existing pets.
+
+0005 created the table empty, so pets migrated before this step had no
+recommendations until rebuild_related_pets was run. Later changes are kept
+up to date by RelatedPetService.
+
+The scoring is a frozen copy of apps.pets.similarity, so later changes to
+it do not change what this migration does. Pets are scored one type at a
+time and written in batches, so memory use is bounded by the largest type.
+"""
+
+import heapq
+from bisect import bisect_right
+from itertools import islice
+
+from django.db import migrations
+
+RELATED_PETS_STORED = 6
+
+FEATURE_FIELDS = (
+    'id', 'breed', 'size', 'age_months', 'personality', 'status', 'arrival_date',
+    'special_needs', 'vaccinated', 'spayed_neutered', 'microchipped',
+)
+
+MEDICAL_FLAGS = ('vaccinated', 'spayed_neutered', 'microchipped')
+
+WEIGHTS = {
+    'breed': 3.0,
+    'size': 1.5,
+    'age': 1.5,
+    'personality': 3.0,
+    'special_needs': 1.0,
+    'medical': 0.25,
+}
+
+SIZE_RANKS = {'Small': 0, 'Medium': 1, 'Large': 2}
+
+# Upper bounds in months of the young, junior and adult age groups
+AGE_GROUP_BOUNDS = (12, 36, 96)
+
+BATCH_SIZE = 500
+
+
+def get_features(row):
+    personality = row['personality'] if isinstance(row['personality'], list) else ()
+    return {
+        **row,
+        'breed': row['breed'].strip().lower(),
+        'size': SIZE_RANKS.get(row['size']),
+        'age': None if row['age_months'] is None else bisect_right(AGE_GROUP_BOUNDS, row['age_months']),
+        'personality': frozenset(str(trait).strip().lower() for trait in personality),
+        'recency': (row['arrival_date'].toordinal(), row['id']),
+    }
+
+
+def score(pet, other):
+    total = 0.0
+    if pet['breed'] == other['breed']:
+        total += WEIGHTS['breed']
+    for field in ('size', 'age'):
+        if pet[field] is not None and other[field] is not None:
+            distance = abs(pet[field] - other[field])
+            if distance <= 1:
+                total += WEIGHTS[field] / (distance + 1)
+    if pet['personality'] and other['personality']:
+        shared = len(pet['personality'] & other['personality'])
+        total += WEIGHTS['personality'] * shared / len(pet['personality'] | other['personality'])
+    if pet['special_needs'] and other['special_needs']:
+        total += WEIGHTS['special_needs']
+    total += WEIGHTS['medical'] * sum(pet[flag] == other[flag] for flag in MEDICAL_FLAGS)
+    return round(total, 4)
+
+
+def rank_key(item):
+    return item[0], item[1]['recency']
+
+
+def backfill_related_pets(apps, schema_editor):
+    Pet = apps.get_model('pets', 'Pet')
+    RelatedPet = apps.get_model('pets', 'RelatedPet')
+    alias = schema_editor.connection.alias
+    pets = Pet.objects.using(alias).order_by()
+
+    RelatedPet.objects.using(alias).all().delete()
+    for pet_type in pets.values_list('type', flat=True).distinct():
+        features = [get_features(row) for row in pets.filter(type=pet_type).values(*FEATURE_FIELDS)]
+        candidates = [pet for pet in features if pet['status'] == 'available']
+
+        def rows():
+            for pet in features:
+                scored = ((score(pet, other), other) for other in candidates if other['id'] != pet['id'])
+                related = heapq.nlargest(RELATED_PETS_STORED, scored, key=rank_key)
+                for rank, (score_value, other) in enumerate(related, start=1):
+                    yield RelatedPet(pet_id=pet['id'], related_id=other['id'], rank=rank, score=score_value)
+
+        batches = iter(rows())
+        while batch := list(islice(batches, BATCH_SIZE)):
+            RelatedPet.objects.using(alias).bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0007_traits'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_related_pets, migrations.RunPython.noop),
+    ]
@@ -2,10 +2,43 @@
 Pets app models.
 """
 
+import re
+from datetime import timedelta
+
 from django.db import models
-from django.utils.text import slugify
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from django.urls import reverse
+from apps.core.images import get_derivative_url
 from apps.core.models import TimeStampedModel
+from apps.core.utils import save_with_unique_slug
+
+AGE_PART = re.compile(r'(\d+(?:\.\d+)?)\s*(y|mo|m|w)', re.I)
+AGE_UNIT_MONTHS = {'y': 12, 'mo': 1, 'm': 1, 'w': 12 / 52}
+
+# Sort keys for the catalog's age orderings; unknown ages sort last both ways
+# (signed, so cursor lookups on -1 are not treated as out of range)
+AGE_SORT_KEYS = {
+    'age_ascending': Coalesce('age_months', Value(32767), output_field=models.IntegerField()),
+    'age_descending': Coalesce('age_months', Value(-1), output_field=models.IntegerField()),
+}
+
+
+def parse_age_months(text):
+    """
+    Parse a free-text age such as '2 years', '6 months' or '1 yr 3 mo'.
+    
+    Args:
+        text: Age as entered on the pet
+    
+    Returns:
+        Age in whole months, or None if no age could be read
+    """
+    parts = AGE_PART.findall(text or '')
+    if not parts:
+        return None
+    return round(sum(float(amount) * AGE_UNIT_MONTHS[unit.lower()] for amount, unit in parts))
 
 
 class Pet(TimeStampedModel):
@@ -35,12 +68,31 @@ class Pet(TimeStampedModel):
         ('adopted', 'Adopted'),
     ]
     
+    BADGES = [
+        ('special_needs', 'Special Needs'),
+        ('new_arrival', 'New Arrival'),
+    ]
+    
+    # (key, label, from months, up to months) for age filters and facets
+    AGE_GROUPS = [
+        ('young', 'Under 1 year', 0, 12),
+        ('junior', '1-3 years', 12, 36),
+        ('adult', '3-8 years', 36, 96),
+        ('senior', '8+ years', 96, None),
+    ]
+    
+    NEW_ARRIVAL_DAYS = 30
+    
+    IMAGE_FIELDS = ('main_image', 'image_2', 'image_3')
+    
     # Basic Information
     name = models.CharField(max_length=100)
     slug = models.SlugField(max_length=100, unique=True, blank=True)
     type = models.CharField(max_length=20, choices=PET_TYPES)
     breed = models.CharField(max_length=100)
     age = models.CharField(max_length=50)
+    # Parsed from age on save; None when the text has no recognisable age
+    age_months = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
     gender = models.CharField(max_length=10, choices=GENDERS)
     size = models.CharField(max_length=20, choices=SIZES)
     color = models.CharField(max_length=100)
@@ -48,6 +100,8 @@ class Pet(TimeStampedModel):
     # Description and Personality
     description = models.TextField()
     personality = models.JSONField(default=list)
+    # Normalized copy of personality for filtering, synced by PetService
+    traits = models.ManyToManyField('Trait', through='PetTrait', related_name='pets', blank=True)
     
     # Medical Information
     vaccinated = models.BooleanField(default=False)
@@ -67,15 +121,40 @@ class Pet(TimeStampedModel):
     adoption_fee = models.DecimalField(max_digits=10, decimal_places=2)
     featured = models.BooleanField(default=False)
     
+    # Precomputed on save and refreshed daily by refresh_pet_badges
+    badge = models.CharField(max_length=20, choices=BADGES, blank=True, default='', editable=False)
+    
     class Meta:
         ordering = ['-arrival_date', 'name']
+        indexes = [
+            # Catalog (status='available') and admin grid, newest first
+            models.Index(fields=['status', 'arrival_date', 'id'], name='pets_pet_status_arrival'),
+            # Public catalog and related pets filtered by type
+            models.Index(
+                fields=['type', 'arrival_date', 'id'],
+                name='pets_pet_available_type',
+                condition=models.Q(status='available')
+            ),
+            # Age range filters and age sorting of the catalog
+            models.Index(
+                fields=['age_months', 'id'],
+                name='pets_pet_available_age',
+                condition=models.Q(status='available')
+            ),
+        ]
         verbose_name = 'Pet'
         verbose_name_plural = 'Pets'
     
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
+        self.badge = self.compute_badge()
+        self.age_months = parse_age_months(self.age)
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'badge', 'age_months'}
+        
+        if self.slug:
+            super().save(*args, **kwargs)
+        else:
+            save_with_unique_slug(self, self.name, lambda: super(Pet, self).save(*args, **kwargs))
     
     def __str__(self):
         return f"{self.name} ({self.breed})"
@@ -94,24 +173,107 @@ class Pet(TimeStampedModel):
             images.append(self.image_3)
         return images
     
+    def get_image_url(self, size='card', fmt='jpeg'):
+        """Return the URL of a resized main image derivative"""
+        return get_derivative_url(self.main_image, size=size, fmt=fmt)
+    
+    @classmethod
+    def new_arrival_cutoff(cls):
+        """Return the earliest arrival date that still counts as new"""
+        return timezone.localdate() - timedelta(days=cls.NEW_ARRIVAL_DAYS)
+    
     def is_new_arrival(self):
         """Check if pet arrived within the last 30 days"""
-        from django.utils import timezone
-        from datetime import timedelta
-        return (timezone.now().date() - self.arrival_date).days <= 30
+        # Accept unsaved instances built with an ISO date string
+        arrival_date = self._meta.get_field('arrival_date').to_python(self.arrival_date)
+        return arrival_date >= self.new_arrival_cutoff()
     
-    def get_badge(self):
-        """Return appropriate badge text for the pet"""
+    @classmethod
+    def get_age_group(cls, months):
+        """Return the AGE_GROUPS key for an age in months, or None if unknown"""
+        if months is None:
+            return None
+        for key, _, start, end in cls.AGE_GROUPS:
+            if months >= start and (end is None or months < end):
+                return key
+        return None
+    
+    def compute_badge(self):
+        """Return the badge key the pet should currently have"""
         if self.special_needs:
-            return 'Special Needs'
+            return 'special_needs'
         elif self.is_new_arrival():
-            return 'New Arrival'
-        return None
+            return 'new_arrival'
+        return ''
+    
+    def get_badge(self):
+        """Return appropriate badge text for the pet"""
+        return self.get_badge_display() or None
+
+
+class Trait(models.Model):
+    """A personality trait pets can be filtered by"""
+    
+    name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=100, unique=True)
+    
+    class Meta:
+        ordering = ['name']
+        verbose_name = 'Trait'
+        verbose_name_plural = 'Traits'
+    
+    def __str__(self):
+        return self.name
+
+
+class PetTrait(models.Model):
+    """Link between a pet and one of its personality traits"""
+    
+    pet = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name='trait_links')
+    trait = models.ForeignKey(Trait, on_delete=models.CASCADE, related_name='pet_links')
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['pet', 'trait'], name='pets_pettrait_pet_trait'),
+        ]
+        indexes = [
+            # Trait filters look up the pets of a trait
+            models.Index(fields=['trait', 'pet'], name='pets_pettrait_trait_pet'),
+        ]
+        verbose_name = 'Pet Trait'
+        verbose_name_plural = 'Pet Traits'
+    
+    def __str__(self):
+        return f"{self.pet_id}: {self.trait_id}"
+
+
+class RelatedPet(models.Model):
+    """
+    Precomputed "related pets" recommendation, maintained by RelatedPetService.
+    """
+    pet = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name='related_entries')
+    related = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name='related_from')
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+    
+    class Meta:
+        ordering = ['pet', 'rank']
+        constraints = [
+            # Also the index behind get_related_pets()
+            models.UniqueConstraint(fields=['pet', 'rank'], name='pets_relatedpet_pet_rank'),
+        ]
+        verbose_name = 'Related Pet'
+        verbose_name_plural = 'Related Pets'
+    
+    def __str__(self):
+        return f"{self.pet_id} -> {self.related_id} ({self.score})"
 
 
 class SuccessStory(TimeStampedModel):
     """Model for adoption success stories"""
     
+    IMAGE_FIELDS = ('image',)
+    
     pet = models.ForeignKey(Pet, on_delete=models.SET_NULL, null=True, blank=True)
     adopter_name = models.CharField(max_length=100)
     adoption_date = models.DateField()
@@ -129,4 +291,8 @@ class SuccessStory(TimeStampedModel):
         verbose_name_plural = 'Success Stories'
     
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return self.title
+    
+    def get_image_url(self, size='card', fmt='jpeg'):
+        """Return the URL of a resized image derivative"""
+        return get_derivative_url(self.image, size=size, fmt=fmt)
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+Pets app search.
+Full-text search over pets backed by the SQLite FTS5 index (read operations only).
+"""
+
+import re
+
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+SEARCH_TABLE = 'pets_pet_fts'
+
+# Column weights for bm25(): name, breed, description
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0)
+
+# Triggers that keep the index in step with pets_pet (first created by migration 0002)
+SEARCH_TRIGGERS = {
+    'pets_pet_fts_ai': f"""
+        CREATE TRIGGER IF NOT EXISTS pets_pet_fts_ai AFTER INSERT ON pets_pet BEGIN
+            INSERT INTO {SEARCH_TABLE}(rowid, name, breed, description)
+            VALUES (new.id, new.name, new.breed, new.description);
+        END
+    """,
+    'pets_pet_fts_ad': f"""
+        CREATE TRIGGER IF NOT EXISTS pets_pet_fts_ad AFTER DELETE ON pets_pet BEGIN
+            INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, breed, description)
+            VALUES ('delete', old.id, old.name, old.breed, old.description);
+        END
+    """,
+    'pets_pet_fts_au': f"""
+        CREATE TRIGGER IF NOT EXISTS pets_pet_fts_au AFTER UPDATE OF name, breed, description ON pets_pet BEGIN
+            INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, breed, description)
+            VALUES ('delete', old.id, old.name, old.breed, old.description);
+            INSERT INTO {SEARCH_TABLE}(rowid, name, breed, description)
+            VALUES (new.id, new.name, new.breed, new.description);
+        END
+    """,
+}
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+_index_available = {}
+
+
+def build_match_query(text: str) -> str:
+    """
+    Turn free-form user input into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term, so partially typed words
+    still match and FTS5 operators in the input are treated as text.
+
+    Args:
+        text: Raw search text
+
+    Returns:
+        MATCH expression, or an empty string if the text has no words
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def is_search_index_available(*, using='default') -> bool:
+    """
+    Check whether the FTS5 index exists on the given database.
+
+    Args:
+        using: Database alias
+
+    Returns:
+        Boolean indicating if full-text search can be used
+    """
+    if using not in _index_available:
+        connection = connections[using]
+        _index_available[using] = (
+            connection.vendor == 'sqlite'
+            and SEARCH_TABLE in connection.introspection.table_names()
+        )
+    return _index_available[using]
+
+
+def search_pets(queryset: QuerySet, text: str) -> QuerySet:
+    """
+    Restrict a pet queryset to full-text matches for the given text.
+
+    Matches are annotated with ``search_rank`` (lower is better) when the
+    FTS5 index is available; otherwise this falls back to ``icontains``
+    filtering on name, breed and description.
+
+    Args:
+        queryset: Pet queryset to filter
+        text: Raw search text
+
+    Returns:
+        Filtered QuerySet
+    """
+    if not is_search_index_available(using=queryset.db):
+        return queryset.filter(
+            Q(name__icontains=text) |
+            Q(breed__icontains=text) |
+            Q(description__icontains=text)
+        )
+
+    match = build_match_query(text)
+    if not match:
+        return queryset.none()
+
+    table = queryset.model._meta.db_table
+    weights = ', '.join(str(weight) for weight in SEARCH_WEIGHTS)
+    return queryset.filter(
+        pk__in=RawSQL(
+            f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s',
+            [match],
+        )
+    ).annotate(
+        search_rank=RawSQL(
+            f'SELECT bm25({SEARCH_TABLE}, {weights}) FROM {SEARCH_TABLE} '
+            f'WHERE {SEARCH_TABLE} MATCH %s AND rowid = "{table}"."id"',
+            [match],
+        )
+    )
+
+
+def rebuild_search_index(*, using='default') -> None:
+    """
+    Rebuild the FTS5 index from the contents of the pets table.
+
+    Args:
+        using: Database alias
+    """
+    if not is_search_index_available(using=using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
+
+
+def install_search_triggers(connection) -> bool:
+    """
+    Recreate missing index sync triggers and rebuild the index.
+
+    SQLite alters a table by rebuilding it, which drops its triggers, so
+    this must run after every migration that alters pets_pet; a post_migrate
+    handler runs it after each migrate. Does nothing when the triggers are
+    all present or the FTS5 table does not exist.
+
+    Args:
+        connection: Database connection
+
+    Returns:
+        True if triggers were reinstalled and the index rebuilt
+    """
+    if connection.vendor != 'sqlite' or SEARCH_TABLE not in connection.introspection.table_names():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'pets_pet'"
+        )
+        existing = {name for name, in cursor.fetchall()}
+        if existing.issuperset(SEARCH_TRIGGERS):
+            return False
+        for statement in SEARCH_TRIGGERS.values():
+            cursor.execute(statement)
+        # Rows written while the triggers were missing are not in the index
+        cursor.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
+    return True
\ No newline at end of file
@@ -3,8 +3,94 @@ Pets app selectors.
 Contains query logic for retrieving pet data (read operations only).
 """
 
-from django.db.models import Q, QuerySet
-from .models import Pet, SuccessStory
+from functools import reduce
+from operator import and_, or_
+
+from django.db.models import Count, Q, QuerySet
+from apps.core.stats import StatusBreakdown
+from .index import get_available_pet_index
+from .models import Pet, PetTrait, RelatedPet, SuccessStory, Trait
+from .search import search_pets
+
+
+PET_STATUS_BREAKDOWN = StatusBreakdown(
+    scope='pets.status',
+    model=Pet,
+    conditions={status: Q(status=status) for status, _ in Pet.STATUS_CHOICES}
+)
+
+# Catalog facets with one count per choice
+FACET_CHOICES = {
+    'type': Pet.PET_TYPES,
+    'size': Pet.SIZES,
+    'gender': Pet.GENDERS,
+}
+
+# Most common traits offered as filters (selected ones are always shown)
+TRAIT_FACET_LIMIT = 12
+
+
+def _age_group_condition(key: str) -> Q:
+    """Condition for one of Pet.AGE_GROUPS; unknown keys match nothing."""
+    for group, _, start, end in Pet.AGE_GROUPS:
+        if group == key:
+            condition = Q(age_months__gte=start)
+            return condition & Q(age_months__lt=end) if end is not None else condition
+    return Q(pk__in=[])
+
+
+def _trait_condition(slugs, *, match_any=False) -> Q:
+    """Pets with all (or any) of the given trait slugs, via the trait index."""
+    links = PetTrait.objects.values('pet_id')
+    if match_any:
+        return Q(pk__in=links.filter(trait__slug__in=slugs))
+    return reduce(and_, (Q(pk__in=links.filter(trait__slug=slug)) for slug in sorted(set(slugs))))
+
+
+def _filter_conditions(filters: dict) -> dict:
+    """
+    Build one condition per faceted catalog filter.
+    
+    Args:
+        filters: Dict of filter parameters
+    
+    Returns:
+        Dict mapping facet name to a Q object, for the filters that are set
+    """
+    conditions = {}
+    
+    # Filter by type
+    if filters.get('type') and filters['type'] != 'all':
+        conditions['type'] = Q(type=filters['type'])
+    
+    # Filter by size
+    if filters.get('sizes'):
+        conditions['size'] = Q(size__in=filters['sizes'])
+    
+    # Filter by gender
+    if filters.get('gender'):
+        conditions['gender'] = Q(gender=filters['gender'])
+    
+    # Filter by age group
+    if filters.get('ages'):
+        conditions['age'] = reduce(or_, (_age_group_condition(key) for key in filters['ages']))
+    
+    # Filter by personality traits (all of them, or any with trait_match='any')
+    if filters.get('traits'):
+        conditions['traits'] = _trait_condition(
+            filters['traits'],
+            match_any=filters.get('trait_match') == 'any'
+        )
+    
+    # Filter by special needs
+    if filters.get('special_needs'):
+        conditions['special_needs'] = Q(special_needs=True)
+    
+    # Filter to recent arrivals
+    if filters.get('new_arrivals'):
+        conditions['new_arrivals'] = Q(arrival_date__gte=Pet.new_arrival_cutoff())
+    
+    return conditions
 
 
 def get_available_pets(*, filters=None) -> QuerySet:
@@ -20,24 +106,178 @@ def get_available_pets(*, filters=None) -> QuerySet:
     queryset = Pet.objects.filter(status='available')
     
     if filters:
-        # Filter by type
-        if filters.get('type') and filters['type'] != 'all':
-            queryset = queryset.filter(type=filters['type'])
+        for condition in _filter_conditions(filters).values():
+            queryset = queryset.filter(condition)
         
-        # Filter by size
-        if filters.get('sizes'):
-            queryset = queryset.filter(size__in=filters['sizes'])
+        # Full-text search on name, breed and description
+        if filters.get('search'):
+            queryset = search_pets(queryset, filters['search'])
+    
+    return queryset
+
+
+def get_pet_facets(*, filters=None) -> dict:
+    """
+    Count available pets per filter value in one aggregate query, plus one
+    grouped query for the traits.
+    
+    Each facet is counted with every other active filter applied but not
+    its own, so the counts show what selecting a value would return (the
+    size checkboxes combine with OR, the type radio replaces the current
+    type). Traits matched with AND are counted with the trait filter
+    applied, so they show how far each extra trait narrows the results.
+    The search text narrows every count. Without a search the
+    counts come from the in-memory index when it is enabled.
+    
+    Args:
+        filters: Dict of filter parameters, as for get_available_pets()
+    
+    Returns:
+        Dict with 'total' (pets matching every filter), 'type', 'size',
+        'gender' and 'age' (by Pet.AGE_GROUPS key) dicts mapping value to
+        count, 'special_needs' and 'new_arrivals' counts, and 'traits', a
+        list of the most common traits (see _trait_facets())
+    """
+    filters = filters or {}
+    if not filters.get('search') and (index := get_available_pet_index()) is not None:
+        return _get_indexed_pet_facets(index, filters)
+    
+    conditions = _filter_conditions(filters)
+    
+    def count(*, facet=None, value=Q()):
+        condition = reduce(and_, (q for name, q in conditions.items() if name != facet), value)
+        return Count('pk', filter=condition) if condition else Count('pk')
+    
+    aggregates = {
+        'total': count(),
+        'type__all': count(facet='type'),
+        'special_needs__true': count(facet='special_needs', value=Q(special_needs=True)),
+        'new_arrivals__true': count(facet='new_arrivals', value=Q(arrival_date__gte=Pet.new_arrival_cutoff())),
+    }
+    # Aliases are namespaced by facet so they never clash with field names
+    for facet, options in FACET_CHOICES.items():
+        for value, _ in options:
+            aggregates[f'{facet}__{value}'] = count(facet=facet, value=Q(**{facet: value}))
+    for key, *_ in Pet.AGE_GROUPS:
+        aggregates[f'age__{key}'] = count(facet='age', value=_age_group_condition(key))
+    
+    queryset = Pet.objects.filter(status='available')
+    if filters.get('search'):
+        queryset = search_pets(queryset, filters['search'])
+    counts = queryset.order_by().aggregate(**aggregates)
+    
+    # Traits are open-ended, so they are counted with one grouped query
+    trait_facet = 'traits' if filters.get('trait_match') == 'any' else None
+    trait_pets = queryset.filter(reduce(and_, (q for name, q in conditions.items() if name != trait_facet), Q()))
+    trait_counts = list(
+        Trait.objects
+        .filter(pet_links__pet__in=trait_pets.values('pk'))
+        .annotate(count=Count('pet_links'))
+        .values_list('slug', 'name', 'count')
+    )
+    # Selected traits stay listed, so they can be unticked, even with no matches
+    if unmatched := set(filters.get('traits', ())) - {slug for slug, *_ in trait_counts}:
+        trait_counts += [
+            (slug, name, 0) for slug, name in Trait.objects.filter(slug__in=unmatched).values_list('slug', 'name')
+        ]
+    
+    facets = {
+        'total': counts['total'],
+        'special_needs': counts['special_needs__true'],
+        'new_arrivals': counts['new_arrivals__true'],
+    }
+    for facet, options in FACET_CHOICES.items():
+        facets[facet] = {value: counts[f'{facet}__{value}'] for value, _ in options}
+    facets['age'] = {key: counts[f'age__{key}'] for key, *_ in Pet.AGE_GROUPS}
+    facets['type']['all'] = counts['type__all']
+    facets['traits'] = _trait_facets(trait_counts, selected=filters.get('traits', ()))
+    return facets
+
+
+def _get_indexed_pet_facets(index, filters: dict) -> dict:
+    """Compute get_pet_facets() from the in-memory index by counting bits."""
+    conditions = index.conditions(filters)
+    
+    def count(*, facet=None, value=None):
+        mask = index.match(conditions, exclude=facet)
+        return index.count(mask if value is None else mask & value)
+    
+    facets = {
+        'total': count(),
+        'special_needs': count(facet='special_needs', value=index.bits('special_needs', True)),
+        'new_arrivals': count(facet='new_arrivals', value=index.arrived_since(Pet.new_arrival_cutoff())),
+    }
+    for facet, options in FACET_CHOICES.items():
+        facets[facet] = {value: count(facet=facet, value=index.bits(facet, value)) for value, _ in options}
+    facets['age'] = {key: count(facet='age', value=index.bits('age_group', key)) for key, *_ in Pet.AGE_GROUPS}
+    facets['type']['all'] = count(facet='type')
+    trait_facet = 'traits' if filters.get('trait_match') == 'any' else None
+    facets['traits'] = _trait_facets(
+        [(slug, name, count(facet=trait_facet, value=index.bits('trait', slug)))
+         for slug, name in index.trait_names.items()],
+        selected=filters.get('traits', ())
+    )
+    return facets
+
+
+def _trait_facets(counts, *, selected) -> list:
+    """
+    Pick the trait facets to show.
+    
+    Args:
+        counts: Iterable of (slug, name, count) tuples
+        selected: Trait slugs currently filtered on
+    
+    Returns:
+        List of dicts with 'slug', 'name', 'count' and 'selected', most
+        common first
+    """
+    traits = sorted(
+        (
+            {'slug': slug, 'name': name, 'count': count, 'selected': slug in selected}
+            for slug, name, count in counts if count or slug in selected
+        ),
+        key=lambda trait: (-trait['count'], trait['name'].lower())
+    )
+    shown = traits[:TRAIT_FACET_LIMIT]
+    return shown + [trait for trait in traits[TRAIT_FACET_LIMIT:] if trait['slug'] in selected]
+
+
+def filter_pets(*, filters=None) -> QuerySet:
+    """
+    Filter all pets for the admin dashboard.
+    
+    Each pet is annotated with ``application_count`` and
+    ``pending_application_count``, computed in SQL.
+    
+    Args:
+        filters: Dict of filter parameters
+    
+    Returns:
+        QuerySet of annotated pets
+    """
+    queryset = Pet.objects.annotate(
+        application_count=Count('applications'),
+        pending_application_count=Count(
+            'applications',
+            filter=Q(applications__status='pending')
+        ),
+    ).order_by('-arrival_date')
+    
+    if filters:
+        # Filter by status
+        if status := filters.get('status'):
+            queryset = queryset.filter(status=status)
         
-        # Filter by special needs
-        if filters.get('special_needs'):
-            queryset = queryset.filter(special_needs=True)
+        # Filter by type
+        if pet_type := filters.get('type'):
+            queryset = queryset.filter(type=pet_type)
         
         # Search by name or breed
-        if filters.get('search'):
+        if search := filters.get('search'):
             queryset = queryset.filter(
-                Q(name__icontains=filters['search']) |
-                Q(breed__icontains=filters['search']) |
-                Q(description__icontains=filters['search'])
+                Q(name__icontains=search) |
+                Q(breed__icontains=search)
             )
     
     return queryset
@@ -71,19 +311,30 @@ def get_pet_by_id(*, pet_id: int) -> Pet:
 
 def get_related_pets(*, pet: Pet, limit=3) -> QuerySet:
     """
-    Get related pets (same type, different pet).
+    Get the pets most similar to a pet, from the precomputed recommendations.
+    
+    Recommendations are maintained by RelatedPetService; pets adopted since
+    they were computed are skipped. Pets with none stored yet (e.g. created
+    before the worker ran) get other available pets of the same type.
     
     Args:
         pet: Pet instance to find related pets for
-        limit: Maximum number of related pets to return
+        limit: Maximum number of related pets to return (at most
+            RELATED_PETS_STORED)
     
     Returns:
-        QuerySet of related pets
+        QuerySet of related pets, most similar first
     """
+    if not RelatedPet.objects.filter(pet=pet).exists():
+        return Pet.objects.filter(
+            type=pet.type,
+            status='available'
+        ).exclude(pk=pet.pk)[:limit]
+    
     return Pet.objects.filter(
-        type=pet.type,
+        related_from__pet=pet,
         status='available'
-    ).exclude(pk=pet.pk)[:limit]
+    ).order_by('related_from__rank')[:limit]
 
 
 def get_success_stories(*, featured_only=False) -> QuerySet:
@@ -104,6 +355,16 @@ def get_success_stories(*, featured_only=False) -> QuerySet:
     return queryset
 
 
+def get_pet_status_counts() -> dict:
+    """
+    Get the number of pets in each status.
+    
+    Returns:
+        Dict mapping status to count
+    """
+    return PET_STATUS_BREAKDOWN.get()
+
+
 def get_pet_stats() -> dict:
     """
     Get statistics about pets.
@@ -111,11 +372,14 @@ def get_pet_stats() -> dict:
     Returns:
         Dict with pet statistics
     """
-    from apps.adoptions.models import AdoptionApplication
+    from apps.adoptions.selectors import get_application_status_counts
+    
+    pet_counts = get_pet_status_counts()
+    application_counts = get_application_status_counts()
     
     return {
-        'total_adopted': Pet.objects.filter(status='adopted').count(),
-        'available_now': Pet.objects.filter(status='available').count(),
-        'happy_families': AdoptionApplication.objects.filter(status='completed').count(),
+        'total_adopted': pet_counts['adopted'],
+        'available_now': pet_counts['available'],
+        'happy_families': application_counts['completed'],
         'years_of_service': 8,
     }
\ No newline at end of file
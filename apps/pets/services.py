@@ -3,9 +3,30 @@ Pets app services.
 Contains business logic for pet operations (write operations).
 """
 
+import heapq
+from collections import Counter
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Q, Value, When
 from django.utils import timezone
-from .models import Pet, SuccessStory
-from apps.core.utils import generate_unique_slug
+from django.utils.text import slugify
+from .bulk import build_pet
+from .caching import invalidate_home_cache
+from .models import Pet, PetTrait, RelatedPet, SuccessStory, Trait
+from .selectors import PET_STATUS_BREAKDOWN
+from .similarity import (
+    FEATURE_FIELDS,
+    RELATED_PETS_STORED,
+    get_features,
+    rank_all,
+    rank_key,
+    score,
+    top_related,
+)
+from .tasks import refresh_related_pets
+from apps.core.utils import SLUG_ATTEMPTS, allocate_unique_slugs
 
 
 class PetService:
@@ -14,7 +35,7 @@ class PetService:
     @staticmethod
     def create_pet(*, name: str, type: str, breed: str, **kwargs) -> Pet:
         """
-        Create a new pet.
+        Create a new pet with a unique slug.
         
         Args:
             name: Pet name
@@ -25,15 +46,15 @@ class PetService:
         Returns:
             Created Pet instance
         """
-        slug = generate_unique_slug(Pet, name)
-        
-        pet = Pet.objects.create(
-            name=name,
-            slug=slug,
-            type=type,
-            breed=breed,
-            **kwargs
-        )
+        with transaction.atomic():
+            pet = Pet.objects.create(
+                name=name,
+                type=type,
+                breed=breed,
+                **kwargs
+            )
+            PET_STATUS_BREAKDOWN.shift(new=pet.status)
+            PetService.sync_traits(pets=[pet])
         
         return pet
     
@@ -49,10 +70,15 @@ class PetService:
         Returns:
             Updated Pet instance
         """
+        old_status = pet.status
         for key, value in data.items():
             setattr(pet, key, value)
         
-        pet.save()
+        with transaction.atomic():
+            pet.save()
+            PET_STATUS_BREAKDOWN.shift(old=old_status, new=pet.status)
+            if 'personality' in data:
+                PetService.sync_traits(pets=[pet])
         return pet
     
     @staticmethod
@@ -67,8 +93,12 @@ class PetService:
         Returns:
             Updated Pet instance
         """
+        old_status = pet.status
         pet.status = status
-        pet.save()
+        
+        with transaction.atomic():
+            pet.save()
+            PET_STATUS_BREAKDOWN.shift(old=old_status, new=status)
         return pet
     
     @staticmethod
@@ -96,6 +126,264 @@ class PetService:
             Updated Pet instance
         """
         return PetService.update_pet_status(pet=pet, status='available')
+    
+    @staticmethod
+    def bulk_update_status(*, pet_ids, status: str) -> int:
+        """
+        Set the status of many pets with a single UPDATE.
+        
+        Must be called inside a transaction.
+        
+        Args:
+            pet_ids: Iterable of pet IDs
+            status: New status
+        
+        Returns:
+            Number of pets whose status changed
+        """
+        pet_ids = list(pet_ids)
+        pets = Pet.objects.filter(pk__in=pet_ids).exclude(status=status)
+        old_counts = Counter(pets.select_for_update().values_list('status', flat=True))
+        updated = pets.update(status=status, updated_at=timezone.now())
+        
+        PET_STATUS_BREAKDOWN.add({
+            **{old: -count for old, count in old_counts.items()},
+            status: updated,
+        })
+        transaction.on_commit(invalidate_home_cache)
+        refresh_related_pets.enqueue(pet_ids=list(pet_ids))
+        return updated
+    
+    @staticmethod
+    def sync_traits(*, pets) -> None:
+        """
+        Make the trait links of saved pets match their personality lists.
+        
+        Traits are matched by slug, so 'Good with kids' and 'good with
+        kids' are one trait; new traits are created as they appear. A
+        personality that is not a list (e.g. a bare string saved from the
+        admin) leaves the pet with no traits rather than one per letter.
+        Must be called inside the transaction that saved the pets.
+        
+        Args:
+            pets: Iterable of saved Pet instances
+        """
+        names = {}
+        wanted = {}
+        for pet in pets:
+            wanted[pet.pk] = set()
+            if not isinstance(pet.personality, list):
+                continue
+            for name in pet.personality:
+                if not isinstance(name, str):
+                    continue
+                slug = slugify(name)[:100]
+                if slug:
+                    names.setdefault(slug, name.strip()[:100])
+                    wanted[pet.pk].add(slug)
+        
+        Trait.objects.bulk_create(
+            [Trait(slug=slug, name=name) for slug, name in names.items()],
+            ignore_conflicts=True
+        )
+        trait_ids = dict(Trait.objects.filter(slug__in=names).values_list('slug', 'id'))
+        target = {(pet_id, trait_ids[slug]) for pet_id, slugs in wanted.items() for slug in slugs}
+        current = set(PetTrait.objects.filter(pet_id__in=wanted).values_list('pet_id', 'trait_id'))
+        
+        stale = {}
+        for pet_id, trait_id in current - target:
+            stale.setdefault(pet_id, []).append(trait_id)
+        for pet_id, stale_ids in stale.items():
+            PetTrait.objects.filter(pet_id=pet_id, trait_id__in=stale_ids).delete()
+        PetTrait.objects.bulk_create(
+            [PetTrait(pet_id=pet_id, trait_id=trait_id) for pet_id, trait_id in target - current],
+            batch_size=500
+        )
+    
+    @staticmethod
+    def refresh_badges() -> int:
+        """
+        Recompute the stored badge of every pet whose badge is out of date.
+        
+        Mirrors Pet.compute_badge() in SQL, so pets that stop being new
+        arrivals are updated without loading them.
+        
+        Returns:
+            Number of pets updated
+        """
+        badge = Case(
+            When(special_needs=True, then=Value('special_needs')),
+            When(arrival_date__gte=Pet.new_arrival_cutoff(), then=Value('new_arrival')),
+            default=Value(''),
+        )
+        return Pet.objects.filter(~Q(badge=badge)).update(badge=badge)
+
+
+class PetImportService:
+    """Service for importing pets in bulk"""
+    
+    @staticmethod
+    def import_rows(*, rows, chunk_size=250, dry_run=False) -> dict:
+        """
+        Validate and insert pets from a stream of parsed rows.
+        
+        Rows are consumed a chunk at a time. Each chunk gets its slugs in
+        batch and is inserted with one bulk_create in its own transaction,
+        so a bad row never blocks the rest of the file.
+        
+        Args:
+            rows: Iterable of (line_number, data, error) tuples, see bulk.read_rows
+            chunk_size: Rows validated and inserted per transaction
+            dry_run: If True, validate only
+        
+        Returns:
+            Dict with 'created' count and 'errors' list of (line_number, message)
+        """
+        created = 0
+        errors = []
+        rows = iter(rows)
+        
+        while chunk := list(islice(rows, chunk_size)):
+            pets = []
+            for line_number, data, error in chunk:
+                if error is None:
+                    try:
+                        pets.append(build_pet(data))
+                        continue
+                    except ValidationError as validation_error:
+                        error = ' '.join(
+                            f'{field}: {" ".join(messages)}'
+                            for field, messages in validation_error.message_dict.items()
+                        )
+                errors.append((line_number, error))
+            
+            if pets and not dry_run:
+                PetImportService._insert_chunk(pets=pets)
+            created += len(pets)
+        
+        return {'created': created, 'errors': errors}
+    
+    @staticmethod
+    def _insert_chunk(*, pets: list) -> None:
+        for attempt in range(SLUG_ATTEMPTS):
+            slugs = allocate_unique_slugs(Pet, [pet.name for pet in pets])
+            for pet, slug in zip(pets, slugs):
+                pet.slug = slug
+            try:
+                with transaction.atomic():
+                    Pet.objects.bulk_create(pets)
+                    PET_STATUS_BREAKDOWN.add(Counter(pet.status for pet in pets))
+                    PetService.sync_traits(pets=pets)
+                    transaction.on_commit(invalidate_home_cache)
+                    refresh_related_pets.enqueue(pet_ids=[pet.pk for pet in pets])
+                return
+            except IntegrityError:
+                if attempt == SLUG_ATTEMPTS - 1:
+                    raise
+
+
+class RelatedPetService:
+    """Service for the precomputed related-pets recommendations"""
+    
+    @staticmethod
+    @transaction.atomic
+    def rebuild_all() -> int:
+        """
+        Recompute the related pets of every pet.
+        
+        Returns:
+            Number of recommendation rows stored
+        """
+        by_type = RelatedPetService._load_features(Pet.objects.all())
+        rows = [
+            row for pet, related in rank_all(by_type)
+            for row in RelatedPetService._build_rows(pet, related)
+        ]
+        
+        RelatedPet.objects.all().delete()
+        RelatedPet.objects.bulk_create(rows, batch_size=500)
+        # Detail pages show the recommendations; let cached copies revalidate
+        transaction.on_commit(invalidate_home_cache)
+        return len(rows)
+    
+    @staticmethod
+    @transaction.atomic
+    def refresh(*, pet_ids) -> int:
+        """
+        Update the recommendations after the given pets changed.
+        
+        Each changed pet, and every pet that currently lists it, has its
+        recommendations recomputed. Other pets of the same type only take
+        a changed pet in when it now beats their weakest recommendation.
+        Pets that no longer exist are ignored.
+        
+        Args:
+            pet_ids: Iterable of IDs of created, edited or re-statused pets
+        
+        Returns:
+            Number of pets whose recommendations were rewritten
+        """
+        changed = set(pet_ids)
+        listers = set(
+            RelatedPet.objects.filter(related_id__in=changed).values_list('pet_id', flat=True)
+        )
+        types = set(
+            Pet.objects.filter(pk__in=changed | listers).values_list('type', flat=True)
+        )
+        by_type = RelatedPetService._load_features(Pet.objects.filter(type__in=types))
+        current = {}
+        for entry in RelatedPet.objects.filter(pet__type__in=types).values('pet_id', 'related_id', 'score'):
+            current.setdefault(entry['pet_id'], {})[entry['related_id']] = entry['score']
+        
+        updated = {}
+        for pets in by_type.values():
+            candidates = [pet for pet in pets.values() if pet['status'] == 'available']
+            recompute = (changed | listers) & pets.keys()
+            for pet_id in recompute:
+                updated[pet_id] = top_related(pets[pet_id], candidates)
+            
+            # Merge available changed pets into the other lists they now qualify for
+            arrivals = [pets[pet_id] for pet_id in changed & pets.keys() if pets[pet_id]['status'] == 'available']
+            for pet in pets.values():
+                if pet['id'] in recompute or not arrivals:
+                    continue
+                listed = [
+                    (score_value, pets[related_id])
+                    for related_id, score_value in current.get(pet['id'], {}).items()
+                    if related_id in pets
+                ]
+                weakest = min(map(rank_key, listed)) if len(listed) >= RELATED_PETS_STORED else None
+                merged = [
+                    item for item in ((score(pet, arrival), arrival) for arrival in arrivals)
+                    if item[1]['id'] != pet['id'] and (weakest is None or rank_key(item) > weakest)
+                ]
+                if merged:
+                    updated[pet['id']] = heapq.nlargest(RELATED_PETS_STORED, listed + merged, key=rank_key)
+        
+        RelatedPet.objects.filter(pet_id__in=updated).delete()
+        RelatedPet.objects.bulk_create(
+            [row for pet_id, related in updated.items()
+             for row in RelatedPetService._build_rows({'id': pet_id}, related)],
+            batch_size=500
+        )
+        if updated:
+            transaction.on_commit(invalidate_home_cache)
+        return len(updated)
+    
+    @staticmethod
+    def _load_features(queryset) -> dict:
+        """Feature dicts keyed by type and pet ID."""
+        by_type = {}
+        for row in queryset.order_by().values(*FEATURE_FIELDS):
+            by_type.setdefault(row['type'], {})[row['id']] = get_features(row)
+        return by_type
+    
+    @staticmethod
+    def _build_rows(pet: dict, related: list) -> list:
+        return [
+            RelatedPet(pet_id=pet['id'], related_id=other['id'], rank=rank, score=score_value)
+            for rank, (score_value, other) in enumerate(related, start=1)
+        ]
 
 
 class SuccessStoryService:
@@ -0,0 +1,90 @@
+"""
+Pets app signals.
+"""
+
+from django.db import connections, transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, pre_save
+
+from .caching import invalidate_home_cache, invalidate_home_stats
+from .models import Pet, RelatedPet, SuccessStory
+from .search import install_search_triggers
+from .tasks import build_image_derivatives, refresh_related_pets
+
+# Writes that change what the catalog pages and the pet browser index show
+CATALOG_SENDERS = (
+    'pets.Pet',
+    'pets.SuccessStory',
+    'pets.Trait',
+    'pets.PetTrait',
+)
+
+# Writes that only change the homepage stats
+HOME_STATS_SENDERS = (
+    'adoptions.AdoptionApplication',
+)
+
+
+def invalidate_home_cache_on_write(sender, **kwargs):
+    """Invalidate the homepage cache once the current transaction commits."""
+    transaction.on_commit(invalidate_home_cache)
+
+
+def invalidate_home_stats_on_write(sender, **kwargs):
+    """Invalidate the homepage stats once the current transaction commits."""
+    transaction.on_commit(invalidate_home_stats)
+
+
+for sender in CATALOG_SENDERS:
+    post_save.connect(invalidate_home_cache_on_write, sender=sender)
+    post_delete.connect(invalidate_home_cache_on_write, sender=sender)
+
+for sender in HOME_STATS_SENDERS:
+    post_save.connect(invalidate_home_stats_on_write, sender=sender)
+    post_delete.connect(invalidate_home_stats_on_write, sender=sender)
+
+
+def note_image_changes(sender, instance, using, update_fields=None, **kwargs):
+    """Note whether a save sets a new photo, so other saves queue nothing."""
+    fields = [
+        field for field in sender.IMAGE_FIELDS
+        if getattr(instance, field) and (update_fields is None or field in update_fields)
+    ]
+    files = {field: getattr(instance, field) for field in fields}
+    if not files or instance._state.adding or any(not file._committed for file in files.values()):
+        instance._images_changed = bool(files)
+        return
+
+    stored = sender._base_manager.using(using).filter(pk=instance.pk).values(*files).first() or {}
+    instance._images_changed = any(file.name != stored.get(field) for field, file in files.items())
+
+
+def queue_image_derivatives(sender, instance, **kwargs):
+    """Generate responsive derivatives for new photos in the background."""
+    if getattr(instance, '_images_changed', False):
+        build_image_derivatives.enqueue(model=sender._meta.label, pk=instance.pk)
+
+
+for sender in (Pet, SuccessStory):
+    pre_save.connect(note_image_changes, sender=sender)
+    post_save.connect(queue_image_derivatives, sender=sender)
+
+
+def queue_related_pets_refresh(sender, instance, **kwargs):
+    """Update the related-pets recommendations in the background."""
+    refresh_related_pets.enqueue(pet_ids=[instance.pk])
+
+
+def queue_related_pets_refill(sender, instance, **kwargs):
+    """Refill the recommendations that list a pet about to be deleted."""
+    listers = list(RelatedPet.objects.filter(related=instance).values_list('pet_id', flat=True))
+    if listers:
+        refresh_related_pets.enqueue(pet_ids=listers)
+
+
+post_save.connect(queue_related_pets_refresh, sender=Pet)
+pre_delete.connect(queue_related_pets_refill, sender=Pet)
+
+
+def reinstall_search_triggers(sender, using, **kwargs):
+    """Restore the search index triggers dropped by SQLite table rebuilds."""
+    install_search_triggers(connections[using])
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+Pets app similarity.
+Scores how alike two pets are for the "related pets" recommendations and
+picks the best matches among the available pets of the same type.
+"""
+
+import heapq
+
+from .models import Pet
+
+# Neighbors stored per pet; get_related_pets() can show up to this many
+RELATED_PETS_STORED = 6
+
+# Values read for every pet when scoring
+FEATURE_FIELDS = (
+    'id', 'type', 'breed', 'size', 'age_months', 'personality', 'status', 'arrival_date',
+    'special_needs', 'vaccinated', 'spayed_neutered', 'microchipped',
+)
+
+MEDICAL_FLAGS = ('vaccinated', 'spayed_neutered', 'microchipped')
+
+WEIGHTS = {
+    'breed': 3.0,
+    'size': 1.5,
+    'age': 1.5,
+    'personality': 3.0,
+    'special_needs': 1.0,
+    'medical': 0.25,
+}
+
+SIZE_RANKS = {size: rank for rank, (size, _) in enumerate(Pet.SIZES)}
+
+AGE_GROUP_RANKS = {key: rank for rank, (key, *_) in enumerate(Pet.AGE_GROUPS)}
+
+
+def get_features(row: dict) -> dict:
+    """
+    Normalize a pet's values for scoring.
+
+    Args:
+        row: Dict with the FEATURE_FIELDS
+
+    Returns:
+        Feature dict
+    """
+    return {
+        **row,
+        'breed': row['breed'].strip().lower(),
+        'size': SIZE_RANKS.get(row['size']),
+        'age': AGE_GROUP_RANKS.get(Pet.get_age_group(row['age_months'])),
+        'personality': frozenset(str(trait).strip().lower() for trait in row['personality'] or ()),
+        'recency': (row['arrival_date'].toordinal(), row['id']),
+    }
+
+
+def score(pet: dict, other: dict) -> float:
+    """
+    Score the similarity of two pets of the same type.
+
+    Breed and personality overlap count most, then size and age group
+    (half marks for a neighbouring one), shared special needs and matching
+    medical flags.
+
+    Args:
+        pet: Feature dict from get_features()
+        other: Feature dict from get_features()
+
+    Returns:
+        Similarity score, higher is more alike
+    """
+    total = 0.0
+    if pet['breed'] == other['breed']:
+        total += WEIGHTS['breed']
+    for field in ('size', 'age'):
+        if pet[field] is not None and other[field] is not None:
+            distance = abs(pet[field] - other[field])
+            if distance <= 1:
+                total += WEIGHTS[field] / (distance + 1)
+    if pet['personality'] and other['personality']:
+        shared = len(pet['personality'] & other['personality'])
+        total += WEIGHTS['personality'] * shared / len(pet['personality'] | other['personality'])
+    if pet['special_needs'] and other['special_needs']:
+        total += WEIGHTS['special_needs']
+    total += WEIGHTS['medical'] * sum(pet[flag] == other[flag] for flag in MEDICAL_FLAGS)
+    return round(total, 4)
+
+
+def rank_key(item) -> tuple:
+    """Sort key of a (score, candidate) pair; ties go to the most recent arrival."""
+    return item[0], item[1]['recency']
+
+
+def top_related(pet: dict, candidates, *, limit=RELATED_PETS_STORED) -> list:
+    """
+    Pick the most similar candidates for a pet.
+
+    Ties go to the most recent arrival.
+
+    Args:
+        pet: Feature dict of the pet
+        candidates: Feature dicts of available pets of the same type
+        limit: Number of neighbors to keep
+
+    Returns:
+        List of (score, candidate) tuples, best first
+    """
+    scored = (
+        (score(pet, candidate), candidate)
+        for candidate in candidates
+        if candidate['id'] != pet['id']
+    )
+    return heapq.nlargest(limit, scored, key=rank_key)
+
+
+def rank_all(pets_by_type: dict):
+    """
+    Pick the related pets of every pet.
+
+    Args:
+        pets_by_type: Dict mapping pet type to a dict of feature dicts by pet ID
+
+    Yields:
+        (pet, related) pairs, related as returned by top_related()
+    """
+    for pets in pets_by_type.values():
+        candidates = [pet for pet in pets.values() if pet['status'] == 'available']
+        for pet in pets.values():
+            yield pet, top_related(pet, candidates)
\ No newline at end of file
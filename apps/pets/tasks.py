@@ -0,0 +1,40 @@
+"""
+Pets app tasks.
+Background work run by the task worker.
+"""
+
+from django.apps import apps
+
+from apps.core.images import get_derivatives
+from apps.tasks.registry import task
+
+
+@task('pets.build_image_derivatives')
+def build_image_derivatives(*, model: str, pk: int) -> None:
+    """
+    Generate responsive derivatives for every photo of a pet or story.
+    
+    Args:
+        model: Model label, 'pets.Pet' or 'pets.SuccessStory'
+        pk: Primary key of the instance
+    """
+    model_class = apps.get_model(model)
+    instance = model_class.objects.filter(pk=pk).first()
+    if instance is None:
+        return
+    
+    for field in model_class.IMAGE_FIELDS:
+        get_derivatives(getattr(instance, field))
+
+
+@task('pets.refresh_related_pets')
+def refresh_related_pets(*, pet_ids: list) -> None:
+    """
+    Update the related-pets recommendations after pets changed.
+    
+    Args:
+        pet_ids: IDs of the pets that were saved, re-statused or deleted
+    """
+    from .services import RelatedPetService
+    
+    RelatedPetService.refresh(pet_ids=pet_ids)
\ No newline at end of file
@@ -3,24 +3,28 @@ Pets app views.
 """
 
 from django.shortcuts import render
+from django.utils.decorators import method_decorator
 from django.views.generic import ListView, DetailView
 from django.db.models import Q
 
-from .models import Pet
+from apps.core.http import conditional_page, templates_last_modified
+from apps.core.pagination import CursorPaginator
+from .models import AGE_SORT_KEYS, Pet
+from .caching import get_catalog_last_modified, get_home_featured_html, get_home_stats
+from .index import IndexedCursorPaginator, get_available_pet_index
 from .selectors import (
     get_available_pets,
-    get_featured_pets,
     get_pet_by_id,
+    get_pet_facets,
     get_related_pets,
     get_success_stories,
-    get_pet_stats
 )
 
 
 def home(request):
-    """Homepage view with featured pets and stats"""
-    featured_pets = get_featured_pets(limit=3)
-    stats = get_pet_stats()
+    """Homepage view with featured pets and stats (served from cache)"""
+    featured_pets_html = get_home_featured_html()
+    stats = dict(get_home_stats())
     
     # Use fallback values if counts are zero
     if stats['total_adopted'] == 0:
@@ -31,12 +35,24 @@ def home(request):
         stats['happy_families'] = 156
     
     context = {
-        'featured_pets': featured_pets,
+        'featured_pets_html': featured_pets_html,
         'stats': stats
     }
     return render(request, 'pets/index.html', context)
 
 
+def _catalog_validators(request, *args, **kwargs):
+    """Validators for pages built from the pet catalog and their query string."""
+    query = sorted((key, tuple(values)) for key, values in request.GET.lists())
+    return (request.path, query), get_catalog_last_modified()
+
+
+def _page_validators(request, *args, **kwargs):
+    """Validators for pages that only change with their templates."""
+    return request.path, templates_last_modified()
+
+
+@method_decorator(conditional_page(_catalog_validators, max_age=60), name='dispatch')
 class PetListView(ListView):
     """View for browsing all pets with filters"""
     model = Pet
@@ -44,8 +60,18 @@ class PetListView(ListView):
     context_object_name = 'pets'
     paginate_by = 9
     
-    def get_queryset(self):
-        # Build filters from GET parameters
+    # Keyset orderings; each ends with 'id' so the sort key is unique
+    SORT_ORDERINGS = {
+        'relevance': ('search_rank', '-id'),
+        'newest': ('-arrival_date', '-id'),
+        'oldest': ('arrival_date', 'id'),
+        'name': ('name', 'id'),
+        'youngest': ('age_ascending', 'id'),
+        'eldest': ('-age_descending', '-id'),
+    }
+    
+    def get_filters(self):
+        """Build catalog filters from GET parameters"""
         filters = {}
         
         if search := self.request.GET.get('search'):
@@ -57,28 +83,72 @@ class PetListView(ListView):
         if sizes := self.request.GET.getlist('size'):
             filters['sizes'] = sizes
         
+        if gender := self.request.GET.get('gender'):
+            filters['gender'] = gender
+        
+        if ages := self.request.GET.getlist('age'):
+            filters['ages'] = ages
+        
+        if traits := self.request.GET.getlist('trait'):
+            filters['traits'] = traits
+            filters['trait_match'] = 'any' if self.request.GET.get('traitMatch') == 'any' else 'all'
+        
         if self.request.GET.get('specialNeeds'):
             filters['special_needs'] = True
         
-        queryset = get_available_pets(filters=filters if filters else None)
+        if self.request.GET.get('newArrivals'):
+            filters['new_arrivals'] = True
         
-        # Apply sorting
-        sort_by = self.request.GET.get('sort', 'newest')
-        if sort_by == 'newest':
-            queryset = queryset.order_by('-arrival_date')
-        elif sort_by == 'oldest':
-            queryset = queryset.order_by('arrival_date')
-        elif sort_by == 'name':
-            queryset = queryset.order_by('name')
+        return filters
+    
+    def get_queryset(self):
+        self.filters = self.get_filters()
+        search = self.filters.get('search')
+        queryset = get_available_pets(filters=self.filters or None)
         
-        return queryset
+        # Apply sorting (best match first by default when searching)
+        sort_by = self.request.GET.get('sort') or ('relevance' if search else 'newest')
+        if sort_by == 'relevance' and 'search_rank' not in queryset.query.annotations:
+            sort_by = 'newest'
+        self.ordering = self.SORT_ORDERINGS.get(sort_by, self.SORT_ORDERINGS['newest'])
+        
+        # Age orderings sort on an annotation that puts unknown ages last
+        if sort_keys := {field.lstrip('-') for field in self.ordering} & AGE_SORT_KEYS.keys():
+            queryset = queryset.annotate(**{key: AGE_SORT_KEYS[key] for key in sort_keys})
+        
+        return queryset.order_by(*self.ordering)
+    
+    def paginate_queryset(self, queryset, page_size):
+        index = None if 'search' in self.filters else get_available_pet_index()
+        if index is not None:
+            # Filter, count and pick the page ids in memory; read only the page
+            paginator = IndexedCursorPaginator(
+                index,
+                index.match(index.conditions(self.filters)),
+                queryset,
+                page_size,
+                ordering=self.ordering
+            )
+        else:
+            paginator = CursorPaginator(
+                queryset,
+                page_size,
+                ordering=self.ordering
+            )
+        page = paginator.get_page(self.request.GET.get('cursor'))
+        return paginator, page, page.object_list, page.has_other_pages()
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['total_pets'] = self.get_queryset().count()
+        # One aggregate query gives the sidebar counts and the result total
+        context['facets'] = get_pet_facets(filters=self.filters)
+        context['total_pets'] = context['facets']['total']
+        # Templates cannot call request.GET.getlist() with a key
+        context['selected_ages'] = self.filters.get('ages', [])
         return context
 
 
+@method_decorator(conditional_page(_catalog_validators, max_age=300), name='dispatch')
 class PetDetailView(DetailView):
     """View for individual pet detail page"""
     model = Pet
@@ -91,11 +161,13 @@ class PetDetailView(DetailView):
         return context
 
 
+@conditional_page(_page_validators, max_age=3600)
 def about(request):
     """About page view"""
     return render(request, 'pets/about.html')
 
 
+@conditional_page(_catalog_validators, max_age=300)
 def success_stories(request):
     """Success stories page"""
     stories = get_success_stories()
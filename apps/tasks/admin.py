@@ -0,0 +1,16 @@
+"""
+Tasks app admin.
+"""
+
+from django.contrib import admin
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'attempts', 'max_attempts', 'run_at', 'finished_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'last_error')
+    date_hierarchy = 'run_at'
+    ordering = ('-run_at',)
+    readonly_fields = ('locked_by', 'locked_at', 'finished_at', 'last_error', 'created_at', 'updated_at')
@@ -0,0 +1,78 @@
+"""
+Run the background task worker.
+"""
+
+import os
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.tasks.services import TaskService
+
+
+class Command(BaseCommand):
+    help = 'Run queued background tasks with a thread pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=4, help='Number of worker threads')
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds between polls when idle')
+        parser.add_argument('--lock-timeout', type=int, default=600, help='Seconds before a running task is requeued')
+        parser.add_argument('--retry-delay', type=int, default=30, help='Base retry delay in seconds')
+        parser.add_argument('--keep-days', type=int, default=7, help='Days to keep succeeded tasks')
+        parser.add_argument('--burst', action='store_true', help='Exit once the queue is empty')
+
+    def handle(self, *args, **options):
+        self.stopping = threading.Event()
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        concurrency = options['concurrency']
+        self.stdout.write(f'Worker {worker_id} started with {concurrency} thread(s)')
+
+        inflight = set()
+        last_maintenance = 0.0
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while not self.stopping.is_set():
+                if time.monotonic() - last_maintenance > 60:
+                    TaskService.requeue_stale_tasks(lock_timeout=options['lock_timeout'])
+                    TaskService.purge_finished_tasks(older_than_days=options['keep_days'])
+                    last_maintenance = time.monotonic()
+
+                free = concurrency - len(inflight)
+                claimed = TaskService.claim_tasks(worker_id=worker_id, limit=free) if free else []
+                for task_id in claimed:
+                    inflight.add(pool.submit(self._run, task_id, options['retry_delay']))
+
+                if inflight:
+                    done, inflight = wait(
+                        inflight,
+                        timeout=0 if claimed else options['poll_interval'],
+                        return_when=FIRST_COMPLETED
+                    )
+                elif options['burst']:
+                    break
+                else:
+                    self.stopping.wait(options['poll_interval'])
+
+            wait(inflight)
+
+        self.stdout.write(self.style.SUCCESS(f'Worker {worker_id} stopped'))
+
+    def _run(self, task_id, retry_delay):
+        close_old_connections()
+        try:
+            task = TaskService.run_task(task_id=task_id, retry_delay=retry_delay)
+            self.stdout.write(f'{task} after {task.attempts} attempt(s)')
+        finally:
+            close_old_connections()
+
+    def _stop(self, signum, frame):
+        self.stdout.write('Shutting down after running tasks finish...')
+        self.stopping.set()
\ No newline at end of file
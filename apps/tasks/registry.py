@@ -0,0 +1,88 @@
+"""
+Tasks app registry.
+Maps task names to the functions that implement them.
+"""
+
+from django.conf import settings
+from django.db import transaction
+
+_registry = {}
+
+
+class TaskFunction:
+    """
+    A function that can run in the background worker.
+
+    Args:
+        func: The function to run; it receives the task kwargs
+        name: Unique task name
+        max_attempts: Attempts before the task is marked failed
+    """
+
+    def __init__(self, func, *, name: str, max_attempts: int):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.__doc__ = func.__doc__
+
+    def __call__(self, **kwargs):
+        return self.func(**kwargs)
+
+    def enqueue(self, **kwargs) -> None:
+        """
+        Queue the task once the current transaction commits.
+
+        Nothing is queued if the transaction rolls back. With TASKS_EAGER
+        the task runs in-process after commit instead.
+
+        Args:
+            **kwargs: JSON-serializable task arguments
+        """
+        if getattr(settings, 'TASKS_EAGER', False):
+            transaction.on_commit(lambda: self.func(**kwargs))
+            return
+
+        from .services import TaskService
+        transaction.on_commit(
+            lambda: TaskService.create_task(
+                name=self.name,
+                kwargs=kwargs,
+                max_attempts=self.max_attempts
+            )
+        )
+
+
+def task(name: str, *, max_attempts: int = 3):
+    """
+    Register a function as a background task.
+
+    Usage:
+        @task('pets.build_image_derivatives')
+        def build_image_derivatives(*, model, pk): ...
+
+        build_image_derivatives.enqueue(model='pets.Pet', pk=pet.pk)
+    """
+    def decorator(func):
+        if name in _registry:
+            raise ValueError(f'Task "{name}" is already registered')
+        task_function = TaskFunction(func, name=name, max_attempts=max_attempts)
+        _registry[name] = task_function
+        return task_function
+
+    return decorator
+
+
+def get_task_function(name: str) -> TaskFunction:
+    """
+    Get a registered task by name.
+
+    Args:
+        name: Task name
+
+    Returns:
+        TaskFunction instance
+
+    Raises:
+        KeyError: If no task is registered under the name
+    """
+    return _registry[name]
@@ -0,0 +1,35 @@
+"""
+Tasks app selectors.
+Contains query logic for tasks (read operations only).
+"""
+
+from django.db.models import QuerySet
+from django.utils import timezone
+from .models import Task
+
+
+def get_due_task_ids(*, limit: int) -> list:
+    """
+    Get the ids of queued tasks that are ready to run.
+    
+    Args:
+        limit: Maximum number of ids to return
+    
+    Returns:
+        List of task ids, oldest first
+    """
+    return list(
+        Task.objects.filter(status='queued', run_at__lte=timezone.now())
+        .order_by('run_at')
+        .values_list('pk', flat=True)[:limit]
+    )
+
+
+def get_failed_tasks() -> QuerySet:
+    """
+    Get tasks that exhausted their attempts.
+    
+    Returns:
+        QuerySet of failed tasks
+    """
+    return Task.objects.filter(status='failed').order_by('-updated_at')
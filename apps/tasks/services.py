@@ -0,0 +1,137 @@
+"""
+Tasks app services.
+Contains business logic for queueing and running tasks (write operations).
+"""
+
+import traceback
+from datetime import timedelta
+
+from django.db.models import F
+from django.utils import timezone
+from .models import Task
+from .registry import get_task_function
+from .selectors import get_due_task_ids
+
+
+class TaskService:
+    """Service for Task operations"""
+    
+    @staticmethod
+    def create_task(*, name: str, kwargs: dict = None, max_attempts: int = 3, run_at=None) -> Task:
+        """
+        Queue a new task.
+        
+        Args:
+            name: Registered task name
+            kwargs: JSON-serializable task arguments
+            max_attempts: Attempts before the task is marked failed
+            run_at: Optional earliest run time (defaults to now)
+        
+        Returns:
+            Created Task instance
+        """
+        return Task.objects.create(
+            name=name,
+            kwargs=kwargs or {},
+            max_attempts=max_attempts,
+            run_at=run_at or timezone.now()
+        )
+    
+    @staticmethod
+    def claim_tasks(*, worker_id: str, limit: int) -> list:
+        """
+        Claim due tasks for a worker.
+        
+        Each task is claimed with a conditional UPDATE on its status, so two
+        workers can never claim the same task, on any database backend.
+        
+        Args:
+            worker_id: Identifier of the claiming worker
+            limit: Maximum number of tasks to claim
+        
+        Returns:
+            List of claimed task ids
+        """
+        claimed = []
+        for task_id in get_due_task_ids(limit=limit):
+            updated = Task.objects.filter(pk=task_id, status='queued').update(
+                status='running',
+                locked_by=worker_id,
+                locked_at=timezone.now(),
+                attempts=F('attempts') + 1
+            )
+            if updated:
+                claimed.append(task_id)
+        return claimed
+    
+    @staticmethod
+    def run_task(*, task_id: int, retry_delay: int = 30) -> Task:
+        """
+        Run a claimed task and record the outcome.
+        
+        Failed attempts are retried with exponential backoff until
+        max_attempts is reached.
+        
+        Args:
+            task_id: Id of a task claimed by this worker
+            retry_delay: Base retry delay in seconds
+        
+        Returns:
+            Updated Task instance
+        """
+        task = Task.objects.get(pk=task_id)
+        
+        try:
+            get_task_function(task.name)(**task.kwargs)
+        except Exception:
+            task.last_error = traceback.format_exc()
+            if task.attempts >= task.max_attempts:
+                task.status = 'failed'
+                task.finished_at = timezone.now()
+            else:
+                task.status = 'queued'
+                task.run_at = timezone.now() + timedelta(
+                    seconds=retry_delay * 2 ** (task.attempts - 1)
+                )
+        else:
+            task.status = 'succeeded'
+            task.finished_at = timezone.now()
+            task.last_error = ''
+        
+        task.locked_by = ''
+        task.locked_at = None
+        task.save()
+        return task
+    
+    @staticmethod
+    def requeue_stale_tasks(*, lock_timeout: int) -> int:
+        """
+        Requeue running tasks whose worker stopped responding.
+        
+        Args:
+            lock_timeout: Seconds after which a running task is considered abandoned
+        
+        Returns:
+            Number of requeued tasks
+        """
+        cutoff = timezone.now() - timedelta(seconds=lock_timeout)
+        return Task.objects.filter(status='running', locked_at__lt=cutoff).update(
+            status='queued',
+            locked_by='',
+            locked_at=None
+        )
+    
+    @staticmethod
+    def purge_finished_tasks(*, older_than_days: int) -> int:
+        """
+        Delete succeeded tasks older than the given age.
+        
+        Args:
+            older_than_days: Age in days
+        
+        Returns:
+            Number of deleted tasks
+        """
+        cutoff = timezone.now() - timedelta(days=older_than_days)
+        deleted, _ = Task.objects.filter(status='succeeded', finished_at__lt=cutoff).delete()
+        return deleted
@@ -6,6 +6,8 @@ Generated by 'django-admin startproject' using Django 5.2.6.
 
 from pathlib import Path
 
+from decouple import Csv, config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -29,10 +31,14 @@ INSTALLED_APPS = [
     'apps.adoptions',
     'apps.contact',
     'apps.dashboard',
+    'apps.tasks',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'apps.core.middleware.QueryBudgetMiddleware',
+    'apps.core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -65,12 +71,75 @@ TEMPLATES = [
 WSGI_APPLICATION = 'config.wsgi.application'
 
 # Database
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Read from the environment (or a .env file). SQLite is the default; set
+# DB_ENGINE=postgresql (and install psycopg) for production deployments.
+DB_ENGINE = config('DB_ENGINE', default='sqlite')
+
+# Seconds a connection is kept open between requests (0 closes it after
+# every request); health checks replace connections the server dropped.
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=60, cast=int)
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': config('DB_NAME', default='pawhaven'),
+            'USER': config('DB_USER', default='pawhaven'),
+            'PASSWORD': config('DB_PASSWORD', default=''),
+            'HOST': config('DB_HOST', default='localhost'),
+            'PORT': config('DB_PORT', default='5432'),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'connect_timeout': config('DB_CONNECT_TIMEOUT', default=5, cast=int),
+            },
+        }
     }
-}
+else:
+    # Pragmas run on every new connection: WAL lets readers work while a
+    # write is in progress, busy_timeout makes writers wait for the lock
+    # instead of failing, and IMMEDIATE transactions take the write lock up
+    # front so concurrent read-then-write transactions queue rather than
+    # deadlock with "database is locked".
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': config('SQLITE_BUSY_TIMEOUT_MS', default=20000, cast=int),
+        'mmap_size': config('SQLITE_MMAP_SIZE', default=128 * 1024 * 1024, cast=int),
+    }
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': config('DB_NAME', default=str(BASE_DIR / 'db.sqlite3')),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'transaction_mode': 'IMMEDIATE',
+                'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()),
+            },
+        }
+    }
+
+# Read replicas
+# Comma-separated replica locations: SQLite file paths, or host[:port] of
+# PostgreSQL standbys. Read-only requests are served from a replica; a
+# browser that writes reads from the primary for REPLICA_PIN_SECONDS so it
+# sees its own changes. To try it locally with SQLite, set e.g.
+# DB_REPLICAS=replica1.sqlite3 and run `manage.py sync_sqlite_replicas`.
+REPLICA_DATABASES = []
+for index, location in enumerate(config('DB_REPLICAS', default='', cast=Csv()), start=1):
+    alias = f'replica{index}'
+    if DB_ENGINE == 'postgresql':
+        host, _, port = location.partition(':')
+        DATABASES[alias] = {**DATABASES['default'], 'HOST': host, 'PORT': port or DATABASES['default']['PORT']}
+    else:
+        DATABASES[alias] = {**DATABASES['default'], 'NAME': location}
+    DATABASES[alias]['TEST'] = {'MIRROR': 'default'}
+    REPLICA_DATABASES.append(alias)
+
+DATABASE_ROUTERS = ['apps.core.routers.ReplicaRouter']
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=10, cast=int)
+REPLICA_PIN_COOKIE = 'db_primary'
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -98,8 +167,84 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static',  # Global static files
 ]
 
+# Served by whitenoise. collectstatic minifies CSS/JS, adds a content hash to
+# every file name and writes gzip (and brotli, with the Brotli package)
+# variants; hashed files are sent with a one-year immutable Cache-Control,
+# so browsers never revalidate them.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'apps.core.storage.MinifiedManifestStaticFilesStorage',
+    },
+}
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
+
 # Media files
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Responsive image derivatives (size name -> max width in pixels),
+# generated under MEDIA_ROOT / IMAGE_DERIVATIVE_DIR
+IMAGE_DERIVATIVE_SIZES = {
+    'thumb': 160,
+    'card': 480,
+    'detail': 1200,
+}
+IMAGE_DERIVATIVE_DIR = 'derivatives'
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Cache
+# Local-memory cache needs no external service but is per-process; with
+# several gunicorn workers use a shared backend so signal-driven
+# invalidation reaches every worker.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pawhaven',
+    },
+}
+
+# Homepage featured-pets block and stats
+HOME_CACHE_ALIAS = 'default'
+HOME_CACHE_TIMEOUT = 60 * 15
+# Seconds a process may serve the catalog Last-Modified stamp from its cache
+# before reading it from the database again (writes in the same process are
+# seen at once)
+CATALOG_CHANGED_MAX_AGE = 5
+
+# Stats
+# Serve homepage/dashboard counts from the materialized StatusCounter table
+# (maintained by the service layer; run `manage.py rebuild_stats_counters`
+# after bulk edits made outside the services, e.g. through the Django admin).
+STATS_COUNTERS_ENABLED = False
+
+# Pet browser index
+# Each process keeps bitsets and sort orders of the available pets in memory
+# and answers unsearched catalog pages and filter counts from them, reading
+# only the rows on the page. The index is rebuilt when a pet write bumps the
+# catalog version in the cache, or after PET_INDEX_MAX_AGE seconds, which
+# bounds staleness while the cache is per-process.
+PET_INDEX_ENABLED = True
+PET_INDEX_MAX_AGE = 60
+
+
+# Query instrumentation (opt-in)
+# Adds Server-Timing headers, a rolling per-view report at
+# /dashboard/performance/ and warnings when a view exceeds its budget.
+QUERY_INSTRUMENTATION_ENABLED = False
+QUERY_REPORT_SIZE = 500
+QUERY_BUDGETS = {
+    'default': {'queries': 20, 'db_ms': 200},
+    'pets:home': {'queries': 5},
+    'pets:list': {'queries': 8},
+    'pets:detail': {'queries': 6},
+}
+
+
+# Background tasks
+# Queued tasks are run by `manage.py run_worker`; set TASKS_EAGER to run
+# them in-process after commit instead (no worker needed).
+TASKS_EAGER = False